@@ -1,4 +1,4 @@
-from .entity import Report, GroupStats, ErrorAnalysis
+from .entity import Report, GroupStats, ErrorAnalysis, Comparison, PairAgreement
 from .reporting import Reporting
 from .analysis import Analysis
 
@@ -6,6 +6,8 @@ __all__ = [
     "Report",
     "GroupStats",
     "ErrorAnalysis",
+    "Comparison",
+    "PairAgreement",
     "Reporting",
     "Analysis",
 ]
@@ -34,3 +34,22 @@ class Report(BaseModel):
     by_field: Dict[str, Dict[str, GroupStats]] = {}
     errors: ErrorAnalysis = ErrorAnalysis()
     metadata: Dict[str, Any] = {}
+
+
+class PairAgreement(BaseModel):
+    run_a: str
+    run_b: str
+    both: int = 0
+    only_a: int = 0
+    only_b: int = 0
+    neither: int = 0
+    agreement: float = 0.0
+    only_a_ids: List[str] = []
+    only_b_ids: List[str] = []
+
+
+class Comparison(BaseModel):
+    runs: List[str]
+    total: int = 0
+    solved: Dict[str, int] = {}
+    pairs: List[PairAgreement] = []
@@ -3,7 +3,7 @@ from .context import ApplicationContext, get_context
 from .models import ModelService, ModelConfig
 from .llm import LLMService, LLMMessage
 from .templates import TemplateService
-from .timeout import with_timeout, TimeoutError
+from .timeout import with_timeout, remaining, watchdog, TimeoutError
 
 __all__ = [
     "ConfigService",
@@ -15,5 +15,7 @@ __all__ = [
     "LLMMessage",
     "TemplateService",
     "with_timeout",
+    "remaining",
+    "watchdog",
     "TimeoutError",
 ]
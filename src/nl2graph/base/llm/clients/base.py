@@ -1,14 +1,40 @@
 import time
+import random
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, List, Tuple, Type, TypeVar
 
+from ...timeout import remaining
 from ..entity import LLMMessage, LLMResponse
 
+T = TypeVar("T")
+
 
 class BaseClient(ABC):
+    # clients turn off their SDK's own retries, which would give each attempt
+    # a fresh timeout past the generation deadline, and retry these instead
+    retry_on: Tuple[Type[Exception], ...] = ()
+    max_retries: int = 2
+    # an attempt needs at least this many seconds before the deadline
+    retry_floor: float = 1.0
+
     @abstractmethod
     def chat(self, messages: List[LLMMessage]) -> LLMResponse:
         pass
 
     def embed(self, text: str) -> List[float]:
         pass
+
+    def _request(self, call: Callable[[float], T], timeout: float) -> T:
+        attempt = 0
+        while True:
+            try:
+                return call(remaining(timeout))
+            except self.retry_on:
+                if attempt >= self.max_retries:
+                    raise
+                delay = min(0.5 * 2 ** attempt, 8.0) * random.uniform(0.75, 1.0)
+                left = remaining()
+                if left is not None and left - delay < self.retry_floor:
+                    raise
+                time.sleep(delay)
+                attempt += 1
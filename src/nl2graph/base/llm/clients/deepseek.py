@@ -4,25 +4,31 @@ from typing import List
 from openai import OpenAI
 
 from .base import BaseClient
+from .openai import RETRY_ON
 from ..entity import ClientConfig, LLMMessage, LLMResponse
 from ..adapters import DeepSeekAdapter
 
 
 class DeepSeekClient(BaseClient):
+    retry_on = RETRY_ON
+
     def __init__(self, config: ClientConfig):
         super().__init__()
         self.config = config
         self.adapter = DeepSeekAdapter
-        self.client = OpenAI(api_key=config.api_key, base_url=config.endpoint)
+        self.client = OpenAI(
+            api_key=config.api_key, base_url=config.endpoint, timeout=config.timeout, max_retries=0
+        )
 
     def chat(self, messages: List[LLMMessage]) -> LLMResponse:
         chat_messages = self.adapter.to_chat_messages(messages)
 
         start = time.perf_counter()
-        resp = self.client.chat.completions.create(
+        resp = self._request(lambda timeout: self.client.chat.completions.create(
             model=self.config.model,
             messages=chat_messages,
-        )
+            timeout=timeout,
+        ), self.config.timeout)
         duration = time.perf_counter() - start
 
         return LLMResponse(
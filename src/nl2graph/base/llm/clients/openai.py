@@ -1,27 +1,34 @@
 import time
 from typing import List
 
-from openai import OpenAI
+from openai import OpenAI, APIConnectionError, RateLimitError, InternalServerError
 
 from .base import BaseClient
 from ..entity import ClientConfig, LLMMessage, LLMResponse
 from ..adapters import OpenAIAdapter
 
 
+# transient failures of OpenAI-compatible APIs, as the SDK would retry them
+RETRY_ON = (APIConnectionError, RateLimitError, InternalServerError)
+
+
 class OpenAIClient(BaseClient):
+    retry_on = RETRY_ON
+
     def __init__(self, config: ClientConfig):
         self.config = config
         self.adapter = OpenAIAdapter
-        self.client = OpenAI(api_key=config.api_key)
+        self.client = OpenAI(api_key=config.api_key, timeout=config.timeout, max_retries=0)
 
     def chat(self, messages: List[LLMMessage]) -> LLMResponse:
         chat_messages = self.adapter.to_chat_messages(messages)
 
         start = time.perf_counter()
-        resp = self.client.responses.create(
+        resp = self._request(lambda timeout: self.client.responses.create(
             model=self.config.model,
             input=chat_messages,
-        )
+            timeout=timeout,
+        ), self.config.timeout)
         duration = time.perf_counter() - start
 
         return LLMResponse(
@@ -1,30 +1,152 @@
+import time
+import heapq
+import itertools
+import threading
+import contextvars
 from functools import wraps
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Union
 
 
 class TimeoutError(Exception):
     pass
 
 
-def with_timeout(config_path: str):
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class Watch:
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+        self.expired = threading.Event()
+        self.active = True
+
+    def disarm(self) -> None:
+        self.active = False
+
+
+class Watchdog:
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, timeout: float) -> Watch:
+        entry = Watch(time.monotonic() + timeout)
+        with self._cond:
+            if len(self._heap) > 4096:
+                self._heap = [item for item in self._heap if item[2].active]
+                heapq.heapify(self._heap)
+            heapq.heappush(self._heap, (entry.deadline, next(self._counter), entry))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="timeout-watchdog", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return entry
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while self._heap and not self._heap[0][2].active:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline, _, entry = self._heap[0]
+                wait = deadline - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                heapq.heappop(self._heap)
+
+            if entry.active:
+                entry.expired.set()
+
+
+watchdog = Watchdog()
+
+
+def remaining(default: Optional[float] = None) -> Optional[float]:
+    deadline = _deadline.get()
+    if deadline is None:
+        return default
+    return max(deadline - time.monotonic(), 0.001)
+
+
+@contextmanager
+def deadline(timeout: Optional[float]):
+    # bounds work that runs as a whole, such as a batch of queries, so
+    # remaining() inside it counts down from timeout
+    if timeout is None:
+        yield
+        return
+    token = _deadline.set(time.monotonic() + timeout)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def get_timeout(config_path: str):
+    try:
+        from .context import get_context
+        from .configs import ConfigService
+        config = get_context().resolve(ConfigService)
+        return config.get(config_path)
+    except:
+        return None
+
+
+def _run_guarded(call: Callable[[], Any], timeout: float) -> Any:
+    # the call runs on a daemon thread that is abandoned at the deadline, so a
+    # stuck call neither blocks the caller nor interpreter exit
+    context = contextvars.copy_context()
+    outcome = {}
+
+    def target():
+        try:
+            outcome["value"] = context.run(call)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, name="timeout-guard", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        raise TimeoutError(f"timeout after {timeout}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+
+def with_timeout(config_path: str, cooperative: Union[bool, Callable[[Any], bool]] = True):
+    # cooperative methods pass remaining() on to a layer that stops the work
+    # itself; the rest run on a guard thread the caller stops waiting for
     def decorator(method):
         @wraps(method)
         def wrapper(self, *args, **kwargs):
-            timeout = None
-            try:
-                from .context import get_context
-                from .configs import ConfigService
-                config = get_context().resolve(ConfigService)
-                timeout = config.get(config_path)
-            except:
-                pass
+            timeout = get_timeout(config_path)
             if timeout is None:
                 return method(self, *args, **kwargs)
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                future = executor.submit(method, self, *args, **kwargs)
-                try:
-                    return future.result(timeout=timeout)
-                except FuturesTimeoutError:
-                    raise TimeoutError(f"timeout after {timeout}s")
+
+            entry = watchdog.watch(timeout)
+            token = _deadline.set(entry.deadline)
+            try:
+                if cooperative(self) if callable(cooperative) else cooperative:
+                    return method(self, *args, **kwargs)
+                return _run_guarded(lambda: method(self, *args, **kwargs), timeout)
+            except TimeoutError:
+                raise
+            except Exception as e:
+                if entry.expired.is_set():
+                    raise TimeoutError(f"timeout after {timeout}s") from e
+                raise
+            finally:
+                entry.disarm()
+                _deadline.reset(token)
         return wrapper
     return decorator
@@ -7,7 +7,9 @@ from .execute import execute
 from .evaluate import evaluate
 from .train import train
 from .report import report
+from .compare import compare
 from .clear import clear
+from .recompress import recompress
 from .server import server_app
 
 app = typer.Typer(
@@ -24,5 +26,7 @@ app.command()(execute)
 app.command()(evaluate)
 app.command()(train)
 app.command()(report)
+app.command()(compare)
 app.command()(clear)
+app.command()(recompress)
 app.add_typer(server_app, name="server")
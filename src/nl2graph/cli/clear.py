@@ -13,6 +13,7 @@ def clear(
     model: str = typer.Option(..., "--model", help="Model name"),
     lang: str = typer.Option(..., "--lang", "-l", help="Query language"),
     stage: Literal["gen", "exec", "eval"] = typer.Option("gen", "--stage", "-s", help="Stage to clear (cascades)"),
+    queries: bool = typer.Option(False, "--queries", help="Also drop deduplicated query executions for this lang"),
 ):
     """Clear results from dst.db for a specific run."""
     ctx = get_context()
@@ -37,5 +38,8 @@ def clear(
 
     with ResultRepository(dst_path) as dst:
         count = dst.clear_stage(method, lang, model, stage)
+        if queries:
+            dropped = dst.clear_query_executions(dataset, lang)
+            typer.echo(f"Dropped {dropped} query executions for {lang}.")
 
     typer.echo(f"Done. Cleared {count} records.")
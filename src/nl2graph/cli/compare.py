@@ -0,0 +1,113 @@
+from typing import Optional, List
+from pathlib import Path
+
+import typer
+
+from ..base import get_context, ConfigService
+from ..data.repository import ResultRepository
+from ..analysis import Comparison, PairAgreement
+
+
+def compare(
+    dataset: str = typer.Argument(..., help="Dataset name"),
+    run: List[str] = typer.Option(..., "--run", "-r", help="Run as method/lang/model, repeatable"),
+    diff: bool = typer.Option(False, "--diff", "-d", help="List question ids solved by only one run"),
+    format: str = typer.Option("json", "--format", "-f", help="Output format: json or markdown"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path"),
+):
+    """Compare runs question by question."""
+    ctx = get_context()
+    config = ctx.resolve(ConfigService)
+
+    dst_path = config.get(f"data.{dataset}.dst")
+    if not dst_path or not Path(dst_path).exists():
+        typer.echo(f"Error: dst.db not found: {dst_path}", err=True)
+        raise typer.Exit(1)
+
+    runs = []
+    for spec in run:
+        parts = spec.split("/")
+        if len(parts) != 3 or not all(parts):
+            typer.echo(f"Error: invalid run '{spec}', expected method/lang/model", err=True)
+            raise typer.Exit(1)
+        runs.append(tuple(parts))
+
+    if len(runs) < 2:
+        typer.echo("Error: at least two runs are required", err=True)
+        raise typer.Exit(1)
+
+    with ResultRepository(dst_path) as dst:
+        stats = dst.compare_runs(runs)
+        if stats["total"] == 0:
+            typer.echo(f"No results found for {', '.join(run)}", err=True)
+            raise typer.Exit(1)
+
+        pairs = []
+        for (i, j), counts in stats["pairs"].items():
+            pair = PairAgreement(
+                run_a=run[i],
+                run_b=run[j],
+                agreement=(counts["both"] + counts["neither"]) / stats["total"],
+                **counts,
+            )
+            if diff:
+                pair.only_a_ids = dst.solved_only_by(runs[i], runs[j])
+                pair.only_b_ids = dst.solved_only_by(runs[j], runs[i])
+            pairs.append(pair)
+
+    comparison = Comparison(
+        runs=run,
+        total=stats["total"],
+        solved=dict(zip(run, stats["solved"])),
+        pairs=pairs,
+    )
+
+    if format == "json":
+        output_content = comparison.model_dump_json(indent=2)
+    else:
+        output_content = _format_markdown(comparison)
+
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(output_content)
+        typer.echo(f"Comparison saved to {output}")
+    else:
+        typer.echo(output_content)
+
+
+def _format_markdown(comparison: Comparison) -> str:
+    lines = [
+        "# Comparison",
+        "",
+        f"**Questions:** {comparison.total}",
+        "",
+        "## Solved",
+        "",
+        "| Run | Solved | Accuracy |",
+        "|-----|--------|----------|",
+    ]
+    for name, solved in comparison.solved.items():
+        lines.append(f"| {name} | {solved} | {solved / comparison.total:.4f} |")
+    lines.append("")
+
+    lines.append("## Agreement")
+    lines.append("")
+    lines.append("| A | B | Both | Only A | Only B | Neither | Agreement |")
+    lines.append("|---|---|------|--------|--------|---------|-----------|")
+    for pair in comparison.pairs:
+        lines.append(
+            f"| {pair.run_a} | {pair.run_b} | {pair.both} | {pair.only_a} | "
+            f"{pair.only_b} | {pair.neither} | {pair.agreement:.4f} |"
+        )
+    lines.append("")
+
+    for pair in comparison.pairs:
+        for name, ids in ((pair.run_a, pair.only_a_ids), (pair.run_b, pair.only_b_ids)):
+            if ids:
+                other = pair.run_b if name == pair.run_a else pair.run_a
+                lines.append(f"**Solved by {name}, not {other}:**")
+                for question_id in ids:
+                    lines.append(f"- {question_id}")
+                lines.append("")
+
+    return "\n".join(lines)
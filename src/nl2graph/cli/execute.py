@@ -4,7 +4,7 @@ from pathlib import Path
 import typer
 
 from ..base import get_context, ConfigService
-from ..execution import GraphService, Execution
+from ..execution import GraphService, Execution, QueryCache
 from ..data.repository import SourceRepository, ResultRepository
 from ..pipeline.execute import ExecutePipeline, IfExists
 from ._helpers import load_records
@@ -18,7 +18,12 @@ def execute(
     hop: Optional[int] = typer.Option(None, "--hop", help="Filter by hop"),
     split: Optional[str] = typer.Option(None, "--split", help="Filter by split"),
     workers: int = typer.Option(1, "--workers", "-w", help="Number of parallel workers"),
+    chunk_size: int = typer.Option(16, "--chunk-size", help="Queries per worker batch (one transaction where supported)"),
+    async_mode: bool = typer.Option(False, "--async", help="Run queries on an asyncio event loop instead of threads"),
+    concurrency: int = typer.Option(256, "--concurrency", help="Queries in flight in --async mode"),
     if_exists: IfExists = typer.Option("skip", "--if-exists", help="Action when record exists: skip or override"),
+    dedup: bool = typer.Option(True, "--dedup/--no-dedup", help="Reuse results of identical queries across runs"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Use the on-disk query-result cache"),
 ):
     """Execute generated queries against database."""
     ctx = get_context()
@@ -37,13 +42,20 @@ def execute(
 
     try:
         graph_service = ctx.resolve(GraphService)
-        connector = graph_service.get_connector(dataset, lang)
-        execution = Execution(connector)
+        connector = graph_service.get_connector(dataset, lang, workers=concurrency if async_mode else workers)
     except Exception as e:
         typer.echo(f"Error: Failed to connect to database: {e}", err=True)
         raise typer.Exit(1)
 
-    with SourceRepository(src_path) as src, ResultRepository(dst_path) as dst:
+    load_time = getattr(connector, "load_time", None)
+    if load_time is not None:
+        typer.echo(f"Loaded graph from {connector.load_source} in {load_time:.2f}s")
+
+    cache_config = config.get("execution.cache") if cache else None
+    query_cache = QueryCache(**cache_config, pool_size=workers + 1) if cache_config else None
+
+    with SourceRepository(src_path) as src, ResultRepository(dst_path, pool_size=workers + 1) as dst:
+        execution = Execution(connector, store=dst if dedup else None, dataset=dataset, cache=query_cache)
         records = load_records(src, hop, split)
         typer.echo(f"Executing for {len(records)} records...")
 
@@ -55,8 +67,18 @@ def execute(
             model=model,
             workers=workers,
             if_exists=if_exists,
+            chunk_size=chunk_size,
+            concurrency=concurrency if async_mode else 0,
         )
 
         pipeline.run(records)
 
+    if query_cache:
+        stats = query_cache.stats()
+        query_cache.close()
+        typer.echo(
+            f"Cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['evictions']} evicted, {stats['entries']} entries"
+        )
+
     typer.echo("Done.")
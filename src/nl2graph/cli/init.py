@@ -1,4 +1,5 @@
-from typing import Optional
+import time
+from typing import Optional, List
 from pathlib import Path
 
 import typer
@@ -9,7 +10,8 @@ from ..data.repository import SourceRepository, ResultRepository
 
 def init(
     dataset: str = typer.Argument(..., help="Dataset name (metaqa, kqapro, openreview)"),
-    json_path: Optional[Path] = typer.Option(None, "--json", "-j", help="Override data.json path"),
+    json_path: Optional[Path] = typer.Option(None, "--json", "-j", help="Override data path (.json, .jsonl, optionally gzipped)"),
+    codec: Optional[str] = typer.Option(None, "--codec", "-c", help="dst.db payload codec: json, zlib, msgpack, zstd"),
 ):
     """Initialize src.db and dst.db for a dataset."""
     ctx = get_context()
@@ -45,24 +47,42 @@ def init(
         dst_path.unlink()
         typer.echo(f"Removed existing {dst_path}")
 
+    group_by = config.get(f"data.{dataset}.eval.group_by") or []
+
     typer.echo(f"Initializing src.db from {data_path}...")
+    start = time.perf_counter()
     with SourceRepository(str(src_path)) as src:
-        count = src.init_from_json(str(data_path))
-    typer.echo(f"  -> Loaded {count} records into {src_path}")
+        try:
+            count = src.init_from_json(str(data_path), index_fields=group_by)
+        except (ValueError, KeyError) as e:
+            typer.echo(f"Error: Failed to load {data_path}: {e}", err=True)
+            raise typer.Exit(1)
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else 0.0
+    typer.echo(f"  -> Loaded {count} records into {src_path} ({rate:.0f} records/s)")
 
     typer.echo(f"Initializing dst.db...")
-    with ResultRepository(str(dst_path)) as dst:
-        pass
-    typer.echo(f"  -> Created {dst_path}")
+    try:
+        with ResultRepository(str(dst_path), codec=codec) as dst:
+            pass
+    except (ValueError, ImportError) as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+    typer.echo(f"  -> Created {dst_path} (codec: {dst.codec.name})")
 
     typer.echo("Done.")
 
 
 def export(
     dataset: str = typer.Argument(..., help="Dataset name"),
-    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output JSON path"),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output JSONL path (.gz compresses)"),
+    method: Optional[str] = typer.Option(None, "--method", "-m", help="Filter by generation method"),
+    model: Optional[str] = typer.Option(None, "--model", help="Filter by model name"),
+    lang: Optional[str] = typer.Option(None, "--lang", "-l", help="Filter by query language"),
+    stage: Optional[List[str]] = typer.Option(None, "--stage", "-s", help="Stages to export: gen, exec, eval (repeatable)"),
+    compress: bool = typer.Option(False, "--gzip", "-z", help="Gzip-compress the output"),
 ):
-    """Export dst.db results to JSON."""
+    """Export dst.db results to JSONL."""
     ctx = get_context()
     config = ctx.resolve(ConfigService)
 
@@ -75,12 +95,23 @@ def export(
         typer.echo(f"Error: dst.db not found: {dst_path}", err=True)
         raise typer.Exit(1)
 
-    output_path = output or Path(f"data/{dataset}/results.json")
+    output_path = output or Path(f"data/{dataset}/results.jsonl{'.gz' if compress else ''}")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     typer.echo(f"Exporting {dst_path} to {output_path}...")
 
     with ResultRepository(dst_path) as dst:
-        records = dst.export_json(str(output_path))
-
-    typer.echo(f"Done. Exported {len(records)} results.")
+        try:
+            count = dst.export_jsonl(
+                str(output_path),
+                method=method,
+                lang=lang,
+                model=model,
+                stages=stage or None,
+                compress=compress or None,
+            )
+        except ValueError as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1)
+
+    typer.echo(f"Done. Exported {count} results.")
@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import typer
+
+from ..base import get_context, ConfigService
+from ..data.repository import ResultRepository
+
+
+def recompress(
+    dataset: str = typer.Argument(..., help="Dataset name"),
+    codec: str = typer.Option("zlib", "--codec", "-c", help="Payload codec: json, zlib, msgpack, zstd"),
+    vacuum: bool = typer.Option(True, "--vacuum/--no-vacuum", help="VACUUM dst.db afterwards to reclaim space"),
+):
+    """Re-encode dst.db stage payloads with another codec."""
+    ctx = get_context()
+    config = ctx.resolve(ConfigService)
+
+    dst_path = config.get(f"data.{dataset}.dst")
+    if not dst_path:
+        typer.echo(f"Error: No dst.db path configured for dataset '{dataset}'", err=True)
+        raise typer.Exit(1)
+
+    if not Path(dst_path).exists():
+        typer.echo(f"Error: dst.db not found: {dst_path}", err=True)
+        raise typer.Exit(1)
+
+    size_before = Path(dst_path).stat().st_size
+    typer.echo(f"Recompressing {dst_path} with {codec}...")
+
+    with ResultRepository(dst_path) as dst:
+        try:
+            count = dst.recompress(codec, vacuum=vacuum)
+        except (ValueError, ImportError) as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1)
+
+    size_after = Path(dst_path).stat().st_size
+    typer.echo(f"Done. Re-encoded {count} results ({size_before} -> {size_after} bytes).")
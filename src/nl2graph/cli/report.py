@@ -36,7 +36,7 @@ def report(
 
     with SourceRepository(src_path) as src, ResultRepository(dst_path) as dst:
         pairs = []
-        for result in dst.iter_by_config(method, lang, model):
+        for result in dst.iter_by_config(method, lang, model, validate=False):
             record = src.get(result.question_id)
             if record:
                 pairs.append((record, result))
@@ -25,12 +25,18 @@ def start(
         typer.echo(f"Error: No connection config for {dataset}/{lang}", err=True)
         raise typer.Exit(1)
 
+    if lang == "sparql" and connection.get("engine") == "oxigraph":
+        _build_embedded(lang, connection)
+        return
+
     if lang == "sparql":
         typer.echo("SPARQL uses local RDFLib, no server needed.")
         return
 
     if lang == "gremlin":
         _start_gremlin(config, dataset, connection, timeout)
+    elif lang == "cypher" and connection.get("engine") == "embedded":
+        _build_embedded(lang, connection)
     elif lang == "cypher":
         typer.echo("Neo4j server management not implemented. Start manually.")
         typer.echo(f"  Host: {connection.get('host')}:{connection.get('port')}")
@@ -59,6 +65,8 @@ def stop(
 
     if lang == "gremlin":
         _stop_gremlin(config, dataset, connection)
+    elif lang == "cypher" and connection.get("engine") == "embedded":
+        typer.echo("Cypher uses embedded Kuzu, no server to stop.")
     elif lang == "cypher":
         typer.echo("Neo4j server management not implemented. Stop manually.")
     else:
@@ -80,6 +88,14 @@ def status(
         typer.echo(f"Error: No connection config for {dataset}/{lang}", err=True)
         raise typer.Exit(1)
 
+    if lang == "sparql" and connection.get("engine") == "oxigraph":
+        store_path = connection.get("store_path")
+        if store_path and Path(store_path).exists():
+            typer.echo(f"SPARQL: Oxigraph store exists at {store_path}")
+        else:
+            typer.echo(f"SPARQL: Oxigraph store not built at {store_path}")
+        return
+
     if lang == "sparql":
         data_path = connection.get("data_path")
         if data_path and Path(data_path).exists():
@@ -88,6 +104,14 @@ def status(
             typer.echo(f"SPARQL: TTL file not found at {data_path}")
         return
 
+    if lang == "cypher" and connection.get("engine") == "embedded":
+        db_path = connection.get("db_path")
+        if db_path and Path(db_path).exists():
+            typer.echo(f"Cypher: Kuzu database exists at {db_path}")
+        else:
+            typer.echo(f"Cypher: Kuzu database not built at {db_path}")
+        return
+
     host = connection.get("host", "localhost")
     port = connection.get("port")
 
@@ -137,6 +161,33 @@ def _start_gremlin(config: ConfigService, dataset: str, connection: dict, timeou
     raise typer.Exit(1)
 
 
+def _build_embedded(lang: str, connection: dict):
+    if lang == "cypher":
+        from ..execution.connectors.kuzu import KuzuConnector
+
+        connector, name, source, target = KuzuConnector(**connection), "Kuzu database", "import_path", "db_path"
+    else:
+        from ..execution.connectors.oxigraph import OxigraphConnector
+
+        connector, name, source, target = OxigraphConnector(**connection), "Oxigraph store", "data_path", "store_path"
+
+    if not connection.get(source) or not connection.get(target):
+        typer.echo(f"Error: embedded {lang} needs {source} and {target}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(f"Building {name} from {connection[source]}...")
+    try:
+        built = connector.build()
+    except Exception as e:
+        typer.echo(f"Error: Failed to build {name}: {e}", err=True)
+        raise typer.Exit(1)
+
+    if built:
+        typer.echo(f"{name} written to {connection[target]}")
+    else:
+        typer.echo(f"{name} at {connection[target]} is up to date.")
+
+
 def _stop_gremlin(config: ConfigService, dataset: str, connection: dict):
     docker_compose = connection.get("docker_compose")
     if not docker_compose:
@@ -7,6 +7,7 @@ from .entity import (
     Result,
 )
 from .repository import SourceRepository, ResultRepository
+from .buffer import ResultBuffer
 
 __all__ = [
     "GenerationOutput",
@@ -17,4 +18,5 @@ __all__ = [
     "Result",
     "SourceRepository",
     "ResultRepository",
+    "ResultBuffer",
 ]
@@ -0,0 +1,57 @@
+import time
+from typing import List, Tuple, Literal, Union
+
+from .entity import GenerationResult, ExecutionResult, EvaluationResult
+from .repository import ResultRepository
+
+
+Stage = Literal["gen", "exec", "eval"]
+StagePayload = Union[GenerationResult, ExecutionResult, EvaluationResult]
+
+
+class ResultBuffer:
+
+    WRITERS = {
+        "gen": "save_generation_many",
+        "exec": "save_execution_many",
+        "eval": "save_evaluation_many",
+    }
+
+    def __init__(
+        self,
+        dst: ResultRepository,
+        stage: Stage,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+    ):
+        if stage not in self.WRITERS:
+            raise ValueError(f"Invalid stage: {stage}")
+        self.dst = dst
+        self.stage = stage
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._writer = getattr(dst, self.WRITERS[stage])
+        self._pending: List[Tuple[str, str, str, str, StagePayload]] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, question_id: str, method: str, lang: str, model: str, payload: StagePayload) -> None:
+        self._pending.append((question_id, method, lang, model, payload))
+        if (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> int:
+        pending, self._pending = self._pending, []
+        self._last_flush = time.monotonic()
+        return self._writer(pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
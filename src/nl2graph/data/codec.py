@@ -0,0 +1,116 @@
+import json
+import zlib
+import importlib.util
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Union
+
+
+Encoded = Union[str, bytes]
+
+
+class Codec(ABC):
+    name: str
+    tag: bytes = b""
+    requires: tuple = ()
+
+    @abstractmethod
+    def encode(self, data: Any) -> Encoded:
+        pass
+
+    @abstractmethod
+    def decode(self, value: Encoded) -> Any:
+        pass
+
+
+class JsonCodec(Codec):
+    name = "json"
+
+    def encode(self, data: Any) -> Encoded:
+        return json.dumps(data, ensure_ascii=False)
+
+    def decode(self, value: Encoded) -> Any:
+        return json.loads(value)
+
+
+class ZlibCodec(Codec):
+    name = "zlib"
+    tag = b"\x01"
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def encode(self, data: Any) -> Encoded:
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return self.tag + zlib.compress(raw, self.level)
+
+    def decode(self, value: Encoded) -> Any:
+        return json.loads(zlib.decompress(value[1:]))
+
+
+class MsgpackCodec(Codec):
+    name = "msgpack"
+    tag = b"\x02"
+    requires = ("msgpack",)
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def encode(self, data: Any) -> Encoded:
+        import msgpack
+
+        return self.tag + zlib.compress(msgpack.packb(data, use_bin_type=True), self.level)
+
+    def decode(self, value: Encoded) -> Any:
+        import msgpack
+
+        return msgpack.unpackb(zlib.decompress(value[1:]), raw=False)
+
+
+class ZstdCodec(Codec):
+    name = "zstd"
+    tag = b"\x03"
+    requires = ("msgpack", "zstandard")
+
+    def __init__(self, level: int = 3):
+        self.level = level
+
+    def encode(self, data: Any) -> Encoded:
+        import msgpack
+        import zstandard
+
+        packed = msgpack.packb(data, use_bin_type=True)
+        return self.tag + zstandard.ZstdCompressor(level=self.level).compress(packed)
+
+    def decode(self, value: Encoded) -> Any:
+        import msgpack
+        import zstandard
+
+        packed = zstandard.ZstdDecompressor().decompress(value[1:])
+        return msgpack.unpackb(packed, raw=False)
+
+
+CODECS: Dict[str, Codec] = {
+    codec.name: codec
+    for codec in (JsonCodec(), ZlibCodec(), MsgpackCodec(), ZstdCodec())
+}
+
+_BY_TAG: Dict[bytes, Codec] = {codec.tag: codec for codec in CODECS.values() if codec.tag}
+
+
+def get_codec(name: str) -> Codec:
+    if name not in CODECS:
+        raise ValueError(f"Unknown codec: {name}. Available: {list(CODECS)}")
+    codec = CODECS[name]
+    missing = [module for module in codec.requires if importlib.util.find_spec(module) is None]
+    if missing:
+        raise ImportError(f"Codec '{name}' requires: {', '.join(missing)}")
+    return codec
+
+
+def decode(value: Encoded) -> Any:
+    if isinstance(value, str):
+        return CODECS["json"].decode(value)
+    codec = _BY_TAG.get(bytes(value[:1]))
+    if codec is None:
+        raise ValueError(f"Unknown codec tag: {bytes(value[:1])!r}")
+    return codec.decode(value)
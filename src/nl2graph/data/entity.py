@@ -19,6 +19,8 @@ class ExecutionResult(BaseModel):
     result: Optional[List[Any]] = None
     success: bool = False
     error: Optional[str] = None
+    cached: bool = False
+    truncated: bool = False
 
 
 class EvaluationResult(BaseModel):
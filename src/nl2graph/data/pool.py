@@ -0,0 +1,130 @@
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+PRAGMA_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    "read": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -262144,
+        "mmap_size": 1073741824,
+        "temp_store": "MEMORY",
+    },
+    "bulk": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -262144,
+        "mmap_size": 268435456,
+        "temp_store": "MEMORY",
+    },
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+    },
+}
+
+
+class ConnectionPool:
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int = 8,
+        timeout: float = 30.0,
+        profile: str = "default",
+        pragmas: Optional[Dict[str, Any]] = None,
+    ):
+        if profile not in PRAGMA_PROFILES:
+            raise ValueError(f"Unknown PRAGMA profile: {profile}. Available: {list(PRAGMA_PROFILES)}")
+        if size < 1:
+            raise ValueError(f"Pool size must be positive: {size}")
+
+        self._db_path = str(db_path)
+        self.size = size
+        self.timeout = timeout
+        self.pragmas = {**PRAGMA_PROFILES[profile], **(pragmas or {})}
+        self._all: List[sqlite3.Connection] = []
+        self._idle: List[sqlite3.Connection] = []
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+    @property
+    def open_count(self) -> int:
+        return len(self._all)
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._all) < self.size:
+                    conn = self._connect()
+                    self._all.append(conn)
+                    return conn
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"no free connection to {self._db_path} after {self.timeout}s")
+                self._cond.wait(remaining)
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        with self._cond:
+            if any(c is conn for c in self._all):
+                self._idle.append(conn)
+                self._cond.notify()
+
+    @contextmanager
+    def checkout(self) -> Iterator[sqlite3.Connection]:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._acquire()
+            self._local.conn = conn
+            self._local.depth = 0
+
+        self._local.depth += 1
+        try:
+            yield conn
+        finally:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                self._local.conn = None
+                self._release(conn)
+
+    def close_all(self) -> None:
+        with self._cond:
+            conns, self._all, self._idle = self._all, [], []
+            self._cond.notify_all()
+
+        for i, conn in enumerate(conns):
+            try:
+                if i == 0:
+                    conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                conn.close()
+            except sqlite3.Error:
+                pass
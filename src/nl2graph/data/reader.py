@@ -0,0 +1,76 @@
+import gzip
+import json
+from typing import Iterator, IO
+from pathlib import Path
+
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def open_text(path: str) -> IO[str]:
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    if magic == GZIP_MAGIC:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_json_records(path: str, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    with open_text(path) as f:
+        if _first_char(f) == "[":
+            yield from _iter_array(f, chunk_size)
+        else:
+            f.seek(0)
+            yield from _iter_lines(f, Path(path).name)
+
+
+def _first_char(f: IO[str]) -> str:
+    while True:
+        ch = f.read(1)
+        if not ch or not ch.isspace():
+            return ch
+
+
+def _iter_lines(f: IO[str], name: str) -> Iterator[dict]:
+    for lineno, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{name}:{lineno}: invalid JSON line: {e.msg}") from e
+
+
+def _iter_array(f: IO[str], chunk_size: int) -> Iterator[dict]:
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+
+    while True:
+        while pos < len(buf) and (buf[pos].isspace() or buf[pos] == ","):
+            pos += 1
+
+        if pos < len(buf) and buf[pos] == "]":
+            return
+
+        if pos >= len(buf):
+            if eof:
+                raise ValueError("unexpected end of JSON array")
+            buf, pos = f.read(chunk_size), 0
+            eof = not buf
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+
+        yield item
+        pos = end
@@ -1,55 +1,114 @@
+import re
+import gzip
 import json
 import sqlite3
-import threading
-from typing import Optional, Iterator, List, Any
+from contextlib import contextmanager
+from typing import Optional, Iterator, Iterable, List, Tuple, Dict, Set, Any
 from pathlib import Path
 
+from pydantic import BaseModel
+
 from .entity import Record, Result, GenerationResult, ExecutionResult, EvaluationResult
+from .reader import iter_json_records
+from .codec import Codec, Encoded, get_codec, decode
+from .pool import ConnectionPool
+
+
+Run = Tuple[str, str, str]
 
 
 class SourceRepository:
     TABLE = "data"
+    COLUMNS = ("id", "question", "answer")
+    INDEX_FIELDS = ("hop", "split")
+    _FIELD_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, pool_size: int = 8, profile: str = "read"):
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._local = threading.local()
+        self._pool = ConnectionPool(str(self._db_path), size=pool_size, profile=profile)
         self._ensure_table()
 
     @property
-    def _conn(self) -> sqlite3.Connection:
-        if not hasattr(self._local, 'conn'):
-            conn = sqlite3.connect(str(self._db_path), timeout=30, isolation_level=None)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-            self._local.conn = conn
-        return self._local.conn
+    def pool(self) -> ConnectionPool:
+        return self._pool
 
     def _ensure_table(self) -> None:
-        self._conn.execute(f"""
-            CREATE TABLE IF NOT EXISTS {self.TABLE} (
-                id TEXT PRIMARY KEY,
-                question TEXT,
-                answer TEXT,
-                extra TEXT
-            )
-        """)
-
-    def init_from_json(self, json_path: str) -> int:
-        with open(json_path, "r", encoding="utf-8") as f:
-            records = json.load(f)
-
-        for record in records:
-            id_ = record.pop("id")
-            question = record.pop("question")
-            answer = record.pop("answer")
-            extra = record if record else None
+        with self._pool.checkout() as conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE} (
+                    id TEXT PRIMARY KEY,
+                    question TEXT,
+                    answer TEXT,
+                    extra TEXT
+                )
+            """)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._pool.checkout() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def init_from_json(
+        self,
+        json_path: str,
+        index_fields: Optional[Iterable[str]] = None,
+        batch_size: int = 10000,
+    ) -> int:
+        count = 0
+        with self._transaction() as conn:
+            batch = []
+            for record in iter_json_records(json_path):
+                batch.append(self._record_to_row(record))
+                if len(batch) >= batch_size:
+                    count += self._insert_rows(conn, batch)
+                    batch = []
+            count += self._insert_rows(conn, batch)
+
+        for field in dict.fromkeys([*self.INDEX_FIELDS, *(index_fields or [])]):
+            self.create_index(field)
+        return count
+
+    def _record_to_row(self, record: dict) -> Tuple[str, str, str, Optional[str]]:
+        id_ = record.pop("id")
+        question = record.pop("question")
+        answer = record.pop("answer")
+        extra = record if record else None
+        return (
+            id_,
+            question,
+            json.dumps(answer, ensure_ascii=False),
+            json.dumps(extra, ensure_ascii=False) if extra else None,
+        )
 
-            self._conn.execute(
-                f"INSERT OR REPLACE INTO {self.TABLE} (id, question, answer, extra) VALUES (?, ?, ?, ?)",
-                (id_, question, json.dumps(answer, ensure_ascii=False), json.dumps(extra, ensure_ascii=False) if extra else None)
+    def _insert_rows(self, conn: sqlite3.Connection, rows: List[tuple]) -> int:
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {self.TABLE} (id, question, answer, extra) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        return len(rows)
+
+    def _field_expr(self, field: str) -> str:
+        if not self._FIELD_PATTERN.match(field):
+            raise ValueError(f"Invalid filter field: {field}")
+        if field in self.COLUMNS:
+            return field
+        return f"json_extract(extra, '$.{field}')"
+
+    def create_index(self, field: str) -> None:
+        if field in self.COLUMNS:
+            return
+        expr = self._field_expr(field)
+        with self._pool.checkout() as conn:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_{field} ON {self.TABLE} ({expr})"
             )
-        return len(records)
 
     def _row_to_record(self, row: sqlite3.Row) -> Record:
         data = {
@@ -63,39 +122,47 @@ class SourceRepository:
         return Record.from_dict(data)
 
     def get(self, id: str) -> Optional[Record]:
-        cursor = self._conn.execute(
-            f"SELECT * FROM {self.TABLE} WHERE id = ?", (id,)
-        )
-        row = cursor.fetchone()
+        with self._pool.checkout() as conn:
+            row = conn.execute(
+                f"SELECT * FROM {self.TABLE} WHERE id = ?", (id,)
+            ).fetchone()
         if row is None:
             return None
         return self._row_to_record(row)
 
     def exists(self, id: str) -> bool:
-        cursor = self._conn.execute(
-            f"SELECT 1 FROM {self.TABLE} WHERE id = ? LIMIT 1", (id,)
-        )
-        return cursor.fetchone() is not None
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(
+                f"SELECT 1 FROM {self.TABLE} WHERE id = ? LIMIT 1", (id,)
+            )
+            return cursor.fetchone() is not None
 
     def count(self) -> int:
-        cursor = self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}")
-        return cursor.fetchone()[0]
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}")
+            return cursor.fetchone()[0]
 
     def iter_all(self) -> Iterator[Record]:
-        cursor = self._conn.execute(f"SELECT * FROM {self.TABLE}")
-        for row in cursor:
-            yield self._row_to_record(row)
+        with self._pool.checkout() as conn:
+            for row in conn.execute(f"SELECT * FROM {self.TABLE}"):
+                yield self._row_to_record(row)
 
     def iter_by_filter(self, **filters: Any) -> Iterator[Record]:
-        for record in self.iter_all():
-            if all(record.get_field(k) == v for k, v in filters.items() if v is not None):
-                yield record
+        clauses = []
+        params = []
+        for field, value in filters.items():
+            if value is None:
+                continue
+            clauses.append(f"{self._field_expr(field)} = ?")
+            params.append(value)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._pool.checkout() as conn:
+            for row in conn.execute(f"SELECT * FROM {self.TABLE}{where}", params):
+                yield self._row_to_record(row)
 
     def close(self) -> None:
-        if hasattr(self._local, 'conn'):
-            self._local.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
-            self._local.conn.close()
-            del self._local.conn
+        self._pool.close_all()
 
     def __enter__(self):
         return self
@@ -106,67 +173,239 @@ class SourceRepository:
 
 class ResultRepository:
     TABLE = "data"
-
-    def __init__(self, db_path: str):
+    META_TABLE = "meta"
+    QUERY_TABLE = "queries"
+    # bump when execution.normalize.query_hash changes, so rows keyed by the
+    # old hash are dropped instead of never being looked up again
+    QUERY_HASH_VERSION = "2"
+    KEY = ("question_id", "method", "lang", "model")
+    STAGES = ("gen", "exec", "eval")
+    SCORE_COLUMNS = ("exact_match", "f1")
+    STAGE_MODELS = {
+        "gen": GenerationResult,
+        "exec": ExecutionResult,
+        "eval": EvaluationResult,
+    }
+
+    def __init__(
+        self,
+        db_path: str,
+        codec: Optional[str] = None,
+        pool_size: int = 8,
+        profile: str = "default",
+    ):
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._local = threading.local()
+        self._pool = ConnectionPool(str(self._db_path), size=pool_size, profile=profile)
         self._ensure_table()
+        self._codec: Optional[Codec] = None
+        if codec is not None:
+            self.set_codec(codec)
+        else:
+            # resolved on first write, so opening for reads needs no codec extras
+            self._codec_name = self._get_meta("codec") or "json"
 
     @property
-    def _conn(self) -> sqlite3.Connection:
-        if not hasattr(self._local, 'conn'):
-            conn = sqlite3.connect(str(self._db_path), timeout=30, isolation_level=None)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-            self._local.conn = conn
-        return self._local.conn
+    def pool(self) -> ConnectionPool:
+        return self._pool
 
     def _ensure_table(self) -> None:
-        self._conn.execute(f"""
-            CREATE TABLE IF NOT EXISTS {self.TABLE} (
-                question_id TEXT,
-                method TEXT,
-                lang TEXT,
-                model TEXT,
-                gen TEXT,
-                exec TEXT,
-                eval TEXT,
-                PRIMARY KEY (question_id, method, lang, model)
+        with self._pool.checkout() as conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE} (
+                    question_id TEXT,
+                    method TEXT,
+                    lang TEXT,
+                    model TEXT,
+                    gen TEXT,
+                    exec TEXT,
+                    eval TEXT,
+                    exact_match REAL,
+                    f1 REAL,
+                    PRIMARY KEY (question_id, method, lang, model)
+                )
+            """)
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.META_TABLE} (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+            # rows saved before they were keyed by connector cannot be
+            # attributed to one, so the old table is dropped
+            query_columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({self.QUERY_TABLE})")}
+            if query_columns and "connector" not in query_columns:
+                conn.execute(f"DROP TABLE {self.QUERY_TABLE}")
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.QUERY_TABLE} (
+                    dataset TEXT,
+                    lang TEXT,
+                    connector TEXT,
+                    query_hash TEXT,
+                    exec TEXT,
+                    PRIMARY KEY (dataset, lang, connector, query_hash)
+                )
+            """)
+            columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({self.TABLE})")}
+            missing = [column for column in self.SCORE_COLUMNS if column not in columns]
+            for column in missing:
+                conn.execute(f"ALTER TABLE {self.TABLE} ADD COLUMN {column} REAL")
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_config ON {self.TABLE} (method, lang, model)"
             )
-        """)
-
-    def _row_to_result(self, row: sqlite3.Row) -> Result:
-        gen = GenerationResult.model_validate(json.loads(row["gen"])) if row["gen"] else None
-        exec_ = ExecutionResult.model_validate(json.loads(row["exec"])) if row["exec"] else None
-        eval_ = EvaluationResult.model_validate(json.loads(row["eval"])) if row["eval"] else None
-
-        return Result(
-            question_id=row["question_id"],
-            method=row["method"],
-            lang=row["lang"],
-            model=row["model"],
-            gen=gen,
-            exec=exec_,
-            eval=eval_,
-        )
 
-    def get(self, question_id: str, method: str, lang: str, model: str) -> Optional[Result]:
-        cursor = self._conn.execute(
-            f"SELECT * FROM {self.TABLE} WHERE question_id = ? AND method = ? AND lang = ? AND model = ?",
-            (question_id, method, lang, model)
-        )
-        row = cursor.fetchone()
+        if missing:
+            self._backfill_scores()
+        if self._get_meta("query_hash_version") != self.QUERY_HASH_VERSION:
+            self._reset_query_executions()
+
+    def _reset_query_executions(self) -> None:
+        with self._transaction() as conn:
+            conn.execute(f"DELETE FROM {self.QUERY_TABLE}")
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.META_TABLE} (key, value) VALUES (?, ?)",
+                ("query_hash_version", self.QUERY_HASH_VERSION),
+            )
+
+    def _scan(self, columns: str, where: str = "", batch_size: int = 1000) -> Iterator[List[sqlite3.Row]]:
+        last_rowid = 0
+        while True:
+            with self._pool.checkout() as conn:
+                rows = conn.execute(f"""
+                    SELECT rowid, {columns} FROM {self.TABLE}
+                    WHERE rowid > ?{f" AND {where}" if where else ""}
+                    ORDER BY rowid LIMIT ?
+                """, (last_rowid, batch_size)).fetchall()
+            if not rows:
+                return
+            yield rows
+            last_rowid = rows[-1]["rowid"]
+
+    def _backfill_scores(self) -> None:
+        for rows in self._scan("eval", "eval IS NOT NULL"):
+            params = []
+            for row in rows:
+                data = decode(row["eval"])
+                params.append((data.get("exact_match"), data.get("f1"), row["rowid"]))
+            with self._transaction() as conn:
+                conn.executemany(
+                    f"UPDATE {self.TABLE} SET exact_match = ?, f1 = ? WHERE rowid = ?", params
+                )
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        with self._pool.checkout() as conn:
+            row = conn.execute(
+                f"SELECT value FROM {self.META_TABLE} WHERE key = ?", (key,)
+            ).fetchone()
+        return row["value"] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        with self._pool.checkout() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.META_TABLE} (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    @property
+    def codec(self) -> Codec:
+        if self._codec is None:
+            self._codec = get_codec(self._codec_name)
+        return self._codec
+
+    def set_codec(self, name: str) -> None:
+        self._codec = get_codec(name)
+        self._codec_name = name
+        self._set_meta("codec", name)
+
+    def _dump(self, payload: BaseModel) -> Encoded:
+        return self.codec.encode(payload.model_dump())
+
+    def _project(self, stages: Optional[Iterable[str]]) -> Tuple[str, ...]:
+        if stages is None:
+            return self.STAGES
+        stages = tuple(stages)
+        for stage in stages:
+            if stage not in self.STAGES:
+                raise ValueError(f"Invalid stage: {stage}")
+        return stages
+
+    def _select(self, stages: Tuple[str, ...]) -> str:
+        return f"SELECT {', '.join((*self.KEY, *stages))} FROM {self.TABLE}"
+
+    def _load(self, row: sqlite3.Row, stage: str) -> Optional[dict]:
+        return decode(row[stage]) if row[stage] else None
+
+    def _row_to_result(
+        self,
+        row: sqlite3.Row,
+        stages: Tuple[str, ...] = STAGES,
+        validate: bool = True,
+    ) -> Result:
+        fields = {key: row[key] for key in self.KEY}
+        for stage in stages:
+            data = self._load(row, stage)
+            if data is None:
+                continue
+            model_cls = self.STAGE_MODELS[stage]
+            fields[stage] = model_cls.model_validate(data) if validate else model_cls.model_construct(**data)
+
+        if validate:
+            return Result(**fields)
+        return Result.model_construct(**fields)
+
+    def get(
+        self,
+        question_id: str,
+        method: str,
+        lang: str,
+        model: str,
+        stages: Optional[Iterable[str]] = None,
+        validate: bool = True,
+    ) -> Optional[Result]:
+        stages = self._project(stages)
+        with self._pool.checkout() as conn:
+            row = conn.execute(
+                f"{self._select(stages)} WHERE question_id = ? AND method = ? AND lang = ? AND model = ?",
+                (question_id, method, lang, model)
+            ).fetchone()
         if row is None:
             return None
-        return self._row_to_result(row)
+        return self._row_to_result(row, stages, validate)
 
     def exists(self, question_id: str, method: str, lang: str, model: str) -> bool:
-        cursor = self._conn.execute(
-            f"SELECT 1 FROM {self.TABLE} WHERE question_id = ? AND method = ? AND lang = ? AND model = ? LIMIT 1",
-            (question_id, method, lang, model)
-        )
-        return cursor.fetchone() is not None
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(
+                f"SELECT 1 FROM {self.TABLE} WHERE question_id = ? AND method = ? AND lang = ? AND model = ? LIMIT 1",
+                (question_id, method, lang, model)
+            )
+            return cursor.fetchone() is not None
+
+    def stage_status(self, method: str, lang: str, model: str, stage: str) -> Dict[str, bool]:
+        if stage not in self.STAGES:
+            raise ValueError(f"Invalid stage: {stage}")
+
+        index = self.STAGES.index(stage)
+        upstream = f" AND {self.STAGES[index - 1]} IS NOT NULL" if index > 0 else ""
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(f"""
+                SELECT question_id, {stage} IS NOT NULL AS done FROM {self.TABLE}
+                WHERE method = ? AND lang = ? AND model = ?{upstream}
+            """, (method, lang, model))
+            return {row["question_id"]: bool(row["done"]) for row in cursor}
+
+    def pending_ids(self, method: str, lang: str, model: str, stage: str) -> Set[str]:
+        status = self.stage_status(method, lang, model, stage)
+        return {question_id for question_id, done in status.items() if not done}
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._pool.checkout() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
 
     def save_generation(
         self,
@@ -176,13 +415,7 @@ class ResultRepository:
         model: str,
         gen: GenerationResult,
     ) -> None:
-        gen_json = json.dumps(gen.model_dump(), ensure_ascii=False)
-        self._conn.execute(f"""
-            INSERT INTO {self.TABLE} (question_id, method, lang, model, gen, exec, eval)
-            VALUES (?, ?, ?, ?, ?, NULL, NULL)
-            ON CONFLICT (question_id, method, lang, model)
-            DO UPDATE SET gen = excluded.gen, exec = NULL, eval = NULL
-        """, (question_id, method, lang, model, gen_json))
+        self.save_generation_many([(question_id, method, lang, model, gen)])
 
     def save_execution(
         self,
@@ -192,11 +425,7 @@ class ResultRepository:
         model: str,
         exec_: ExecutionResult,
     ) -> None:
-        exec_json = json.dumps(exec_.model_dump(), ensure_ascii=False)
-        self._conn.execute(f"""
-            UPDATE {self.TABLE} SET exec = ?, eval = NULL
-            WHERE question_id = ? AND method = ? AND lang = ? AND model = ?
-        """, (exec_json, question_id, method, lang, model))
+        self.save_execution_many([(question_id, method, lang, model, exec_)])
 
     def save_evaluation(
         self,
@@ -206,35 +435,167 @@ class ResultRepository:
         model: str,
         eval_: EvaluationResult,
     ) -> None:
-        eval_json = json.dumps(eval_.model_dump(), ensure_ascii=False)
-        self._conn.execute(f"""
-            UPDATE {self.TABLE} SET eval = ?
-            WHERE question_id = ? AND method = ? AND lang = ? AND model = ?
-        """, (eval_json, question_id, method, lang, model))
+        self.save_evaluation_many([(question_id, method, lang, model, eval_)])
+
+    def save_generation_many(self, rows: Iterable[Tuple[str, str, str, str, GenerationResult]]) -> int:
+        params = [
+            (question_id, method, lang, model, self._dump(gen))
+            for question_id, method, lang, model, gen in rows
+        ]
+        if not params:
+            return 0
+        with self._transaction() as conn:
+            conn.executemany(f"""
+                INSERT INTO {self.TABLE} (question_id, method, lang, model, gen, exec, eval)
+                VALUES (?, ?, ?, ?, ?, NULL, NULL)
+                ON CONFLICT (question_id, method, lang, model)
+                DO UPDATE SET gen = excluded.gen, exec = NULL, eval = NULL, exact_match = NULL, f1 = NULL
+            """, params)
+        return len(params)
+
+    def save_execution_many(self, rows: Iterable[Tuple[str, str, str, str, ExecutionResult]]) -> int:
+        params = [
+            (self._dump(exec_), question_id, method, lang, model)
+            for question_id, method, lang, model, exec_ in rows
+        ]
+        if not params:
+            return 0
+        with self._transaction() as conn:
+            conn.executemany(f"""
+                UPDATE {self.TABLE} SET exec = ?, eval = NULL, exact_match = NULL, f1 = NULL
+                WHERE question_id = ? AND method = ? AND lang = ? AND model = ?
+            """, params)
+        return len(params)
+
+    def save_evaluation_many(self, rows: Iterable[Tuple[str, str, str, str, EvaluationResult]]) -> int:
+        params = [
+            (self._dump(eval_), eval_.exact_match, eval_.f1, question_id, method, lang, model)
+            for question_id, method, lang, model, eval_ in rows
+        ]
+        if not params:
+            return 0
+        with self._transaction() as conn:
+            conn.executemany(f"""
+                UPDATE {self.TABLE} SET eval = ?, exact_match = ?, f1 = ?
+                WHERE question_id = ? AND method = ? AND lang = ? AND model = ?
+            """, params)
+        return len(params)
 
     def count(self) -> int:
-        cursor = self._conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}")
-        return cursor.fetchone()[0]
-
-    def iter_all(self) -> Iterator[Result]:
-        cursor = self._conn.execute(f"SELECT * FROM {self.TABLE}")
-        for row in cursor:
-            yield self._row_to_result(row)
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(f"SELECT COUNT(*) FROM {self.TABLE}")
+            return cursor.fetchone()[0]
 
-    def iter_by_question(self, question_id: str) -> Iterator[Result]:
-        cursor = self._conn.execute(
-            f"SELECT * FROM {self.TABLE} WHERE question_id = ?", (question_id,)
-        )
-        for row in cursor:
-            yield self._row_to_result(row)
+    def iter_all(
+        self,
+        stages: Optional[Iterable[str]] = None,
+        validate: bool = True,
+    ) -> Iterator[Result]:
+        stages = self._project(stages)
+        with self._pool.checkout() as conn:
+            for row in conn.execute(self._select(stages)):
+                yield self._row_to_result(row, stages, validate)
+
+    def iter_by_question(
+        self,
+        question_id: str,
+        stages: Optional[Iterable[str]] = None,
+        validate: bool = True,
+    ) -> Iterator[Result]:
+        stages = self._project(stages)
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(
+                f"{self._select(stages)} WHERE question_id = ?", (question_id,)
+            )
+            for row in cursor:
+                yield self._row_to_result(row, stages, validate)
 
-    def iter_by_config(self, method: str, lang: str, model: str) -> Iterator[Result]:
-        cursor = self._conn.execute(
-            f"SELECT * FROM {self.TABLE} WHERE method = ? AND lang = ? AND model = ?",
-            (method, lang, model)
-        )
-        for row in cursor:
-            yield self._row_to_result(row)
+    def iter_by_config(
+        self,
+        method: str,
+        lang: str,
+        model: str,
+        stages: Optional[Iterable[str]] = None,
+        validate: bool = True,
+    ) -> Iterator[Result]:
+        stages = self._project(stages)
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(
+                f"{self._select(stages)} WHERE method = ? AND lang = ? AND model = ?",
+                (method, lang, model)
+            )
+            for row in cursor:
+                yield self._row_to_result(row, stages, validate)
+
+    def _run_clause(self, runs: List[Run]) -> Tuple[str, List[str]]:
+        clause = " OR ".join("(method = ? AND lang = ? AND model = ?)" for _ in runs)
+        params = [value for run in runs for value in run]
+        return f"({clause})", params
+
+    def solved_only_by(self, run: Run, other: Run) -> List[str]:
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(f"""
+                SELECT question_id FROM {self.TABLE}
+                WHERE method = ? AND lang = ? AND model = ? AND exact_match >= 1.0
+                EXCEPT
+                SELECT question_id FROM {self.TABLE}
+                WHERE method = ? AND lang = ? AND model = ? AND exact_match >= 1.0
+                ORDER BY question_id
+            """, (*run, *other))
+            return [row["question_id"] for row in cursor]
+
+    def compare_runs(self, runs: List[Run]) -> Dict[str, Any]:
+        if not runs:
+            raise ValueError("No runs to compare")
+
+        flags = []
+        params: List[Any] = []
+        for i, run in enumerate(runs):
+            flags.append(
+                f"COALESCE(MAX(CASE WHEN method = ? AND lang = ? AND model = ? "
+                f"THEN exact_match >= 1.0 END), 0) AS s{i}"
+            )
+            params.extend(run)
+        where, where_params = self._run_clause(runs)
+        params.extend(where_params)
+
+        pairs = [(i, j) for i in range(len(runs)) for j in range(i + 1, len(runs))]
+        aggregates = ["COUNT(*) AS total"]
+        aggregates += [f"SUM(s{i}) AS solved{i}" for i in range(len(runs))]
+        for i, j in pairs:
+            aggregates += [
+                f"SUM(s{i} AND s{j}) AS both_{i}_{j}",
+                f"SUM(s{i} AND NOT s{j}) AS only_{i}_{j}",
+                f"SUM(NOT s{i} AND s{j}) AS only_{j}_{i}",
+            ]
+
+        with self._pool.checkout() as conn:
+            row = conn.execute(f"""
+                WITH scores AS (
+                    SELECT question_id, {', '.join(flags)}
+                    FROM {self.TABLE} WHERE {where}
+                    GROUP BY question_id
+                )
+                SELECT {', '.join(aggregates)} FROM scores
+            """, params).fetchone()
+
+        total = row["total"]
+        matrix = {}
+        for i, j in pairs:
+            both = row[f"both_{i}_{j}"] or 0
+            only_a = row[f"only_{i}_{j}"] or 0
+            only_b = row[f"only_{j}_{i}"] or 0
+            matrix[(i, j)] = {
+                "both": both,
+                "only_a": only_a,
+                "only_b": only_b,
+                "neither": total - both - only_a - only_b,
+            }
+        return {
+            "total": total,
+            "solved": [row[f"solved{i}"] or 0 for i in range(len(runs))],
+            "pairs": matrix,
+        }
 
     def export_json(self, path: str) -> List[dict]:
         results = []
@@ -244,26 +605,132 @@ class ResultRepository:
             json.dump(results, f, ensure_ascii=False, indent=2)
         return results
 
+    def export_jsonl(
+        self,
+        path: str,
+        method: Optional[str] = None,
+        lang: Optional[str] = None,
+        model: Optional[str] = None,
+        stages: Optional[Iterable[str]] = None,
+        compress: Optional[bool] = None,
+        chunk_size: int = 1000,
+    ) -> int:
+        selected = self._project(stages)
+
+        clauses = []
+        params = []
+        for column, value in (("method", method), ("lang", lang), ("model", model)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if stages is not None and selected:
+            clauses.append("(" + " OR ".join(f"{stage} IS NOT NULL" for stage in selected) + ")")
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        if compress is None:
+            compress = str(path).endswith(".gz")
+        opener = gzip.open if compress else open
+
+        count = 0
+        with self._pool.checkout() as conn, opener(path, "wt", encoding="utf-8") as f:
+            cursor = conn.execute(f"{self._select(selected)}{where}", params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                lines = []
+                for row in rows:
+                    item = {key: row[key] for key in self.KEY}
+                    for stage in selected:
+                        item[stage] = self._load(row, stage)
+                    lines.append(json.dumps(item, ensure_ascii=False))
+                f.write("\n".join(lines) + "\n")
+                count += len(rows)
+        return count
+
+    def recompress(self, codec: str, batch_size: int = 1000, vacuum: bool = True) -> int:
+        self.set_codec(codec)
+
+        count = 0
+        for rows in self._scan(", ".join(self.STAGES), batch_size=batch_size):
+            params = []
+            for row in rows:
+                values = [
+                    self._codec.encode(decode(row[stage])) if row[stage] else None
+                    for stage in self.STAGES
+                ]
+                params.append((*values, row["rowid"]))
+
+            with self._transaction() as conn:
+                conn.executemany(f"""
+                    UPDATE {self.TABLE} SET {', '.join(f"{stage} = ?" for stage in self.STAGES)}
+                    WHERE rowid = ?
+                """, params)
+            count += len(rows)
+
+        if vacuum:
+            with self._pool.checkout() as conn:
+                conn.execute("VACUUM")
+        return count
+
+    def get_query_execution(
+        self, dataset: str, lang: str, connector: str, query_hash: str
+    ) -> Optional[ExecutionResult]:
+        with self._pool.checkout() as conn:
+            row = conn.execute(f"""
+                SELECT exec FROM {self.QUERY_TABLE}
+                WHERE dataset = ? AND lang = ? AND connector = ? AND query_hash = ?
+            """, (dataset, lang, connector, query_hash)).fetchone()
+        if row is None:
+            return None
+        return ExecutionResult.model_validate(decode(row["exec"]))
+
+    def save_query_execution(
+        self, dataset: str, lang: str, connector: str, query_hash: str, exec_: ExecutionResult
+    ) -> None:
+        self.save_query_execution_many([(dataset, lang, connector, query_hash, exec_)])
+
+    def save_query_execution_many(self, rows: Iterable[Tuple[str, str, str, str, ExecutionResult]]) -> int:
+        params = [
+            (dataset, lang, connector, query_hash, self._dump(exec_))
+            for dataset, lang, connector, query_hash, exec_ in rows
+        ]
+        if not params:
+            return 0
+        with self._transaction() as conn:
+            conn.executemany(f"""
+                INSERT OR REPLACE INTO {self.QUERY_TABLE} (dataset, lang, connector, query_hash, exec)
+                VALUES (?, ?, ?, ?, ?)
+            """, params)
+        return len(params)
+
+    def clear_query_executions(self, dataset: str, lang: Optional[str] = None) -> int:
+        sql = f"DELETE FROM {self.QUERY_TABLE} WHERE dataset = ?"
+        params = [dataset]
+        if lang is not None:
+            sql += " AND lang = ?"
+            params.append(lang)
+        with self._pool.checkout() as conn:
+            return conn.execute(sql, params).rowcount
+
     def clear_stage(self, method: str, lang: str, model: str, stage: str) -> int:
         cascade = {
-            "gen": "gen = NULL, exec = NULL, eval = NULL",
-            "exec": "exec = NULL, eval = NULL",
-            "eval": "eval = NULL",
+            "gen": "gen = NULL, exec = NULL, eval = NULL, exact_match = NULL, f1 = NULL",
+            "exec": "exec = NULL, eval = NULL, exact_match = NULL, f1 = NULL",
+            "eval": "eval = NULL, exact_match = NULL, f1 = NULL",
         }
         if stage not in cascade:
             raise ValueError(f"Invalid stage: {stage}")
 
-        cursor = self._conn.execute(f"""
-            UPDATE {self.TABLE} SET {cascade[stage]}
-            WHERE method = ? AND lang = ? AND model = ?
-        """, (method, lang, model))
-        return cursor.rowcount
+        with self._pool.checkout() as conn:
+            cursor = conn.execute(f"""
+                UPDATE {self.TABLE} SET {cascade[stage]}
+                WHERE method = ? AND lang = ? AND model = ?
+            """, (method, lang, model))
+            return cursor.rowcount
 
     def close(self) -> None:
-        if hasattr(self._local, 'conn'):
-            self._local.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
-            self._local.conn.close()
-            del self._local.conn
+        self._pool.close_all()
 
     def __enter__(self):
         return self
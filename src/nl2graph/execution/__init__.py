@@ -1,11 +1,13 @@
 from .entity import QueryLanguage
 from .service import GraphService
 from .execution import Execution
+from .cache import QueryCache
 from .connectors.base import BaseConnector
 
 __all__ = [
     "QueryLanguage",
     "GraphService",
     "Execution",
+    "QueryCache",
     "BaseConnector",
 ]
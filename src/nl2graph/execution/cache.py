@@ -0,0 +1,192 @@
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from .connectors.base import BaseConnector
+from .normalize import canonicalize
+from .result.entity import QueryResult
+from ..data.codec import get_codec, decode
+from ..data.pool import ConnectionPool
+
+
+def connector_fingerprint(connector: BaseConnector) -> str:
+    settings: Dict[str, Any] = {"type": type(connector).__name__}
+    for key in connector.fingerprint_settings:
+        settings[key] = getattr(connector, key, None)
+
+    data_path = settings.get("data_path")
+    if data_path and Path(data_path).exists():
+        stat = Path(data_path).stat()
+        settings["data_stat"] = (stat.st_size, stat.st_mtime_ns)
+
+    import_path = settings.get("import_path")
+    if import_path and Path(import_path).is_dir():
+        settings["import_stat"] = sorted(
+            (str(path.relative_to(import_path)), path.stat().st_size, path.stat().st_mtime_ns)
+            for path in Path(import_path).rglob("*") if path.is_file()
+        )
+
+    blob = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class QueryCache:
+
+    TABLE = "cache"
+
+    def __init__(
+        self,
+        path: str,
+        max_size_mb: float = 1024,
+        max_age_days: Optional[float] = 30,
+        evict_every: int = 256,
+        pool_size: int = 8,
+    ):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age = max_age_days * 86400 if max_age_days else None
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        # access times are written back in batches rather than on every hit
+        self._touched: Dict[str, float] = {}
+        self._codec = get_codec("zlib")
+        self._pool = ConnectionPool(self.path, size=pool_size)
+        self._ensure_table()
+        self.evict()
+
+    def _ensure_table(self) -> None:
+        with self._pool.checkout() as conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.TABLE} (
+                    key TEXT PRIMARY KEY,
+                    dataset TEXT,
+                    lang TEXT,
+                    value BLOB,
+                    size INTEGER,
+                    created_at REAL,
+                    accessed_at REAL
+                )
+            """)
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.TABLE}_accessed ON {self.TABLE} (accessed_at)"
+            )
+
+    @staticmethod
+    def make_key(dataset: str, lang: str, query: str, fingerprint: str) -> str:
+        blob = "\0".join((dataset, lang, fingerprint, canonicalize(query, lang)))
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[QueryResult]:
+        now = time.time()
+        with self._pool.checkout() as conn:
+            row = conn.execute(
+                f"SELECT value, created_at FROM {self.TABLE} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.max_age and now - row["created_at"] > self.max_age:
+                conn.execute(f"DELETE FROM {self.TABLE} WHERE key = ?", (key,))
+                row = None
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = now
+            due = len(self._touched) >= self.evict_every
+        if due:
+            self._flush_access()
+
+        data = decode(row["value"])
+        return QueryResult.model_validate(data)
+
+    def put(self, key: str, dataset: str, lang: str, result: QueryResult) -> None:
+        value = self._codec.encode({
+            "columns": result.columns,
+            "values": result.values,
+            "truncated": result.truncated,
+        })
+        now = time.time()
+        with self._pool.checkout() as conn:
+            conn.execute(f"""
+                INSERT OR REPLACE INTO {self.TABLE} (key, dataset, lang, value, size, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (key, dataset, lang, value, len(value), now, now))
+
+        with self._lock:
+            self._puts += 1
+            due = self._puts % self.evict_every == 0
+        if due:
+            self.evict()
+
+    def _flush_access(self) -> None:
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            with self._pool.checkout() as conn:
+                conn.executemany(
+                    f"UPDATE {self.TABLE} SET accessed_at = ? WHERE key = ?",
+                    [(accessed, key) for key, accessed in touched.items()],
+                )
+
+    def evict(self) -> int:
+        self._flush_access()
+        removed = 0
+        with self._pool.checkout() as conn:
+            if self.max_age:
+                cursor = conn.execute(
+                    f"DELETE FROM {self.TABLE} WHERE created_at < ?", (time.time() - self.max_age,)
+                )
+                removed += cursor.rowcount
+
+            total = conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.TABLE}").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                keys = []
+                for row in conn.execute(f"SELECT key, size FROM {self.TABLE} ORDER BY accessed_at"):
+                    keys.append((row["key"],))
+                    excess -= row["size"]
+                    if excess <= 0:
+                        break
+                conn.executemany(f"DELETE FROM {self.TABLE} WHERE key = ?", keys)
+                removed += len(keys)
+
+        with self._lock:
+            self.evictions += removed
+        return removed
+
+    def clear(self, dataset: Optional[str] = None) -> int:
+        with self._pool.checkout() as conn:
+            if dataset is None:
+                return conn.execute(f"DELETE FROM {self.TABLE}").rowcount
+            return conn.execute(f"DELETE FROM {self.TABLE} WHERE dataset = ?", (dataset,)).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        with self._pool.checkout() as conn:
+            entries, size = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.TABLE}"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+    def close(self) -> None:
+        self._flush_access()
+        self._pool.close_all()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
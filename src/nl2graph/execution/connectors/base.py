@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, List, Tuple, Union
 
 from ..entity import QueryLanguage
 from ..result.entity import QueryResult
@@ -7,6 +8,13 @@ from ..result.entity import QueryResult
 
 class BaseConnector(ABC):
     query_language: QueryLanguage
+    supports_batch: bool = False
+    supports_async: bool = False
+    fork_safe: bool = True
+    # whether execute() stops on its own once remaining() runs out
+    interruptible: bool = False
+    # settings that change query results, and so key the query cache
+    fingerprint_settings: Tuple[str, ...] = ("name", "host", "port", "username", "database", "max_rows")
 
     def __init__(self, **kwargs):
         self.name = kwargs.get('name')
@@ -16,6 +24,9 @@ class BaseConnector(ABC):
         self.password = kwargs.get('password')
         self.database = kwargs.get('database')
         self.timeout = kwargs.get('timeout', 30)
+        self.workers = kwargs.get('workers', 1)
+        self.max_rows = kwargs.get('max_rows')
+        self.keep_raw = kwargs.get('keep_raw', False)
 
     @abstractmethod
     def connect(self) -> None:
@@ -25,10 +36,33 @@ class BaseConnector(ABC):
     def close(self) -> None:
         pass
 
+    def _over_limit(self, count: int) -> bool:
+        return self.max_rows is not None and count >= self.max_rows
+
     @abstractmethod
     def execute(self, query: str, timeout: Optional[int] = None) -> QueryResult:
         pass
 
+    def execute_many(
+        self, queries: List[str], timeout: Optional[int] = None
+    ) -> List[Union[QueryResult, Exception]]:
+        outputs = []
+        for query in queries:
+            try:
+                outputs.append(self.execute(query, timeout))
+            except Exception as e:
+                outputs.append(e)
+        return outputs
+
+    async def aconnect(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    async def execute_async(self, query: str, timeout: Optional[int] = None) -> QueryResult:
+        return await asyncio.to_thread(self.execute, query, timeout)
+
     def __enter__(self):
         self.connect()
         return self
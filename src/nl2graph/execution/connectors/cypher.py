@@ -0,0 +1,48 @@
+import re
+from typing import Dict, Any, Tuple
+
+from ..entity import QueryLanguage
+from ..parameterize import parameterize_cypher
+from .base import BaseConnector
+
+
+class CypherConnector(BaseConnector):
+    query_language = QueryLanguage.CYPHER
+    fingerprint_settings = BaseConnector.fingerprint_settings + ("sanity",)
+
+    SANITY_HANDLERS = {
+        "lowercase_relationships": "_lowercase_relationships",
+    }
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.sanity = kwargs.get('sanity', [])
+        self.parameterize = kwargs.get('parameterize', True)
+        self._raw_only = set()
+
+    def _rewrite(self, text: str) -> Tuple[str, Dict[str, Any]]:
+        if not self.parameterize or text in self._raw_only:
+            return text, {}
+        return parameterize_cypher(text)
+
+    def _is_rewrite_error(self, error: Exception) -> bool:
+        return False
+
+    def _fall_back(self, error: Exception, text: str, params: Dict[str, Any]) -> bool:
+        if not params or not self._is_rewrite_error(error):
+            return False
+        if len(self._raw_only) > 4096:
+            self._raw_only.clear()
+        self._raw_only.add(text)
+        return True
+
+    def _apply_sanity(self, query: str) -> str:
+        for name in self.sanity:
+            if name in self.SANITY_HANDLERS:
+                handler = getattr(self, self.SANITY_HANDLERS[name])
+                query = handler(query)
+        return query
+
+    def _lowercase_relationships(self, query: str) -> str:
+        pattern = r':\s*([A-Z_]+)(?=\s*[\]\{])'
+        return re.sub(pattern, lambda m: ':' + m.group(1).lower(), query)
@@ -1,26 +1,42 @@
-from typing import Optional, TYPE_CHECKING
+import time
+import queue
+import asyncio
+from typing import Optional, List, Tuple, Dict, Any, TYPE_CHECKING
 
+from ...base.timeout import remaining, TimeoutError
 from ..entity import QueryLanguage
+from ..parameterize import parameterize_gremlin
+from ..tokens import GREMLIN_TOKEN
 from ..result.entity import QueryResult
-from ..result.converter import convert_gremlin_value
+from ..result.converter import gremlin_converter
 from .base import BaseConnector
 
 if TYPE_CHECKING:
     from gremlin_python.driver.client import Client
+    from gremlin_python.driver.resultset import ResultSet
+
+
+# steps that end a traversal, after which limit() no longer applies
+_TERMINAL_STEPS = {"toList", "toSet", "toBulkSet", "next", "tryNext", "hasNext", "iterate", "explain", "profile"}
 
 
 class GremlinConnector(BaseConnector):
     query_language = QueryLanguage.GREMLIN
+    supports_async = True
+    interruptible = True
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._client: Optional["Client"] = None
+        self.pool_size = kwargs.get('pool_size') or max(4, min(self.workers, 32))
+        self.parameterize = kwargs.get('parameterize', True)
+        self._raw_only = set()
 
     def connect(self) -> None:
         from gremlin_python.driver.client import Client
 
         url = f"ws://{self.host}:{self.port}/gremlin"
-        self._client = Client(url, "g")
+        self._client = Client(url, "g", pool_size=self.pool_size)
 
     def close(self) -> None:
         if self._client:
@@ -28,16 +44,143 @@ class GremlinConnector(BaseConnector):
             self._client = None
 
     def execute(self, query: str, timeout: Optional[int] = None) -> QueryResult:
-        result_set = self._client.submit(query)
-        raw_results = result_set.all().result()
-
-        rows = []
-        for item in raw_results:
-            converted = convert_gremlin_value(item)
-            if isinstance(converted, dict):
-                rows.append(converted)
-            else:
-                rows.append({"value": converted})
-
-        columns = list(rows[0].keys()) if rows else []
-        return QueryResult(columns=columns, rows=rows, raw=raw_results)
+        timeout = remaining(timeout or self.timeout)
+        script, bindings = self._rewrite(query)
+        try:
+            result_set = self._submit(script, bindings, timeout)
+            return self._to_result(*self._consume(result_set, timeout))
+        except Exception as e:
+            if not self._fall_back(e, query, bindings):
+                raise
+        result_set = self._submit(query, {}, timeout)
+        return self._to_result(*self._consume(result_set, timeout))
+
+    async def execute_async(self, query: str, timeout: Optional[int] = None) -> QueryResult:
+        timeout = timeout or self.timeout
+        script, bindings = self._rewrite(query)
+        try:
+            return await self._execute_async(script, bindings, timeout)
+        except Exception as e:
+            if not self._fall_back(e, query, bindings):
+                raise
+        return await self._execute_async(query, {}, timeout)
+
+    async def _execute_async(self, script: str, bindings: Dict[str, Any], timeout: float) -> QueryResult:
+        result_set = await asyncio.wrap_future(self._client.submit_async(
+            self._limit(script), bindings=bindings or None, request_options=self._request_options(timeout)
+        ))
+        return self._to_result(*await self._consume_async(result_set, timeout))
+
+    def _submit(self, script: str, bindings: Dict[str, Any], timeout: float) -> "ResultSet":
+        return self._client.submit(
+            self._limit(script), bindings=bindings or None, request_options=self._request_options(timeout)
+        )
+
+    def _rewrite(self, query: str) -> Tuple[str, Dict[str, Any]]:
+        if not self.parameterize or query in self._raw_only:
+            return query, {}
+        return parameterize_gremlin(query)
+
+    def _limit(self, script: str) -> str:
+        # cap the traversal server-side, one row past max_rows to detect truncation
+        if self.max_rows is None:
+            return script
+        tokens = [(match.lastgroup, match.group()) for match in GREMLIN_TOKEN.finditer(script)]
+        while tokens and tokens[-1][1] == ";":
+            tokens.pop()
+        if not tokens or tokens[0] != ("ident", "g") or any(
+            kind in ("long", "comment") or text == ";" for kind, text in tokens
+        ):
+            return script
+
+        depth = 0
+        last_step = None
+        for i, (kind, text) in enumerate(tokens):
+            if text in "([{":
+                depth += 1
+            elif text in ")]}":
+                depth -= 1
+            elif depth == 0 and text == "." and i + 1 < len(tokens) and tokens[i + 1][0] == "ident":
+                last_step = tokens[i + 1][1]
+        if last_step is None or last_step in _TERMINAL_STEPS:
+            return script
+        return f"{script.rstrip().rstrip(';').rstrip()}.limit({self.max_rows + 1})"
+
+    def _fall_back(self, error: Exception, query: str, bindings: Dict[str, Any]) -> bool:
+        if not bindings or "CompilationErrors" not in str(error):
+            return False
+        if len(self._raw_only) > 4096:
+            self._raw_only.clear()
+        self._raw_only.add(query)
+        return True
+
+    def _request_options(self, timeout: float) -> dict:
+        return {"evaluationTimeout": int(timeout * 1000)}
+
+    def _consume(self, result_set: "ResultSet", timeout: float) -> Tuple[List, bool]:
+        deadline = time.monotonic() + timeout
+        raw_results = []
+        truncated = False
+        while True:
+            try:
+                batch = result_set.stream.get(timeout=0.05)
+            except queue.Empty:
+                if result_set.done.done() and result_set.stream.empty():
+                    if not truncated:
+                        result_set.done.result()
+                    return raw_results, truncated
+                if time.monotonic() > deadline:
+                    if truncated:
+                        return raw_results, True
+                    raise TimeoutError(f"timeout after {timeout}s")
+                continue
+
+            # past max_rows, keep draining so the stream does not grow
+            # until the connection goes back to the pool
+            for item in batch:
+                if self._over_limit(len(raw_results)):
+                    truncated = True
+                    break
+                raw_results.append(item)
+
+    async def _consume_async(self, result_set: "ResultSet", timeout: float) -> Tuple[List, bool]:
+        # the same drain as _consume, waiting on the driver's done future
+        # instead of blocking, so no executor thread is held
+        deadline = time.monotonic() + timeout
+        done = asyncio.wrap_future(result_set.done)
+        raw_results = []
+        truncated = False
+        while True:
+            try:
+                batch = result_set.stream.get_nowait()
+            except queue.Empty:
+                if done.done() and result_set.stream.empty():
+                    if not truncated:
+                        done.result()
+                    elif not done.cancelled():
+                        done.exception()
+                    return raw_results, truncated
+                if time.monotonic() > deadline:
+                    if truncated:
+                        return raw_results, True
+                    raise TimeoutError(f"timeout after {timeout}s")
+                await asyncio.wait({done}, timeout=0.05)
+                continue
+
+            for item in batch:
+                if self._over_limit(len(raw_results)):
+                    truncated = True
+                    break
+                raw_results.append(item)
+
+    def _to_result(self, raw_results: list, truncated: bool = False) -> QueryResult:
+        raw = raw_results if self.keep_raw else None
+        converted = gremlin_converter.column(raw_results)
+        if not converted:
+            return QueryResult(raw=raw, truncated=truncated)
+
+        if not any(isinstance(value, dict) for value in converted):
+            return QueryResult(columns=["value"], values=[converted], raw=raw, truncated=truncated)
+
+        rows = [value if isinstance(value, dict) else {"value": value} for value in converted]
+        return QueryResult(rows=rows, raw=raw, truncated=truncated)
@@ -0,0 +1,239 @@
+import os
+import re
+import time
+import shutil
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, List
+
+from ...base.timeout import TimeoutError, remaining
+from ..result.entity import QueryResult
+from ..result.converter import kuzu_converter
+from .cypher import CypherConnector
+
+
+logger = logging.getLogger(__name__)
+
+# the scripts an EXPORT DATABASE directory holds, in the order they must run
+_IMPORT_SCRIPTS = ("schema.cypher", "macro.cypher", "copy.cypher", "index.cypher")
+_COPY_SOURCE = re.compile(r"""(\bFROM\s+)(["'])(.*?)\2""", re.IGNORECASE)
+_PARALLEL_OPTION = re.compile(r"\s*,?\s*\bparallel\s*=\s*\w+", re.IGNORECASE)
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+
+def _statements(script: str) -> List[str]:
+    statements, current, quote = [], [], None
+    for i, char in enumerate(script):
+        current.append(char)
+        if quote:
+            if char == quote and script[i - 1] != "\\":
+                quote = None
+        elif char in "'\"`":
+            quote = char
+        elif char == ";":
+            statements.append("".join(current).strip())
+            current = []
+    statements.append("".join(current).strip())
+    return [statement for statement in statements if statement.rstrip(";").strip()]
+
+
+def _copy_statement(statement: str, base: Path) -> str:
+    # exported COPY statements name their data files relative to the export,
+    # and parquet exports carry a parallel option COPY itself rejects
+    def resolve(match):
+        path = Path(match.group(3))
+        if not path.is_absolute():
+            path = (base / path).resolve()
+        return f"{match.group(1)}{match.group(2)}{path.as_posix()}{match.group(2)}"
+
+    match = _COPY_SOURCE.search(statement)
+    if match is None:
+        return statement
+    statement = _COPY_SOURCE.sub(resolve, statement)
+    if match.group(3).lower().endswith(".parquet"):
+        statement = _PARALLEL_OPTION.sub("", statement)
+        statement = re.sub(r"\(\s*,\s*", "(", statement)
+        statement = re.sub(r"\s*\(\s*\)", "", statement)
+    return statement
+
+
+class KuzuConnector(CypherConnector):
+    interruptible = True
+    fingerprint_settings = CypherConnector.fingerprint_settings + ("db_path", "import_path")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._database = None
+        self._connections = []
+        self._lock = threading.Lock()
+        self.db_path = kwargs.get('db_path')
+        self.import_path = kwargs.get('import_path')
+        self.threads = kwargs.get('threads') or (1 if self.workers > 1 else 0)
+        self.buffer_pool_mb = kwargs.get('buffer_pool_mb') or 0
+        self.build_timeout = kwargs.get('build_timeout') or 3600
+
+    def connect(self) -> None:
+        import kuzu
+
+        if not self.db_path:
+            self._database = kuzu.Database(":memory:")
+            return
+
+        self.build()
+        self._database = kuzu.Database(
+            self.db_path,
+            read_only=True,
+            buffer_pool_size=self.buffer_pool_mb * 1024 * 1024,
+        )
+
+    def _source_key(self) -> str:
+        import kuzu
+
+        digest = hashlib.sha256(kuzu.__version__.encode("utf-8"))
+        for path in sorted(Path(self.import_path).rglob("*")):
+            if path.is_file():
+                stat = path.stat()
+                digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def build(self, force: bool = False) -> bool:
+        import kuzu
+
+        db_path = Path(self.db_path)
+        marker = db_path.with_name(db_path.name + ".source")
+        if not self.import_path:
+            return False
+        if not Path(self.import_path).exists():
+            raise FileNotFoundError(f"Kuzu import directory not found: {self.import_path}")
+
+        key = self._source_key()
+        if not force and db_path.exists() and marker.exists() and marker.read_text() == key:
+            return False
+
+        logger.info(f"Building {db_path} from {self.import_path}")
+        tmp = db_path.with_name(db_path.name + ".tmp")
+        _remove(tmp)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # IMPORT DATABASE can hang indefinitely, so the export's scripts run
+        # statement by statement under one deadline for the whole build
+        database = kuzu.Database(str(tmp))
+        conn = kuzu.Connection(database)
+        try:
+            self._import(conn, time.monotonic() + self.build_timeout)
+        except BaseException:
+            conn.close()
+            database.close()
+            _remove(tmp)
+            raise
+        conn.close()
+        database.close()
+
+        _remove(db_path)
+        os.replace(tmp, db_path)
+        marker.write_text(key)
+        return True
+
+    def _import(self, conn, deadline: float) -> None:
+        source = Path(self.import_path).resolve()
+        for name in _IMPORT_SCRIPTS:
+            script = source / name
+            if not script.exists():
+                continue
+            for statement in _statements(script.read_text()):
+                if name == "copy.cypher":
+                    statement = _copy_statement(statement, source)
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise TimeoutError(f"Kuzu build exceeded {self.build_timeout}s")
+                conn.set_query_timeout(max(int(left * 1000), 1))
+                try:
+                    conn.execute(statement)
+                except RuntimeError as e:
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(f"Kuzu build exceeded {self.build_timeout}s") from e
+                    raise
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        if self._database is not None:
+            self._database.close()
+            self._database = None
+
+    def _acquire(self):
+        with self._lock:
+            if self._connections:
+                return self._connections.pop()
+
+        import kuzu
+
+        return kuzu.Connection(self._database, num_threads=self.threads)
+
+    def _release(self, conn) -> None:
+        with self._lock:
+            if len(self._connections) < self.workers:
+                self._connections.append(conn)
+                return
+        conn.close()
+
+    def _is_rewrite_error(self, error: Exception) -> bool:
+        message = str(error)
+        return "Parser exception" in message or "Binder exception" in message
+
+    def _start(self, conn, query: str):
+        text = self._apply_sanity(query)
+        template, params = self._rewrite(text)
+        try:
+            return conn.execute(template, params) if params else conn.execute(template)
+        except RuntimeError as e:
+            if not self._fall_back(e, text, params):
+                raise
+        return conn.execute(text)
+
+    def execute(self, query: str, timeout: Optional[int] = None) -> QueryResult:
+        conn = self._acquire()
+        try:
+            conn.set_query_timeout(int(remaining(timeout or self.timeout) * 1000))
+            result = self._start(conn, query)
+            try:
+                return self._collect(result)
+            finally:
+                result.close()
+        finally:
+            self._release(conn)
+
+    def _collect(self, result) -> QueryResult:
+        columns: List[str] = result.get_column_names()
+        values = [[] for _ in columns]
+        raw = [] if self.keep_raw else None
+        count = 0
+        truncated = False
+        while result.has_next():
+            if self._over_limit(count):
+                truncated = True
+                break
+            row = result.get_next()
+            for column, value in zip(values, row):
+                column.append(value)
+            if raw is not None:
+                raw.append(row)
+            count += 1
+
+        if not count:
+            return QueryResult(raw=raw, truncated=truncated)
+        values = [kuzu_converter.column(column) for column in values]
+        return QueryResult(columns=columns, values=values, raw=raw, truncated=truncated)
@@ -1,23 +1,26 @@
-import re
-from typing import Optional
+import time
+import threading
+from typing import Optional, List, Union
 
-from ..entity import QueryLanguage
+from ...base.timeout import TimeoutError, remaining
 from ..result.entity import QueryResult
-from ..result.converter import convert_neo4j_value
-from .base import BaseConnector
+from ..result.converter import neo4j_converter
+from .cypher import CypherConnector
 
 
-class Neo4jConnector(BaseConnector):
-    query_language = QueryLanguage.CYPHER
-
-    SANITY_HANDLERS = {
-        "lowercase_relationships": "_lowercase_relationships",
-    }
+class Neo4jConnector(CypherConnector):
+    supports_batch = True
+    supports_async = True
+    interruptible = True
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._driver = None
-        self.sanity = kwargs.get('sanity', [])
+        self._async_driver = None
+        self._sessions = []
+        self._lock = threading.Lock()
+        self.max_connection_pool_size = kwargs.get('max_connection_pool_size') or max(self.workers + 1, 10)
+        self.connection_acquisition_timeout = kwargs.get('connection_acquisition_timeout', self.timeout)
 
     def connect(self) -> None:
         import logging
@@ -29,39 +32,193 @@ class Neo4jConnector(BaseConnector):
         self._driver = GraphDatabase.driver(
             uri,
             auth=(self.username, self.password),
+            max_connection_pool_size=self.max_connection_pool_size,
+            connection_acquisition_timeout=self.connection_acquisition_timeout,
+        )
+
+    async def aconnect(self) -> None:
+        from neo4j import AsyncGraphDatabase
+
+        self._async_driver = AsyncGraphDatabase.driver(
+            f"bolt://{self.host}:{self.port}",
+            auth=(self.username, self.password),
+            max_connection_pool_size=self.max_connection_pool_size,
+            connection_acquisition_timeout=self.connection_acquisition_timeout,
         )
 
+    async def aclose(self) -> None:
+        if self._async_driver:
+            await self._async_driver.close()
+            self._async_driver = None
+
     def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
         if self._driver:
             self._driver.close()
             self._driver = None
 
+    def _acquire_session(self):
+        with self._lock:
+            if self._sessions:
+                return self._sessions.pop()
+        return self._driver.session(database=self.database or "neo4j")
+
+    def _release_session(self, session, healthy: bool = True) -> None:
+        if healthy:
+            with self._lock:
+                if len(self._sessions) < self.workers:
+                    self._sessions.append(session)
+                    return
+        try:
+            session.close()
+        except Exception:
+            pass
+
+    def _query(self, text: str, timeout: Optional[float]):
+        from neo4j import Query
+
+        return Query(text, timeout=remaining(timeout or self.timeout))
+
+    def _is_rewrite_error(self, error: Exception) -> bool:
+        return getattr(error, "code", None) == "Neo.ClientError.Statement.SyntaxError"
+
+    def _is_tx_timeout(self, error: Exception) -> bool:
+        return "TransactionTimedOut" in (getattr(error, "code", None) or "")
+
+    def _start(self, session, query: str, timeout: Optional[float]):
+        from neo4j.exceptions import ClientError
+
+        text = self._apply_sanity(query)
+        template, params = self._rewrite(text)
+        try:
+            result = session.run(self._query(template, timeout), parameters=params or None)
+            return result, list(result.keys())
+        except ClientError as e:
+            if not self._fall_back(e, text, params):
+                raise
+        result = session.run(self._query(text, timeout))
+        return result, list(result.keys())
+
+    def _run(self, session, query: str, timeout: Optional[float]) -> QueryResult:
+        result, columns = self._start(session, query, timeout)
+        return self._consume(result, columns)
+
+    def _consume(self, result, columns: List[str]) -> QueryResult:
+        values = [[] for _ in columns]
+        raw = [] if self.keep_raw else None
+        count = 0
+        truncated = False
+        for record in result:
+            if self._over_limit(count):
+                result.consume()
+                truncated = True
+                break
+            self._collect(record, columns, values, raw)
+            count += 1
+        return self._to_result(columns, values, count, raw, truncated)
+
+    def _collect(self, record, columns: List[str], values: List[list], raw: Optional[list]) -> None:
+        for column, key in zip(values, columns):
+            column.append(record[key])
+        if raw is not None:
+            raw.append(record)
+
+    def _to_result(
+        self, columns: List[str], values: List[list], count: int, raw: Optional[list], truncated: bool
+    ) -> QueryResult:
+        if not count:
+            columns, values = [], []
+        values = [neo4j_converter.column(column) for column in values]
+        return QueryResult(columns=columns, values=values, raw=raw, truncated=truncated)
+
     def execute(self, query: str, timeout: Optional[int] = None) -> QueryResult:
-        query = self._apply_sanity(query)
-        timeout_ms = (timeout or self.timeout) * 1000
-        database = self.database or "neo4j"
-
-        with self._driver.session(database=database) as session:
-            result = session.run(query, timeout=timeout_ms)
-            records = list(result)
-            columns = result.keys() if records else []
-
-            rows = []
-            for record in records:
-                row = {}
-                for key in columns:
-                    row[key] = convert_neo4j_value(record[key])
-                rows.append(row)
-
-            return QueryResult(columns=list(columns), rows=rows, raw=records)
-
-    def _apply_sanity(self, query: str) -> str:
-        for name in self.sanity:
-            if name in self.SANITY_HANDLERS:
-                handler = getattr(self, self.SANITY_HANDLERS[name])
-                query = handler(query)
-        return query
-
-    def _lowercase_relationships(self, query: str) -> str:
-        pattern = r':\s*([A-Z_]+)(?=\s*[\]\{])'
-        return re.sub(pattern, lambda m: ':' + m.group(1).lower(), query)
+        session = self._acquire_session()
+        healthy = False
+        try:
+            result = self._run(session, query, timeout)
+            healthy = True
+            return result
+        finally:
+            self._release_session(session, healthy)
+
+    def execute_many(
+        self, queries: List[str], timeout: Optional[int] = None
+    ) -> List[Union[QueryResult, Exception]]:
+        # the batch runs in explicit transactions on one session, bounded as
+        # a whole by the deadline the caller set, or timeout per query; each
+        # transaction gets at most one query's timeout on the server
+        from neo4j.exceptions import Neo4jError
+
+        per_query = timeout or self.timeout
+        budget = remaining(per_query * len(queries))
+        deadline = time.monotonic() + budget
+        session = self._acquire_session()
+        healthy = False
+        outputs: List[Union[QueryResult, Exception]] = []
+        try:
+            while len(outputs) < len(queries):
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    outputs.extend(TimeoutError(f"timeout after {budget:g}s") for _ in queries[len(outputs):])
+                    break
+                # a failed query ends its transaction, so the rest of the
+                # batch continues in a new one
+                tx = session.begin_transaction(timeout=min(left, per_query))
+                first = len(outputs)
+                try:
+                    for query in queries[first:]:
+                        if time.monotonic() >= deadline:
+                            break
+                        text = self._apply_sanity(query)
+                        template, params = self._rewrite(text)
+                        try:
+                            result = tx.run(template, params or None)
+                            outputs.append(self._consume(result, list(result.keys())))
+                        except Neo4jError as e:
+                            # a query that ran out the time its predecessors
+                            # left in the transaction is retried in a new one
+                            retry = len(outputs) > first and self._is_tx_timeout(e)
+                            if not retry and not self._fall_back(e, text, params):
+                                outputs.append(e)
+                            break
+                    else:
+                        tx.commit()
+                finally:
+                    tx.close()
+            healthy = True
+        finally:
+            self._release_session(session, healthy)
+        return outputs
+
+    async def execute_async(self, query: str, timeout: Optional[int] = None) -> QueryResult:
+        from neo4j.exceptions import ClientError
+
+        async with self._async_driver.session(database=self.database or "neo4j") as session:
+            text = self._apply_sanity(query)
+            template, params = self._rewrite(text)
+            try:
+                result = await session.run(self._query(template, timeout), parameters=params or None)
+                columns = list(result.keys())
+            except ClientError as e:
+                if not self._fall_back(e, text, params):
+                    raise
+                result = await session.run(self._query(text, timeout))
+                columns = list(result.keys())
+            values = [[] for _ in columns]
+            raw = [] if self.keep_raw else None
+            count = 0
+            truncated = False
+            async for record in result:
+                if self._over_limit(count):
+                    await result.consume()
+                    truncated = True
+                    break
+                self._collect(record, columns, values, raw)
+                count += 1
+        return self._to_result(columns, values, count, raw, truncated)
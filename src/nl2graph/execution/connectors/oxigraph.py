@@ -0,0 +1,177 @@
+import os
+import re
+import time
+import shutil
+import logging
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+
+from ...base.timeout import remaining
+from ..entity import QueryLanguage
+from ..result.entity import QueryResult
+from ..result.converter import oxigraph_converter
+from .base import BaseConnector
+from .process_pool import ProcessPool
+
+if TYPE_CHECKING:
+    from pyoxigraph import Store
+
+
+logger = logging.getLogger(__name__)
+
+_FORMATS = {
+    "turtle": "TURTLE",
+    "ttl": "TURTLE",
+    "nt": "N_TRIPLES",
+    "ntriples": "N_TRIPLES",
+    "nquads": "N_QUADS",
+    "trig": "TRIG",
+    "xml": "RDF_XML",
+    "n3": "N3",
+}
+
+# rdflib binds these on every Graph, so generated queries often omit them
+_CORE_PREFIXES = {
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+    "owl": "http://www.w3.org/2002/07/owl#",
+}
+
+
+class OxigraphConnector(BaseConnector):
+    query_language = QueryLanguage.SPARQL
+    fingerprint_settings = BaseConnector.fingerprint_settings + ("data_path", "data_format", "store_path")
+    fork_safe = False
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._store: Optional["Store"] = None
+        self.data_path = kwargs.get('data_path')
+        self.data_format = kwargs.get('data_format', 'turtle')
+        self.store_path = kwargs.get('store_path')
+        self.processes = kwargs.get('processes') or 0
+        self.load_timeout = kwargs.get('load_timeout') or 600
+        self._pool: Optional[ProcessPool] = None
+        self.load_time: Optional[float] = None
+        self.load_source: Optional[str] = None
+
+    def _format(self):
+        from pyoxigraph import RdfFormat
+
+        name = _FORMATS.get(self.data_format.lower())
+        if name is None:
+            raise ValueError(f"Unsupported RDF format for oxigraph: {self.data_format}")
+        return getattr(RdfFormat, name)
+
+    def connect(self) -> None:
+        from pyoxigraph import Store
+
+        start = time.perf_counter()
+        if self.store_path:
+            self.load_source = "source" if self.build() else "store"
+            self._store = Store.read_only(self.store_path)
+        else:
+            self._store = Store()
+            if self.data_path and Path(self.data_path).exists():
+                self._store.bulk_load(path=self.data_path, format=self._format())
+                self.load_source = "source"
+        self.load_time = time.perf_counter() - start
+
+        if self.processes:
+            self._pool = ProcessPool(self, self.processes, load_timeout=self.load_timeout)
+
+    def _source_key(self, path: Path) -> str:
+        import pyoxigraph
+
+        stat = path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}:{self.data_format}:{pyoxigraph.__version__}"
+
+    def build(self, force: bool = False) -> bool:
+        from pyoxigraph import Store
+
+        store_path = Path(self.store_path)
+        marker = store_path.with_name(store_path.name + ".source")
+        if not self.data_path:
+            return False
+        data_path = Path(self.data_path)
+        if not data_path.exists():
+            raise FileNotFoundError(f"RDF data file not found: {self.data_path}")
+
+        key = self._source_key(data_path)
+        if not force and store_path.exists() and marker.exists() and marker.read_text() == key:
+            return False
+
+        logger.info(f"Building {store_path} from {data_path.name}")
+        tmp = store_path.with_name(store_path.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        store_path.parent.mkdir(parents=True, exist_ok=True)
+
+        store = Store(str(tmp))
+        store.bulk_load(path=str(data_path), format=self._format())
+        store.optimize()
+        del store
+
+        shutil.rmtree(store_path, ignore_errors=True)
+        os.replace(tmp, store_path)
+        marker.write_text(key)
+        return True
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+        self._store = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(_store=None, _pool=None, processes=0)
+        return state
+
+    def _with_prefixes(self, query: str) -> str:
+        missing = [
+            f"PREFIX {prefix}: <{iri}>"
+            for prefix, iri in _CORE_PREFIXES.items()
+            if f"{prefix}:" in query and not re.search(rf"PREFIX\s+{prefix}\s*:", query, re.IGNORECASE)
+        ]
+        if not missing:
+            return query
+        return "\n".join(missing) + "\n" + query
+
+    @property
+    def interruptible(self) -> bool:
+        return self._pool is not None
+
+    def execute(self, query: str, timeout: Optional[int] = None) -> QueryResult:
+        if self._pool is not None:
+            return self._pool.run(query, remaining(timeout or self.timeout))
+        return self._execute_local(query)
+
+    def _execute_local(self, query: str) -> QueryResult:
+        from pyoxigraph import QuerySolutions
+
+        result = self._store.query(self._with_prefixes(query))
+        raw = result if self.keep_raw else None
+
+        if isinstance(result, QuerySolutions):
+            columns = [variable.value for variable in result.variables]
+            values = [[] for _ in columns]
+            count = 0
+            truncated = False
+            for solution in result:
+                if self._over_limit(count):
+                    truncated = True
+                    break
+                for i, column in enumerate(values):
+                    column.append(solution[i])
+                count += 1
+
+            if not count:
+                return QueryResult(raw=raw)
+            values = [oxigraph_converter.column(column) for column in values]
+            return QueryResult(columns=columns, values=values, raw=raw, truncated=truncated)
+
+        elif isinstance(result, bool) or type(result).__name__ == "QueryBoolean":
+            return QueryResult(columns=["result"], values=[[bool(result)]], raw=raw)
+
+        return QueryResult(raw=raw)
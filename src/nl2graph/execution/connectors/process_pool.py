@@ -0,0 +1,265 @@
+import time
+import logging
+import threading
+import multiprocessing
+from typing import List, Optional, TYPE_CHECKING
+
+from ...base.timeout import TimeoutError
+from ..result.entity import QueryResult
+
+if TYPE_CHECKING:
+    from .base import BaseConnector
+
+
+logger = logging.getLogger(__name__)
+
+_START_ATTEMPTS = 3
+
+
+def _serve(connector: "BaseConnector", conn, load: bool) -> None:
+    if load:
+        connector.processes = 0
+        try:
+            connector.connect()
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+            return
+    conn.send(("ready",))
+
+    parent = multiprocessing.parent_process()
+    while True:
+        try:
+            if not conn.poll(1.0):
+                if parent is not None and not parent.is_alive():
+                    return
+                continue
+            query = conn.recv()
+        except (EOFError, OSError):
+            return
+        if query is None:
+            return
+
+        try:
+            result = connector._execute_local(query)
+            conn.send(("ok", result.columns, result.values, result.truncated))
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+
+class _Worker:
+
+    def __init__(self, ctx, connector: "BaseConnector"):
+        self.conn, child = ctx.Pipe()
+        load = ctx.get_start_method() != "fork" or not connector.fork_safe
+        self.process = ctx.Process(target=_serve, args=(connector, child, load), daemon=True)
+        self.process.start()
+        child.close()
+
+    def wait_ready(self, timeout: float) -> None:
+        # a worker only takes queries once its graph is loaded, so the load
+        # never counts against a query's timeout
+        try:
+            if not self.conn.poll(timeout):
+                raise TimeoutError(f"query worker did not load within {timeout:g}s")
+            reply = self.conn.recv()
+        except (EOFError, OSError) as e:
+            self.kill()
+            raise RuntimeError(f"query worker exited while loading: {e}") from e
+        except TimeoutError:
+            self.kill()
+            raise
+        if reply[0] != "ready":
+            self.kill()
+            raise RuntimeError(f"query worker failed to load: {reply[1]}")
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+class ProcessPool:
+
+    def __init__(self, connector: "BaseConnector", size: int, load_timeout: float = 600):
+        if size < 1:
+            raise ValueError(f"Pool size must be positive: {size}")
+
+        self._ctx = multiprocessing.get_context(self.start_method())
+        self._restart_ctx = None
+        self._connector = connector
+        self._cond = threading.Condition()
+        self._closed = False
+        self._missing = 0
+        self._start_error: Optional[Exception] = None
+        self.size = size
+        self.load_timeout = load_timeout
+        self.restarts = 0
+        self._replacements: List[threading.Thread] = []
+        self._workers: List[_Worker] = [_Worker(self._ctx, connector) for _ in range(size)]
+        deadline = time.monotonic() + load_timeout
+        try:
+            for worker in self._workers:
+                worker.wait_ready(max(deadline - time.monotonic(), 0.001))
+        except BaseException:
+            self.close()
+            raise
+        self._idle: List[_Worker] = list(self._workers)
+
+    @staticmethod
+    def start_method() -> str:
+        return "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+
+    @staticmethod
+    def restart_method() -> str:
+        # by the time a worker is replaced the parent runs query threads, and a
+        # fork could copy a lock one of them holds; replacements load the graph
+        # themselves from a clean process instead
+        return "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+    def _acquire(self, deadline: float, timeout: float) -> _Worker:
+        spawned = False
+        with self._cond:
+            while not self._idle:
+                if self._closed:
+                    raise RuntimeError("process pool is closed")
+                if self._missing:
+                    if spawned and self._start_error is not None:
+                        # the replacement started for this query failed too
+                        error, self._start_error = self._start_error, None
+                        raise error
+                    # a slot whose replacement failed to start; try again in
+                    # the background and wait for it within this query's timeout
+                    self._missing -= 1
+                    self._start_error = None
+                    self._spawn_replacement()
+                    spawned = True
+                    continue
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise TimeoutError(f"timeout after {timeout:g}s waiting for a query worker")
+                self._cond.wait(left)
+            return self._idle.pop()
+
+    def _release(self, worker: _Worker) -> None:
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                self._idle.append(worker)
+                self._cond.notify()
+        if closed:
+            worker.stop()
+
+    def _start(self) -> _Worker:
+        if self._restart_ctx is None:
+            self._restart_ctx = multiprocessing.get_context(self.restart_method())
+        for attempt in range(1, _START_ATTEMPTS + 1):
+            try:
+                worker = _Worker(self._restart_ctx, self._connector)
+                break
+            except Exception as e:
+                if attempt == _START_ATTEMPTS:
+                    raise RuntimeError(f"could not start query worker: {e}") from e
+                logger.warning(f"Starting query worker failed (attempt {attempt}): {e}")
+        # registered while loading, so close() stops a worker that is still loading
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                self._workers.append(worker)
+        if closed:
+            worker.kill()
+            raise RuntimeError("process pool is closed")
+
+        try:
+            worker.wait_ready(self.load_timeout)
+        except Exception:
+            self._discard(worker)
+            raise
+        with self._cond:
+            self.restarts += 1
+        return worker
+
+    def _discard(self, worker: _Worker) -> None:
+        with self._cond:
+            self._workers = [w for w in self._workers if w is not worker]
+
+    def _lose_slot(self) -> None:
+        with self._cond:
+            self._missing += 1
+            self._cond.notify_all()
+
+    def _replace(self, worker: _Worker) -> None:
+        # the caller that timed out returns at once; the replacement loads on
+        # its own thread and becomes idle only when it is ready
+        worker.kill()
+        self._discard(worker)
+        self._spawn_replacement()
+
+    def _spawn_replacement(self) -> None:
+        thread = threading.Thread(target=self._start_replacement, name="query-worker-restart", daemon=True)
+        with self._cond:
+            self._replacements = [t for t in self._replacements if t.is_alive()]
+            self._replacements.append(thread)
+        thread.start()
+
+    def _start_replacement(self) -> None:
+        try:
+            replacement = self._start()
+        except Exception as e:
+            # keep the slot; the next query to find no idle worker retries
+            with self._cond:
+                closed = self._closed
+            if not closed:
+                logger.warning(f"Replacing query worker failed: {e}")
+                with self._cond:
+                    self._start_error = e
+                self._lose_slot()
+            return
+        self._release(replacement)
+
+    def join_replacements(self, timeout: Optional[float] = None) -> None:
+        with self._cond:
+            threads = list(self._replacements)
+        for thread in threads:
+            thread.join(timeout)
+
+    def run(self, query: str, timeout: float) -> QueryResult:
+        # waiting for a free worker counts against the query's timeout
+        deadline = time.monotonic() + timeout
+        worker = self._acquire(deadline, timeout)
+        try:
+            worker.conn.send(query)
+            if not worker.conn.poll(max(deadline - time.monotonic(), 0)):
+                raise TimeoutError(f"timeout after {timeout:g}s")
+            reply = worker.conn.recv()
+        except TimeoutError:
+            self._replace(worker)
+            raise
+        except (EOFError, OSError) as e:
+            self._replace(worker)
+            raise RuntimeError(f"query worker exited: {e}") from e
+
+        self._release(worker)
+        if reply[0] == "error":
+            raise RuntimeError(reply[1])
+        _, columns, values, truncated = reply
+        return QueryResult(columns=columns, values=values, truncated=truncated)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            workers, self._workers, self._idle = self._workers, [], []
+            self._cond.notify_all()
+        for worker in workers:
+            worker.stop()
+        self.join_replacements()
@@ -1,42 +1,153 @@
+import gc
+import os
+import time
+import pickle
+import logging
+import threading
+from collections import OrderedDict
 from typing import Optional, TYPE_CHECKING
 from pathlib import Path
 
+from ...base.timeout import remaining
 from ..entity import QueryLanguage
+from ..parameterize import PARAM_PREFIX, parameterize_sparql
 from ..result.entity import QueryResult
-from ..result.converter import convert_rdf_value
+from ..result.converter import rdf_converter
 from .base import BaseConnector
+from .process_pool import ProcessPool
 
 if TYPE_CHECKING:
     from rdflib import Graph
+    from rdflib.plugins.sparql.sparql import Query
+
+
+logger = logging.getLogger(__name__)
 
 
 class RDFLibConnector(BaseConnector):
     query_language = QueryLanguage.SPARQL
+    fingerprint_settings = BaseConnector.fingerprint_settings + ("data_path", "data_format")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._graph: Optional["Graph"] = None
         self.data_path = kwargs.get('data_path')
         self.data_format = kwargs.get('data_format', 'turtle')
+        self.snapshot = kwargs.get('snapshot', True)
+        self.snapshot_path = kwargs.get('snapshot_path')
+        self.processes = kwargs.get('processes') or 0
+        self.load_timeout = kwargs.get('load_timeout') or 600
+        self._pool: Optional[ProcessPool] = None
+        self.prepared_cache_size = kwargs.get('prepared_cache_size', 1024)
+        self._prepared: "OrderedDict[str, Query | Exception]" = OrderedDict()
+        self._prepared_lock = threading.Lock()
+        self.prepared_hits = 0
+        self.prepared_misses = 0
+        self.load_time: Optional[float] = None
+        self.load_source: Optional[str] = None
 
     def connect(self) -> None:
         from rdflib import Graph
 
         self._graph = Graph()
+        self._prepared.clear()
         if self.data_path:
             path = Path(self.data_path)
             if path.exists():
-                self._graph.parse(str(path), format=self.data_format)
+                start = time.perf_counter()
+                self._graph, self.load_source = self._load_graph(path)
+                self.load_time = time.perf_counter() - start
+                logger.info(
+                    f"Loaded {len(self._graph)} triples from {self.load_source} "
+                    f"of {path.name} in {self.load_time:.2f}s"
+                )
+
+        if self.processes:
+            if ProcessPool.start_method() == "fork":
+                gc.freeze()
+            self._pool = ProcessPool(self, self.processes, load_timeout=self.load_timeout)
+
+    def _load_graph(self, path: Path):
+        from rdflib import Graph
+
+        if self.snapshot:
+            snapshot = self._snapshot_file(path)
+            key = self._snapshot_key(path)
+            graph = self._read_snapshot(snapshot, key)
+            if graph is not None:
+                return graph, "snapshot"
+
+        graph = Graph()
+        graph.parse(str(path), format=self.data_format)
+        if self.snapshot:
+            self._write_snapshot(snapshot, key, graph)
+        return graph, "source"
+
+    def _snapshot_file(self, path: Path) -> Path:
+        if self.snapshot_path:
+            return Path(self.snapshot_path)
+        return path.with_name(path.name + ".snapshot")
+
+    def _snapshot_key(self, path: Path) -> str:
+        import rdflib
+
+        stat = path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}:{self.data_format}:{rdflib.__version__}"
+
+    def _read_snapshot(self, snapshot: Path, key: str) -> Optional["Graph"]:
+        if not snapshot.exists():
+            return None
+
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(snapshot, "rb") as f:
+                if pickle.load(f) != key:
+                    return None
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable snapshot {snapshot}: {e}")
+            return None
+        finally:
+            if enabled:
+                gc.enable()
+
+    def _write_snapshot(self, snapshot: Path, key: str, graph: "Graph") -> None:
+        tmp = snapshot.with_name(snapshot.name + ".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, snapshot)
+        except OSError as e:
+            logger.warning(f"Could not write snapshot {snapshot}: {e}")
+            tmp.unlink(missing_ok=True)
 
     def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
         self._graph = None
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._prepared_lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.update(
+            _graph=None, _pool=None, processes=0,
+            _prepared=OrderedDict(), _prepared_lock=None,
+        )
+        return state
+
     def load_data(self, data: str, format: str = "turtle") -> None:
         from rdflib import Graph
 
         if self._graph is None:
             self._graph = Graph()
         self._graph.parse(data=data, format=format)
+        self._prepared.clear()
 
     def load_file(self, path: str, format: Optional[str] = None) -> None:
         from rdflib import Graph
@@ -44,29 +155,106 @@ class RDFLibConnector(BaseConnector):
         if self._graph is None:
             self._graph = Graph()
         self._graph.parse(path, format=format)
+        self._prepared.clear()
+
+    @property
+    def interruptible(self) -> bool:
+        return self._pool is not None
 
     def execute(self, query: str, timeout: Optional[int] = None) -> QueryResult:
-        result = self._graph.query(query)
-
-        if hasattr(result, "bindings"):
-            if not result.bindings:
-                return QueryResult(columns=[], rows=[], raw=result)
-
-            columns = [str(v) for v in result.vars]
-            rows = []
-            for binding in result.bindings:
-                row = {}
-                for var in result.vars:
-                    val = binding.get(var)
-                    row[str(var)] = convert_rdf_value(val)
-                rows.append(row)
-            return QueryResult(columns=columns, rows=rows, raw=result)
-
-        elif hasattr(result, "askAnswer"):
+        if self._pool is not None:
+            return self._pool.run(query, remaining(timeout or self.timeout))
+        return self._execute_local(query)
+
+    def _prepare(self, text: str, params=()) -> "Query":
+        from rdflib.plugins.sparql import prepareQuery
+
+        with self._prepared_lock:
+            prepared = self._prepared.get(text)
+            if prepared is not None:
+                self._prepared.move_to_end(text)
+                self.prepared_hits += 1
+            else:
+                self.prepared_misses += 1
+
+        if prepared is None:
+            try:
+                prepared = prepareQuery(text, initNs=dict(self._graph.namespaces()))
+                if params:
+                    self._reorder_bound(prepared, params)
+            except Exception as e:
+                prepared = e
+            if self.prepared_cache_size:
+                with self._prepared_lock:
+                    self._prepared[text] = prepared
+                    if len(self._prepared) > self.prepared_cache_size:
+                        self._prepared.popitem(last=False)
+
+        if isinstance(prepared, Exception):
+            raise prepared.with_traceback(None)
+        return prepared
+
+    @staticmethod
+    def _reorder_bound(prepared: "Query", params) -> None:
+        from rdflib import URIRef, Variable
+        from rdflib.plugins.sparql.algebra import reorderTriples, traverse
+        from rdflib.plugins.sparql.parserutils import CompValue
+
+        # BGP join order is fixed at translate time and ranks triples by their
+        # constant terms; order as if the lifted parameters were still inline.
+        shadow = {Variable(name): URIRef(f"urn:nl2graph:param:{name}") for name in params}
+        restore = {constant: variable for variable, constant in shadow.items()}
+
+        def visit(node):
+            if isinstance(node, CompValue) and node.name == "BGP":
+                triples = reorderTriples(
+                    tuple(shadow.get(term, term) for term in triple) for triple in node.triples
+                )
+                node["triples"] = [tuple(restore.get(term, term) for term in triple) for triple in triples]
+
+        traverse(prepared.algebra, visitPost=visit)
+
+    def _execute_local(self, query: str) -> QueryResult:
+        template, params = parameterize_sparql(query)
+        prepared = None
+        if params:
+            try:
+                prepared = self._prepare(template, params)
+            except Exception:
+                params = {}
+        if prepared is None:
+            prepared = self._prepare(query)
+        result = self._graph.query(prepared, initBindings=params)
+
+        raw = result if self.keep_raw else None
+        if result.type == "ASK":
             return QueryResult(
                 columns=["result"],
-                rows=[{"result": result.askAnswer}],
-                raw=result,
+                values=[[result.askAnswer]],
+                raw=raw,
             )
 
-        return QueryResult(columns=[], rows=[], raw=result)
+        elif hasattr(result, "bindings"):
+            bindings = result._genbindings if result._genbindings is not None else result.bindings
+            variables = [
+                v for v in result.vars or []
+                if not (params and v.startswith(PARAM_PREFIX))
+            ]
+            values = [[] for _ in variables]
+            count = 0
+            truncated = False
+            for binding in bindings:
+                if self._over_limit(count):
+                    truncated = True
+                    break
+                for column, var in zip(values, variables):
+                    column.append(binding.get(var))
+                count += 1
+
+            if not count:
+                return QueryResult(raw=raw)
+            columns = [str(v) for v in variables]
+            values = [rdf_converter.column(column) for column in values]
+            return QueryResult(columns=columns, values=values, raw=raw, truncated=truncated)
+
+        return QueryResult(raw=raw)
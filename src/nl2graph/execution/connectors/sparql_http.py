@@ -0,0 +1,253 @@
+import re
+import json
+import socket
+import base64
+import codecs
+import logging
+import threading
+import http.client
+from urllib.parse import urlsplit, urlencode
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...base.timeout import remaining, TimeoutError
+from ..entity import QueryLanguage
+from ..result.entity import QueryResult
+from ..result.converter import convert_sparql_json_value, convert_sparql_tsv_value
+from .base import BaseConnector
+
+
+logger = logging.getLogger(__name__)
+
+_ACCEPT = {
+    "json": "application/sparql-results+json",
+    # ASK has no TSV form, so let the endpoint answer it in JSON
+    "tsv": "text/tab-separated-values, application/sparql-results+json;q=0.9",
+}
+
+_VARS = re.compile(r'"vars"\s*:\s*(\[[^\]]*\])')
+_BINDINGS = re.compile(r'"bindings"\s*:\s*\[')
+_SEPARATORS = " \t\r\n,"
+
+# a kept-alive connection the server has already dropped fails on first use
+_STALE = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class _TextReader:
+
+    def __init__(self, response: http.client.HTTPResponse, chunk_size: int):
+        self._response = response
+        self._chunk_size = chunk_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def read(self) -> str:
+        chunk = self._response.read1(self._chunk_size)
+        return self._decoder.decode(chunk, final=not chunk)
+
+    def read_all(self) -> str:
+        return self._decoder.decode(self._response.read(), final=True)
+
+
+class SparqlHttpConnector(BaseConnector):
+    query_language = QueryLanguage.SPARQL
+    fingerprint_settings = BaseConnector.fingerprint_settings + ("endpoint",)
+    interruptible = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.endpoint = kwargs.get('endpoint') or f"http://{self.host}:{self.port}/sparql"
+        self.result_format = kwargs.get('result_format', 'json')
+        self.timeout_param = kwargs.get('timeout_param')
+        self.timeout_unit = kwargs.get('timeout_unit', 's')
+        self.chunk_size = kwargs.get('chunk_size', 65536)
+        if self.result_format not in _ACCEPT:
+            raise ValueError(f"Unsupported SPARQL result format: {self.result_format}")
+
+        url = urlsplit(self.endpoint)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported SPARQL endpoint scheme: {self.endpoint}")
+        self._scheme = url.scheme
+        self._netloc = url.netloc
+        self._path = url.path or "/"
+        if url.query:
+            self._path += "?" + url.query
+
+        self._headers = {
+            "Accept": _ACCEPT[self.result_format],
+            "Content-Type": "application/x-www-form-urlencoded; charset=utf-8",
+        }
+        if self.username:
+            token = base64.b64encode(f"{self.username}:{self.password or ''}".encode("utf-8")).decode("ascii")
+            self._headers["Authorization"] = f"Basic {token}"
+
+        self._connections: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def connect(self) -> None:
+        pass
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+
+    def _acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._connections:
+                return self._connections.pop(), True
+
+        factory = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        with self._lock:
+            self.connections_opened += 1
+        return factory(self._netloc, timeout=self.timeout), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            if len(self._connections) < self.workers:
+                self._connections.append(conn)
+                return
+        conn.close()
+
+    def _body(self, query: str, timeout: float) -> bytes:
+        form = {"query": query}
+        if self.timeout_param:
+            form[self.timeout_param] = str(int(timeout * 1000) if self.timeout_unit == "ms" else max(1, int(timeout)))
+        return urlencode(form).encode("utf-8")
+
+    def _send(self, query: str, timeout: float) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        body = self._body(query, timeout)
+        while True:
+            conn, reused = self._acquire()
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request("POST", self._path, body=body, headers=self._headers)
+                return conn, conn.getresponse()
+            except _STALE:
+                conn.close()
+                if not reused:
+                    raise
+                logger.debug("Reconnecting to %s after a stale keep-alive connection", self._netloc)
+            except Exception:
+                conn.close()
+                raise
+
+    def execute(self, query: str, timeout: Optional[int] = None) -> QueryResult:
+        timeout = remaining(timeout or self.timeout)
+        conn, response = self._send(query, timeout)
+        reusable = False
+        try:
+            if response.status >= 400:
+                message = response.read(2048).decode("utf-8", "replace").strip()
+                raise RuntimeError(f"SPARQL endpoint returned {response.status} {response.reason}: {message}")
+
+            content_type = (response.getheader("Content-Type") or "").split(";")[0].strip().lower()
+            if content_type == "text/tab-separated-values":
+                result = self._read_tsv(response)
+            elif content_type.endswith("json"):
+                result = self._read_json(response)
+            elif content_type == "text/boolean":
+                result = QueryResult(columns=["result"], values=[[response.read().strip() == b"true"]])
+            else:
+                raise RuntimeError(f"Unsupported SPARQL result type: {content_type or 'unknown'}")
+
+            reusable = not result.truncated and not response.will_close
+            return result
+        except socket.timeout:
+            raise TimeoutError(f"timeout after {timeout}s")
+        finally:
+            if reusable:
+                response.read()
+                self._release(conn)
+            else:
+                conn.close()
+
+    def _read_json(self, response: http.client.HTTPResponse) -> QueryResult:
+        reader = _TextReader(response, self.chunk_size)
+        text = ""
+        while True:
+            start = _BINDINGS.search(text)
+            if start:
+                break
+            chunk = reader.read()
+            if not chunk:
+                return self._from_document(json.loads(text))
+            text += chunk
+
+        head = _VARS.search(text, 0, start.start())
+        columns = json.loads(head.group(1)) if head else None
+        decoder = json.JSONDecoder()
+        rows: List[Dict[str, Any]] = []
+        truncated = False
+        pos = start.end()
+        while True:
+            while pos < len(text) and text[pos] in _SEPARATORS:
+                pos += 1
+            if pos < len(text) and text[pos] == "]":
+                break
+            if pos < len(text):
+                if self._over_limit(len(rows)):
+                    truncated = True
+                    break
+                try:
+                    binding, pos = decoder.raw_decode(text, pos)
+                    rows.append(binding)
+                    continue
+                except json.JSONDecodeError:
+                    pass
+            chunk = reader.read()
+            if not chunk:
+                raise RuntimeError("SPARQL endpoint closed the result stream early")
+            text = text[pos:] + chunk
+            pos = 0
+
+        # some endpoints (rdflib among them) serialize "head" after "results"
+        if columns is None and not truncated:
+            head = _VARS.search(text[pos:] + reader.read_all())
+            columns = json.loads(head.group(1)) if head else None
+        return self._to_result(columns, rows, truncated)
+
+    def _from_document(self, document: Dict[str, Any]) -> QueryResult:
+        raw = document if self.keep_raw else None
+        if "boolean" in document:
+            return QueryResult(columns=["result"], values=[[bool(document["boolean"])]], raw=raw)
+        rows = document.get("results", {}).get("bindings", [])
+        return self._to_result(document.get("head", {}).get("vars"), rows, False)
+
+    def _to_result(self, columns: Optional[List[str]], rows: List[Dict[str, Any]], truncated: bool) -> QueryResult:
+        raw = rows if self.keep_raw else None
+        if not rows:
+            return QueryResult(raw=raw, truncated=truncated)
+        if columns is None:
+            columns = list(dict.fromkeys(name for row in rows for name in row))
+        values = [[convert_sparql_json_value(row.get(column)) for row in rows] for column in columns]
+        return QueryResult(columns=columns, values=values, raw=raw, truncated=truncated)
+
+    def _read_tsv(self, response: http.client.HTTPResponse) -> QueryResult:
+        header = response.readline().decode("utf-8").rstrip("\r\n")
+        columns = [name.lstrip("?$") for name in header.split("\t")] if header else []
+        values = [[] for _ in columns]
+        raw = [] if self.keep_raw else None
+        count = 0
+        truncated = False
+        for line in response:
+            line = line.decode("utf-8").rstrip("\r\n")
+            if not line and len(columns) > 1:
+                continue
+            if self._over_limit(count):
+                truncated = True
+                break
+            terms = line.split("\t")
+            for column, term in zip(values, terms):
+                column.append(convert_sparql_tsv_value(term))
+            for column in values[len(terms):]:
+                column.append(None)
+            if raw is not None:
+                raw.append(terms)
+            count += 1
+
+        if not count:
+            return QueryResult(raw=raw, truncated=truncated)
+        return QueryResult(columns=columns, values=values, raw=raw, truncated=truncated)
@@ -1,31 +1,94 @@
-from typing import List, Any
+import asyncio
+import threading
+from typing import Dict, List, Any, Optional, Tuple
 
 from .connectors.base import BaseConnector
-from ..base.timeout import with_timeout
+from .cache import QueryCache, connector_fingerprint
+from .normalize import canonical_query, query_hash
+from .result.entity import QueryResult
+from ..base.timeout import with_timeout, get_timeout, deadline
 from ..data.entity import Result, ExecutionResult
+from ..data.repository import ResultRepository
 
 
 class Execution:
 
-    def __init__(self, connector: BaseConnector):
+    def __init__(
+        self,
+        connector: BaseConnector,
+        store: Optional[ResultRepository] = None,
+        dataset: str = "",
+        cache: Optional[QueryCache] = None,
+        batch_size: int = 500,
+    ):
         self.connector = connector
+        self.store = store
+        self.dataset = dataset
+        self.cache = cache
+        self.batch_size = batch_size
+        # cached and deduplicated results are only reused by the same connector setup
+        self._fingerprint = connector_fingerprint(connector) if cache is not None or store is not None else None
+        # dedup writes are held back and saved in one transaction per batch
+        self._pending: Dict[Tuple[str, str], ExecutionResult] = {}
+        self._pending_lock = threading.Lock()
 
-    @with_timeout("execution.timeout")
+    @with_timeout("execution.timeout", cooperative=lambda execution: execution.connector.interruptible)
     def execute(self, result: Result) -> ExecutionResult:
-        if not result.gen or not result.gen.query:
+        output = self._lookup(result)
+        if output is not None:
+            return output
+
+        try:
+            query_result = self.connector.execute(result.gen.query)
+        except Exception as e:
             return ExecutionResult(
                 success=False,
-                error="no query to execute",
+                error=str(e),
             )
 
-        query = result.gen.query
+        return self._complete(result, query_result)
+
+    def execute_many(self, results: List[Result]) -> List[ExecutionResult]:
+        if not self.connector.supports_batch:
+            return [self.execute(result) for result in results]
 
+        outputs: List[Optional[ExecutionResult]] = [self._lookup(result) for result in results]
+        pending = [i for i, output in enumerate(outputs) if output is None]
+        if not pending:
+            return outputs
+
+        # the batch gets the execution timeout of each of its queries
+        timeout = get_timeout("execution.timeout")
         try:
-            exec_result = self.connector.execute(query)
-            answer = self._extract_answer(exec_result.rows)
+            with deadline(timeout * len(pending) if timeout is not None else None):
+                query_results = self.connector.execute_many([results[i].gen.query for i in pending])
+        except Exception as e:
+            query_results = [e] * len(pending)
+
+        for i, query_result in zip(pending, query_results):
+            if isinstance(query_result, Exception):
+                outputs[i] = ExecutionResult(success=False, error=str(query_result))
+            else:
+                outputs[i] = self._complete(results[i], query_result)
+        return outputs
+
+    async def execute_async(self, result: Result) -> ExecutionResult:
+        # lookups and writes touch SQLite, so keep them off the event loop
+        output = await asyncio.to_thread(self._lookup, result)
+        if output is not None:
+            return output
+
+        # the connector gets the same timeout, so the server stops the
+        # query when the wait below gives up on it
+        timeout = get_timeout("execution.timeout")
+        try:
+            query_result = await asyncio.wait_for(
+                self.connector.execute_async(result.gen.query, timeout), timeout
+            )
+        except asyncio.TimeoutError:
             return ExecutionResult(
-                result=answer,
-                success=True,
+                success=False,
+                error=f"timeout after {timeout}s",
             )
         except Exception as e:
             return ExecutionResult(
@@ -33,16 +96,101 @@ class Execution:
                 error=str(e),
             )
 
-    def _extract_answer(self, rows: List[dict]) -> List[Any]:
-        if not rows:
-            return []
+        return await asyncio.to_thread(self._complete, result, query_result)
+
+    async def aconnect(self) -> None:
+        await self.connector.aconnect()
+
+    async def aclose(self) -> None:
+        await self.connector.aclose()
+
+    def _lookup(self, result: Result) -> Optional[ExecutionResult]:
+        if not result.gen or not result.gen.query:
+            return ExecutionResult(
+                success=False,
+                error="no query to execute",
+            )
+
+        query = result.gen.query
+        order = canonical_query(query, result.lang).order
+        if self.store is not None:
+            stored = self._stored(result.lang, query_hash(query, result.lang))
+            if stored is not None:
+                answer = self._reorder_rows(stored.result, _inverse(order))
+                return stored.model_copy(update={"result": answer, "cached": True})
+
+        if self.cache is not None:
+            cached = self.cache.get(self._cache_key(result))
+            if cached is not None:
+                return self._complete(result, self._reorder_columns(cached, _inverse(order)), cached=True)
+
+        return None
+
+    # cache and store entries hold columns in canonical order, so queries
+    # that only list their RETURN items differently share them
+    def _complete(self, result: Result, query_result: QueryResult, cached: bool = False) -> ExecutionResult:
+        order = canonical_query(result.gen.query, result.lang).order
+        if self.cache is not None and not cached:
+            canonical = self._reorder_columns(query_result, order)
+            self.cache.put(self._cache_key(result), self.dataset, result.lang, canonical)
+
+        output = ExecutionResult(
+            result=self._extract_answer(query_result),
+            success=True,
+            cached=cached,
+            truncated=query_result.truncated,
+        )
+        if self.store is not None:
+            canonical = output.model_copy(update={"result": self._reorder_rows(output.result, order)})
+            with self._pending_lock:
+                self._pending[(result.lang, query_hash(result.gen.query, result.lang))] = canonical
+                full = len(self._pending) >= self.batch_size
+            if full:
+                self.flush()
+        return output
+
+    def _stored(self, lang: str, key: str) -> Optional[ExecutionResult]:
+        with self._pending_lock:
+            pending = self._pending.get((lang, key))
+        if pending is not None:
+            return pending
+        return self.store.get_query_execution(self.dataset, lang, self._fingerprint, key)
+
+    def flush(self) -> int:
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        return self.store.save_query_execution_many(
+            (self.dataset, lang, self._fingerprint, key, output) for (lang, key), output in pending.items()
+        )
+
+    def _cache_key(self, result: Result) -> str:
+        return self.cache.make_key(self.dataset, result.lang, result.gen.query, self._fingerprint)
+
+    @staticmethod
+    def _reorder_columns(query_result: QueryResult, order: Tuple[int, ...]) -> QueryResult:
+        if not order or len(query_result.columns) != len(order):
+            return query_result
+        return query_result.model_copy(update={
+            "columns": [query_result.columns[i] for i in order],
+            "values": [query_result.values[i] for i in order],
+        })
+
+    @staticmethod
+    def _reorder_rows(answer: Optional[List[Any]], order: Tuple[int, ...]) -> Optional[List[Any]]:
+        if not order or not answer or not all(isinstance(row, list) and len(row) == len(order) for row in answer):
+            return answer
+        return [[row[i] for i in order] for row in answer]
+
+    def _extract_answer(self, result: QueryResult) -> List[Any]:
+        if len(result.values) == 1:
+            return list(result.values[0])
+        return [list(row) for row in zip(*result.values)]
 
-        answers = []
-        for row in rows:
-            values = list(row.values())
-            if len(values) == 1:
-                answers.append(values[0])
-            else:
-                answers.append(values)
 
-        return answers
+def _inverse(order: Tuple[int, ...]) -> Tuple[int, ...]:
+    inverse = [0] * len(order)
+    for position, original in enumerate(order):
+        inverse[original] = position
+    return tuple(inverse)
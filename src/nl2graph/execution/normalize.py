@@ -0,0 +1,293 @@
+import re
+import json
+import hashlib
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .tokens import CYPHER_TOKEN, GREMLIN_TOKEN, unescape_sparql, unescape_quoted
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    return _WHITESPACE.sub(" ", query).strip().rstrip(";").rstrip()
+
+
+class CanonicalQuery(NamedTuple):
+    text: str
+    # order[i] is the position in the original query of canonical column i;
+    # empty when the columns keep their original order
+    order: Tuple[int, ...] = ()
+
+
+class _Unparsable(Exception):
+    pass
+
+
+_CYPHER_KEYWORDS = {
+    "MATCH", "OPTIONAL", "WHERE", "RETURN", "WITH", "AS", "AND", "OR", "XOR", "NOT", "DISTINCT",
+    "ORDER", "BY", "ASC", "ASCENDING", "DESC", "DESCENDING", "SKIP", "LIMIT", "UNWIND", "UNION",
+    "ALL", "CALL", "YIELD", "CREATE", "MERGE", "DELETE", "DETACH", "SET", "REMOVE", "ON", "IN",
+    "IS", "NULL", "TRUE", "FALSE", "CASE", "WHEN", "THEN", "ELSE", "END", "STARTS", "ENDS",
+    "CONTAINS", "EXISTS", "COUNT", "COLLECT", "FOREACH",
+}
+_CYPHER_SUBQUERY = {"CALL", "EXISTS", "COUNT", "COLLECT"}
+_CYPHER_RETURN_END = {"ORDER", "SKIP", "LIMIT"}
+_OPEN = {"(": ")", "[": "]", "{": "}"}
+
+
+def _cypher_tokens(query: str) -> List[Tuple[str, str]]:
+    tokens = []
+    for match in CYPHER_TOKEN.finditer(query):
+        kind, text = match.lastgroup, match.group()
+        if kind == "comment":
+            continue
+        if kind == "other" and text in "'\"`":
+            raise _Unparsable(query)
+        tokens.append((kind, text))
+    while tokens and tokens[-1][1] == ";":
+        tokens.pop()
+    return tokens
+
+
+def _canonical_cypher(query: str) -> CanonicalQuery:
+    tokens = _cypher_tokens(query)
+    out: List[str] = []
+    depths: List[int] = []
+    variables: Dict[str, str] = {}
+    stack: List[str] = []
+    labels = False
+    after_label = False
+    map_key = False
+    yielding = False
+
+    for i, (kind, text) in enumerate(tokens):
+        before = tokens[i - 1][1] if i else ""
+        after = tokens[i + 1][1] if i + 1 < len(tokens) else ""
+        depths.append(len(stack))
+
+        if kind == "other":
+            # label expressions continue through ":", "|", "&" and "!"
+            labels = (text == ":" and not map_key) or (text in "|&!" and after_label)
+            after_label = False
+            if text in _OPEN:
+                subquery = text == "{" and before.upper() in _CYPHER_SUBQUERY
+                stack.append("q" if subquery else text)
+            elif text in ")]}" and stack:
+                stack.pop()
+            map_key = False
+            out.append(text)
+            continue
+
+        is_label, labels, after_label, map_key = labels, False, False, False
+        if kind == "string":
+            out.append(json.dumps(unescape_quoted(text)))
+        elif kind != "ident" or text.startswith("$"):
+            out.append(text)
+        elif is_label:
+            after_label = True
+            out.append(text)
+        elif before == ".":
+            out.append(text)
+        elif after == ":" and stack and stack[-1] == "{":
+            map_key = True
+            out.append(text)
+        elif text.upper() in _CYPHER_KEYWORDS:
+            word = text.upper()
+            if word == "YIELD":
+                yielding = True
+            elif word != "AS":
+                yielding = False
+            out.append(word)
+        elif yielding and before.upper() != "AS":
+            # procedure outputs are selected by name
+            out.append(text)
+        elif after == "(" or (after == "." and _is_namespace(tokens, i)):
+            # function names are case-insensitive; namespaces are not
+            out.append(text.lower() if after == "(" else text)
+        else:
+            if text not in variables:
+                variables[text] = f"v{len(variables)}"
+            out.append(variables[text])
+
+    order = _sorted_return(out, depths)
+    return CanonicalQuery(" ".join(out), order)
+
+
+def _is_namespace(tokens: List[Tuple[str, str]], i: int) -> bool:
+    while i + 2 < len(tokens) and tokens[i + 1][1] == "." and tokens[i + 2][0] == "ident":
+        i += 2
+    return i + 1 < len(tokens) and tokens[i + 1][1] == "("
+
+
+def _sorted_return(out: List[str], depths: List[int]) -> Tuple[int, ...]:
+    top = [i for i, token in enumerate(out) if depths[i] == 0]
+    if any(out[i] == "UNION" for i in top):
+        return ()
+    returns = [i for i in top if out[i] == "RETURN"]
+    if not returns:
+        return ()
+
+    start = returns[-1] + 1
+    if start < len(out) and out[start] == "DISTINCT":
+        start += 1
+    items: List[List[str]] = [[]]
+    for i in range(start, len(out)):
+        if depths[i] == 0 and out[i] in _CYPHER_RETURN_END:
+            break
+        if depths[i] == 0 and out[i] == ",":
+            items.append([])
+        else:
+            items[-1].append(out[i])
+    if len(items) < 2 or ["*"] in items:
+        return ()
+
+    order = tuple(sorted(range(len(items)), key=lambda k: items[k]))
+    if order == tuple(range(len(items))):
+        return ()
+    end = start + sum(len(item) for item in items) + len(items) - 1
+    ordered: List[str] = []
+    for k in order:
+        ordered.extend([","] * bool(ordered) + items[k])
+    out[start:end] = ordered
+    return order
+
+
+_SPARQL_CANONICAL_TOKEN = re.compile(r'''
+    (?P<string>"""(?:[^"\\]|\\.|"(?!""))*"""|\'\'\'(?:[^'\\]|\\.|'(?!''))*\'\'\'
+              |"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    (?P<lang>@[A-Za-z]+(?:-[A-Za-z0-9]+)*)?
+  | (?P<iri><[^<>"{}|^`\\\x00-\x20]*>)
+  | (?P<comment>\#[^\n]*)
+  | (?P<var>[?$]\w+)
+  | (?P<bnode>_:[\w.-]*\w)
+  | (?P<pname>(?:[A-Za-z][\w.-]*\w|[A-Za-z])?:(?:[\w.-]*\w)?)
+  | (?P<number>\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)
+  | (?P<word>[A-Za-z_]\w*)
+  | (?P<other>\|\||&&|!=|<=|>=|\^\^|\S)
+''', re.X)
+
+
+def _canonical_sparql(query: str) -> CanonicalQuery:
+    tokens = []
+    for match in _SPARQL_CANONICAL_TOKEN.finditer(query):
+        kind, text = match.lastgroup, match.group()
+        if kind == "lang":
+            kind = "string"
+        if kind == "comment":
+            continue
+        if kind == "other" and text in "'\"":
+            raise _Unparsable(query)
+        tokens.append((kind, text, match))
+
+    prefixes: Dict[str, str] = {}
+    variables: Dict[str, str] = {}
+    out: List[str] = []
+    i = 0
+    while i < len(tokens):
+        kind, text, match = tokens[i]
+        if (
+            kind == "word" and text.upper() == "PREFIX" and i + 2 < len(tokens)
+            and tokens[i + 1][0] == "pname" and tokens[i + 2][0] == "iri"
+        ):
+            prefixes[tokens[i + 1][1][:-1]] = tokens[i + 2][1][1:-1]
+            i += 3
+            continue
+
+        if kind == "var":
+            name = text[1:]
+            if name not in variables:
+                variables[name] = f"?v{len(variables)}"
+            out.append(variables[name])
+        elif kind == "pname":
+            prefix, _, local = text.partition(":")
+            out.append(f"<{prefixes[prefix]}{local}>" if prefix in prefixes else text)
+        elif kind == "string":
+            body = match.group("string")
+            body = body[3:-3] if body[:3] in ('"""', "'''") else body[1:-1]
+            out.append(json.dumps(unescape_sparql(body)) + (match.group("lang") or "").lower())
+        elif kind == "word" and text != "a":
+            out.append(text.upper())
+        else:
+            out.append(text)
+        i += 1
+
+    while out and out[-1] == ";":
+        out.pop()
+    return CanonicalQuery(" ".join(out))
+
+
+# strings in these steps name step labels, which are free to rename
+_GREMLIN_LABEL_STEPS = {"as", "select", "where"}
+
+
+def _canonical_gremlin(query: str) -> CanonicalQuery:
+    tokens = []
+    for match in GREMLIN_TOKEN.finditer(query):
+        kind, text = match.lastgroup, match.group()
+        if kind == "long" or (kind == "other" and text in "'\""):
+            raise _Unparsable(query)
+        if kind != "comment":
+            tokens.append((kind, text))
+    while tokens and tokens[-1][1] == ";":
+        tokens.pop()
+
+    # the step each string is an argument of, and whether it may name a label
+    calls: List[Optional[str]] = []
+    owners: List[Optional[str]] = []
+    positions: List[bool] = []
+    for i, (kind, text) in enumerate(tokens):
+        if text == "(":
+            calls.append(tokens[i - 1][1] if i and tokens[i - 1][0] == "ident" else None)
+        elif text == ")" and calls:
+            calls.pop()
+        owners.append(calls[-1] if calls else None)
+        positions.append(kind == "string" and bool(calls) and (
+            calls[-1] in _GREMLIN_LABEL_STEPS or (len(calls) > 1 and calls[-2] == "where")
+        ))
+
+    defined = {
+        unescape_quoted(text) for (kind, text), owner in zip(tokens, owners)
+        if kind == "string" and owner == "as"
+    }
+    labels: Dict[str, str] = {}
+    out: List[str] = []
+    for (kind, text), position in zip(tokens, positions):
+        if kind != "string":
+            out.append(text)
+            continue
+        value = unescape_quoted(text)
+        if position and value in defined:
+            if value not in labels:
+                labels[value] = f"l{len(labels)}"
+            value = labels[value]
+        out.append(json.dumps(value))
+    return CanonicalQuery(" ".join(out))
+
+
+_CANONICALIZERS = {
+    "cypher": _canonical_cypher,
+    "sparql": _canonical_sparql,
+    "gremlin": _canonical_gremlin,
+}
+
+
+@lru_cache(maxsize=8192)
+def canonical_query(query: str, lang: str) -> CanonicalQuery:
+    canonicalizer = _CANONICALIZERS.get(str(getattr(lang, "value", lang)).lower())
+    if canonicalizer is None:
+        return CanonicalQuery(normalize_query(query))
+    try:
+        return canonicalizer(query)
+    except _Unparsable:
+        return CanonicalQuery(normalize_query(query))
+
+
+def canonicalize(query: str, lang: str) -> str:
+    return canonical_query(query, lang).text
+
+
+def query_hash(query: str, lang: Optional[str] = None) -> str:
+    text = canonicalize(query, lang) if lang else normalize_query(query)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
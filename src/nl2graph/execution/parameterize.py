@@ -0,0 +1,136 @@
+import re
+from typing import Any, Dict, Tuple
+
+from .tokens import SPARQL_TOKEN, CYPHER_TOKEN, GREMLIN_TOKEN, unescape_sparql, unescape_quoted
+
+
+PARAM_PREFIX = "__p"
+
+_SPARQL_UNSAFE = {"VALUES", "SERVICE", "MINUS", "BASE", "CONSTRUCT", "DESCRIBE"}
+
+
+def parameterize_sparql(query: str) -> Tuple[str, Dict[str, Any]]:
+    from rdflib import Literal, URIRef
+
+    parts = []
+    bindings: Dict[str, Any] = {}
+    names: Dict[Tuple, str] = {}
+    depth = 0
+    selects = 0
+    last = 0
+    datatype = False
+
+    def lift(key, term):
+        if key not in names:
+            names[key] = f"{PARAM_PREFIX}{len(names)}"
+            bindings[names[key]] = term
+        return f" ?{names[key]} "
+
+    for match in SPARQL_TOKEN.finditer(query):
+        kind = match.lastgroup if match.lastgroup != "suffix" else "string"
+        text = match.group(kind)
+        replacement = None
+
+        if datatype:
+            datatype = kind == "comment"
+        elif kind == "word":
+            word = text.upper()
+            if word in _SPARQL_UNSAFE:
+                return query, {}
+            if word == "SELECT":
+                selects += 1
+                if selects > 1:
+                    return query, {}
+        elif kind == "brace":
+            depth += 1 if text == "{" else -1
+        elif kind == "string" and depth > 0:
+            suffix = match.group("suffix") or ""
+            if suffix == "^^":
+                datatype = True
+            else:
+                body = text[3:-3] if text[:3] in ('"""', "'''") else text[1:-1]
+                lang = suffix[1:] or None
+                replacement = lift(("literal", body, lang), Literal(unescape_sparql(body), lang=lang))
+        elif kind == "iri" and depth > 0 and ":" in text:
+            iri = text[1:-1]
+            replacement = lift(("iri", iri), URIRef(iri))
+
+        if replacement is not None:
+            parts.append(query[last:match.start()])
+            parts.append(replacement)
+            last = match.end()
+
+    if not bindings:
+        return query, {}
+    parts.append(query[last:])
+    return "".join(parts), bindings
+
+
+_CYPHER_CLAUSES = {
+    "ORDER", "SKIP", "LIMIT", "UNION", "MATCH", "OPTIONAL", "WITH", "UNWIND", "CALL", "}",
+}
+
+_FLOAT = re.compile(r"\d+\.\d+(?:[eE][+-]?\d+)?|\d+[eE][+-]?\d+")
+
+
+def _lift_literals(
+    query: str, pattern, marker: str, floats: bool = False, unsafe=(), projection: bool = False
+) -> Tuple[str, Dict[str, Any]]:
+    tokens = list(pattern.finditer(query))
+    parts = []
+    params: Dict[str, Any] = {}
+    names: Dict[Tuple, str] = {}
+    last = 0
+    returning = False
+
+    for i, match in enumerate(tokens):
+        kind = match.lastgroup
+        text = match.group()
+        if kind in unsafe or (kind == "other" and text in "'\"`"):
+            return query, {}
+
+        # unaliased RETURN items are named after their text, so keep them inline
+        if projection and (kind == "ident" or text == "}"):
+            word = text.upper()
+            if word == "RETURN":
+                returning = True
+            elif word in _CYPHER_CLAUSES:
+                returning = False
+
+        value = None
+        if returning:
+            pass
+        elif kind == "string":
+            value = unescape_quoted(text)
+        elif kind == "number":
+            before = tokens[i - 1].group() if i else ""
+            after = tokens[i + 1].group() if i + 1 < len(tokens) else ""
+            if before in ("*", "..") or after == "..":
+                pass
+            elif text.isdigit():
+                value = int(text)
+            elif floats and _FLOAT.fullmatch(text):
+                value = float(text)
+        if value is None:
+            continue
+
+        key = (type(value).__name__, value)
+        if key not in names:
+            names[key] = f"{PARAM_PREFIX}{len(names)}"
+            params[names[key]] = value
+        parts.append(query[last:match.start()])
+        parts.append(f"{marker}{names[key]}")
+        last = match.end()
+
+    if not params:
+        return query, {}
+    parts.append(query[last:])
+    return "".join(parts), params
+
+
+def parameterize_cypher(query: str) -> Tuple[str, Dict[str, Any]]:
+    return _lift_literals(query, CYPHER_TOKEN, "$", floats=True, projection=True)
+
+
+def parameterize_gremlin(query: str) -> Tuple[str, Dict[str, Any]]:
+    return _lift_literals(query, GREMLIN_TOKEN, "", unsafe=("long",))
@@ -1,105 +1,262 @@
-from typing import Any
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import date, datetime, time
 
 
-def convert_neo4j_value(value: Any) -> Any:
-    if value is None:
-        return None
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+_UNSEEN = object()
+
+
+class ValueConverter:
+
+    def __init__(self, by_name: Dict[str, Callable[[Any], Any]], by_base: Tuple = ()):
+        self._by_name = by_name
+        self._by_base = by_base + ((list, self._list), (dict, self._dict))
+        self._by_type: Dict[type, Optional[Callable[[Any], Any]]] = dict.fromkeys(_SCALARS)
+        self.convert = self._dispatcher()
+
+    def _list(self, value: list) -> list:
+        return [self.convert(v) for v in value]
+
+    def _dict(self, value: dict) -> dict:
+        return {k: self.convert(v) for k, v in value.items()}
+
+    def _resolve(self, cls: type) -> Optional[Callable[[Any], Any]]:
+        handler = self._by_name.get(cls.__name__)
+        if handler is None:
+            handler = next((fn for base, fn in self._by_base if issubclass(cls, base)), None)
+        self._by_type[cls] = handler
+        return handler
+
+    # a closure over the table calls much faster than a bound __call__
+    def _dispatcher(self) -> Callable[[Any], Any]:
+        lookup = self._by_type.get
+        resolve = self._resolve
+
+        def convert(value: Any) -> Any:
+            handler = lookup(type(value), _UNSEEN)
+            if handler is _UNSEEN:
+                handler = resolve(type(value))
+            return value if handler is None else handler(value)
+
+        return convert
+
+    # scalar columns pass through unchanged; the sample spares driver-typed
+    # columns the full type scan
+    def column(self, values: List[Any], sample: int = 32) -> List[Any]:
+        if _SCALARS.issuperset(map(type, values[:sample])) and _SCALARS.issuperset(map(type, values)):
+            return values
+        return list(map(self.convert, values))
+
+
+def _neo4j_duration(value: Any) -> Dict[str, int]:
+    return {
+        "months": value.months,
+        "days": value.days,
+        "seconds": value.seconds,
+        "nanoseconds": value.nanoseconds,
+    }
+
+
+def _neo4j_node(value: Any) -> Dict[str, Any]:
+    return {
+        "id": value.element_id,
+        "labels": list(value.labels),
+        "properties": dict(value),
+    }
 
-    type_name = type(value).__name__
 
-    if type_name == "Date":
-        return date(value.year, value.month, value.day)
-    elif type_name == "DateTime":
-        return datetime(
+def _neo4j_relationship(value: Any) -> Dict[str, Any]:
+    return {
+        "id": value.element_id,
+        "type": value.type,
+        "start": value.start_node.element_id,
+        "end": value.end_node.element_id,
+        "properties": dict(value),
+    }
+
+
+neo4j_converter = ValueConverter(
+    {
+        "Date": lambda value: date(value.year, value.month, value.day),
+        "DateTime": lambda value: datetime(
             value.year, value.month, value.day,
             value.hour, value.minute, value.second, value.nanosecond // 1000
-        )
-    elif type_name == "Time":
-        return time(value.hour, value.minute, value.second, value.nanosecond // 1000)
-    elif type_name == "Duration":
-        return {
-            "months": value.months,
-            "days": value.days,
-            "seconds": value.seconds,
-            "nanoseconds": value.nanoseconds,
-        }
-    elif type_name == "Node":
+        ),
+        "Time": lambda value: time(value.hour, value.minute, value.second, value.nanosecond // 1000),
+        "Duration": _neo4j_duration,
+        "Node": _neo4j_node,
+        "Relationship": _neo4j_relationship,
+        "Path": lambda value: {
+            "nodes": [_neo4j_node(n) for n in value.nodes],
+            "relationships": [_neo4j_relationship(r) for r in value.relationships],
+        },
+    },
+)
+convert_neo4j_value = neo4j_converter.convert
+
+
+def _kuzu_id(value: Any) -> Any:
+    if isinstance(value, dict) and "table" in value and "offset" in value:
+        return f"{value['table']}:{value['offset']}"
+    return value
+
+
+def _kuzu_properties(value: dict) -> Dict[str, Any]:
+    return {k: convert_kuzu_value(v) for k, v in value.items() if not k.startswith("_")}
+
+
+def _kuzu_dict(value: dict) -> Dict[str, Any]:
+    if "_nodes" in value and "_rels" in value:
         return {
-            "id": value.element_id,
-            "labels": list(value.labels),
-            "properties": dict(value),
+            "nodes": [convert_kuzu_value(n) for n in value["_nodes"]],
+            "relationships": [convert_kuzu_value(r) for r in value["_rels"]],
         }
-    elif type_name == "Relationship":
+    elif "_src" in value and "_dst" in value:
         return {
-            "id": value.element_id,
-            "type": value.type,
-            "start": value.start_node.element_id,
-            "end": value.end_node.element_id,
-            "properties": dict(value),
+            "id": _kuzu_id(value.get("_id")),
+            "type": value.get("_label"),
+            "start": _kuzu_id(value["_src"]),
+            "end": _kuzu_id(value["_dst"]),
+            "properties": _kuzu_properties(value),
         }
-    elif type_name == "Path":
+    elif "_id" in value and "_label" in value:
         return {
-            "nodes": [convert_neo4j_value(n) for n in value.nodes],
-            "relationships": [convert_neo4j_value(r) for r in value.relationships],
+            "id": _kuzu_id(value["_id"]),
+            "labels": [value["_label"]],
+            "properties": _kuzu_properties(value),
         }
-    elif isinstance(value, list):
-        return [convert_neo4j_value(v) for v in value]
-    elif isinstance(value, dict):
-        return {k: convert_neo4j_value(v) for k, v in value.items()}
+    return {k: convert_kuzu_value(v) for k, v in value.items()}
 
-    return value
+
+kuzu_converter = ValueConverter(
+    {
+        "timedelta": lambda value: {
+            "months": 0,
+            "days": value.days,
+            "seconds": value.seconds,
+            "nanoseconds": value.microseconds * 1000,
+        },
+    },
+    ((dict, _kuzu_dict),),
+)
+convert_kuzu_value = kuzu_converter.convert
+
+
+# Literal.value is what toPython() returns, or None when rdflib has no mapping
+def _rdf_literal(value: Any) -> Any:
+    py_value = value.value
+    return str(value) if py_value is None else py_value
+
+
+rdf_converter = ValueConverter({
+    "URIRef": str,
+    "Literal": _rdf_literal,
+    "BNode": lambda value: f"_:{value}",
+})
+convert_rdf_value = rdf_converter.convert
+
+
+_XSD = "http://www.w3.org/2001/XMLSchema#"
+_XSD_STRING = _XSD + "string"
 
 
-def convert_rdf_value(value: Any) -> Any:
-    if value is None:
+def _typed_literal(lexical: str, datatype: Optional[str]) -> Any:
+    if datatype is None or datatype == _XSD_STRING:
+        return lexical
+    from rdflib import Literal, URIRef
+    return convert_rdf_value(Literal(lexical, datatype=URIRef(datatype)))
+
+
+def _oxigraph_literal(value: Any) -> Any:
+    if value.language:
+        return value.value
+    return _typed_literal(value.value, value.datatype.value)
+
+
+oxigraph_converter = ValueConverter(
+    {
+        "NamedNode": lambda value: value.value,
+        "BlankNode": lambda value: f"_:{value.value}",
+        "Literal": _oxigraph_literal,
+    },
+    ((object, None),),
+)
+convert_oxigraph_value = oxigraph_converter.convert
+
+
+def convert_sparql_json_value(term: Any) -> Any:
+    if term is None:
         return None
 
-    type_name = type(value).__name__
-
-    if type_name == "URIRef":
-        return str(value)
-    elif type_name == "Literal":
-        py_value = value.toPython()
-        if isinstance(py_value, type(value)):
-            return str(value)
-        return py_value
-    elif type_name == "BNode":
-        return f"_:{value}"
-    elif isinstance(value, list):
-        return [convert_rdf_value(v) for v in value]
-    elif isinstance(value, dict):
-        return {k: convert_rdf_value(v) for k, v in value.items()}
+    kind = term.get("type")
 
-    return value
+    if kind == "uri":
+        return term["value"]
+    elif kind == "bnode":
+        return f"_:{term['value']}"
+    elif kind in ("literal", "typed-literal"):
+        if "xml:lang" in term:
+            return term["value"]
+        return _typed_literal(term["value"], term.get("datatype"))
 
+    return term.get("value")
 
-def convert_gremlin_value(value: Any) -> Any:
-    if value is None:
+
+_TSV_LITERAL = re.compile(r'"(.*)"(?:@[A-Za-z0-9-]+|\^\^<([^>]*)>)?', re.S)
+_TSV_ESCAPE = re.compile(r"\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)")
+_TSV_ESCAPES = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f"}
+_TSV_NUMBERS = (
+    (re.compile(r"[+-]?\d+"), _XSD + "integer"),
+    (re.compile(r"[+-]?\d*\.\d+"), _XSD + "decimal"),
+    (re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)[eE][+-]?\d+"), _XSD + "double"),
+    (re.compile(r"true|false"), _XSD + "boolean"),
+)
+
+
+def _unescape_tsv(text: str) -> str:
+    def replace(match):
+        code = match.group(1)
+        if code[0] in "uU" and len(code) > 1:
+            return chr(int(code[1:], 16))
+        return _TSV_ESCAPES.get(code, code)
+    return _TSV_ESCAPE.sub(replace, text)
+
+
+def convert_sparql_tsv_value(text: str) -> Any:
+    if not text:
         return None
 
-    type_name = type(value).__name__
+    if text[0] == "<" and text[-1] == ">":
+        return text[1:-1]
+    elif text.startswith("_:"):
+        return text
 
-    if type_name == "Vertex":
-        return {
-            "id": value.id,
-            "label": value.label,
-        }
-    elif type_name == "Edge":
-        return {
-            "id": value.id,
-            "label": value.label,
-            "inV": value.inV.id,
-            "outV": value.outV.id,
-        }
-    elif type_name == "Path":
-        return {
-            "labels": [list(labels) for labels in value.labels],
-            "objects": [convert_gremlin_value(o) for o in value.objects],
-        }
-    elif isinstance(value, list):
-        return [convert_gremlin_value(v) for v in value]
-    elif isinstance(value, dict):
-        return {k: convert_gremlin_value(v) for k, v in value.items()}
+    match = _TSV_LITERAL.fullmatch(text)
+    if match:
+        return _typed_literal(_unescape_tsv(match.group(1)), match.group(2))
 
-    return value
+    for pattern, datatype in _TSV_NUMBERS:
+        if pattern.fullmatch(text):
+            return _typed_literal(text, datatype)
+
+    return text
+
+
+gremlin_converter = ValueConverter({
+    "Vertex": lambda value: {
+        "id": value.id,
+        "label": value.label,
+    },
+    "Edge": lambda value: {
+        "id": value.id,
+        "label": value.label,
+        "inV": value.inV.id,
+        "outV": value.outV.id,
+    },
+    "Path": lambda value: {
+        "labels": [list(labels) for labels in value.labels],
+        "objects": [convert_gremlin_value(o) for o in value.objects],
+    },
+})
+convert_gremlin_value = gremlin_converter.convert
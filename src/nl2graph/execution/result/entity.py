@@ -1,25 +1,55 @@
 from typing import List, Dict, Any, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
+
+
+def _row_answer(row: Dict[str, Any]) -> Any:
+    values = list(row.values())
+    return values[0] if len(values) == 1 else values
 
 
 class QueryResult(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     columns: List[str] = []
-    rows: List[Dict[str, Any]] = []
+    values: List[List[Any]] = []
     raw: Optional[Any] = None
+    truncated: bool = False
+
+    @model_validator(mode="before")
+    @classmethod
+    def _from_rows(cls, data: Any) -> Any:
+        if not isinstance(data, dict) or "rows" not in data:
+            return data
+
+        data = dict(data)
+        rows = data.pop("rows") or []
+        columns = list(data.get("columns") or [])
+        if not columns and rows:
+            columns = list(rows[0])
+            if not columns or any(list(row) != columns for row in rows[1:]):
+                # rows with their own keys each keep the answer they gave alone
+                data["columns"] = ["value"]
+                data["values"] = [[_row_answer(row) for row in rows]]
+                return data
+        data["columns"] = columns
+        data["values"] = [[row.get(col) for row in rows] for col in columns]
+        return data
+
+    @property
+    def rows(self) -> List[Dict[str, Any]]:
+        return [dict(zip(self.columns, row)) for row in zip(*self.values)]
 
     @property
     def is_empty(self) -> bool:
-        return len(self.rows) == 0
+        return self.row_count == 0
 
     @property
     def row_count(self) -> int:
-        return len(self.rows)
+        return len(self.values[0]) if self.values else 0
 
     def to_list(self) -> List[Dict[str, Any]]:
         return self.rows
 
     def to_values(self) -> List[List[Any]]:
-        return [[row.get(col) for col in self.columns] for row in self.rows]
+        return [list(row) for row in zip(*self.values)]
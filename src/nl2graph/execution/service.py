@@ -3,7 +3,10 @@ from typing import Dict
 from ..base import ConfigService
 from .connectors.base import BaseConnector
 from .connectors.neo4j import Neo4jConnector
+from .connectors.kuzu import KuzuConnector
 from .connectors.rdflib import RDFLibConnector
+from .connectors.oxigraph import OxigraphConnector
+from .connectors.sparql_http import SparqlHttpConnector
 from .connectors.gremlin import GremlinConnector
 
 
@@ -12,7 +15,7 @@ class GraphService:
         self._config = config
         self._connectors: Dict[str, BaseConnector] = {}
 
-    def get_connector(self, dataset: str, lang: str) -> BaseConnector:
+    def get_connector(self, dataset: str, lang: str, workers: int = 1) -> BaseConnector:
         key = f"{dataset}/{lang}"
         if key in self._connectors:
             return self._connectors[key]
@@ -21,17 +24,23 @@ class GraphService:
         if not config:
             raise KeyError(f"connection not found: data.{dataset}.connection.{lang}")
 
-        connector = self._create_connector(lang, config)
+        connector = self._create_connector(lang, {**config, "workers": workers})
         connector.connect()
         self._connectors[key] = connector
         return connector
 
     def _create_connector(self, lang: str, config: dict) -> BaseConnector:
-        config = {**config, "name": lang}
+        config = {"keep_raw": bool(self._config.get("execution.debug")), **config, "name": lang}
 
         if lang == "cypher":
+            if config.get("engine") == "embedded":
+                return KuzuConnector(**config)
             return Neo4jConnector(**config)
         elif lang == "sparql":
+            if config.get("engine") == "oxigraph":
+                return OxigraphConnector(**config)
+            if config.get("engine") == "http":
+                return SparqlHttpConnector(**config)
             return RDFLibConnector(**config)
         elif lang == "gremlin":
             return GremlinConnector(**config)
@@ -0,0 +1,57 @@
+import re
+
+
+SPARQL_TOKEN = re.compile(r'''
+    (?P<string>"""(?:[^"\\]|\\.|"(?!""))*"""|\'\'\'(?:[^'\\]|\\.|'(?!''))*\'\'\'
+              |"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    (?P<suffix>@[A-Za-z]+(?:-[A-Za-z0-9]+)*|\^\^)?
+  | (?P<iri><[^<>"{}|^`\\\x00-\x20]*>)
+  | (?P<comment>\#[^\n]*)
+  | (?P<var>[?$]\w+)
+  | (?P<word>\w+)
+  | (?P<brace>[{}])
+''', re.X)
+
+CYPHER_TOKEN = re.compile(r'''
+    (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<ident>`(?:[^`]|``)*`|[A-Za-z_]\w*|\$\w+)
+  | (?P<number>0[xX][0-9A-Fa-f]+|0o[0-7]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<range>\.\.)
+  | (?P<other>\S)
+''', re.X | re.S)
+
+GREMLIN_TOKEN = re.compile(r'''
+    (?P<long>\'\'\'|""")
+  | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\$]|\\.)*")
+  | (?P<gstring>"(?:[^"\\]|\\.)*")
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<ident>[A-Za-z_]\w*)
+  | (?P<number>\d+(?:\.\d+)?(?:[eE][+-]?\d+)?[A-Za-z]?)
+  | (?P<range>\.\.)
+  | (?P<other>\S)
+''', re.X | re.S)
+
+_ESCAPES = {"t": "\t", "n": "\n", "r": "\r", "b": "\b", "f": "\f"}
+_SPARQL_ESCAPE = re.compile(r"\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)")
+
+
+def unescape_sparql(text: str) -> str:
+    def replace(match):
+        code = match.group(1)
+        if code[0] in "uU" and len(code) > 1:
+            return chr(int(code[1:], 16))
+        return _ESCAPES.get(code, code)
+    return _SPARQL_ESCAPE.sub(replace, text)
+
+
+_QUOTED_ESCAPE = re.compile(r"\\(u[0-9A-Fa-f]{4}|.)", re.S)
+
+
+def unescape_quoted(text: str) -> str:
+    def replace(match):
+        code = match.group(1)
+        if code[0] == "u" and len(code) > 1:
+            return chr(int(code[1:], 16))
+        return _ESCAPES.get(code, code)
+    return _QUOTED_ESCAPE.sub(replace, text[1:-1])
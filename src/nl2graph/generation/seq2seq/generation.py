@@ -47,7 +47,7 @@ class Generation:
         self.model = self.model.to(self.device)
         self.model.eval()
 
-    @with_timeout("generation.seq2seq.timeout")
+    @with_timeout("generation.seq2seq.timeout", cooperative=False)
     def generate(self, question: str, schema: Optional[BaseSchema] = None) -> GenerationOutput:
         encoded = self.tokenizer(
             question,
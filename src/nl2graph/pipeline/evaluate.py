@@ -3,6 +3,7 @@ from typing import List, Literal
 from tqdm import tqdm
 
 from ..data import Record
+from ..data.buffer import ResultBuffer
 from ..data.repository import ResultRepository
 from ..evaluation import Scoring
 
@@ -20,6 +21,8 @@ class EvaluatePipeline:
         model: str,
         scoring: Scoring = None,
         if_exists: IfExists = "skip",
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
     ):
         self.dst = dst
         self.method = method
@@ -27,24 +30,17 @@ class EvaluatePipeline:
         self.model = model
         self.scoring = scoring or Scoring()
         self.if_exists = if_exists
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
 
     def run(self, records: List[Record]) -> List[Record]:
-        has_exec = []
-        for r in records:
-            if not self.dst.exists(r.id, self.method, self.lang, self.model):
-                continue
-            result = self.dst.get(r.id, self.method, self.lang, self.model)
-            if result.exec is not None:
-                has_exec.append(r)
+        status = self.dst.stage_status(self.method, self.lang, self.model, "eval")
+        has_exec = [r for r in records if r.id in status]
         if len(has_exec) < len(records):
             tqdm.write(f"Skipping {len(records) - len(has_exec)} records without execution")
 
         if self.if_exists == "skip":
-            pending = []
-            for r in has_exec:
-                result = self.dst.get(r.id, self.method, self.lang, self.model)
-                if result.eval is None:
-                    pending.append(r)
+            pending = [r for r in has_exec if not status[r.id]]
             if len(pending) < len(has_exec):
                 tqdm.write(f"Skipping {len(has_exec) - len(pending)} existing records")
         else:
@@ -53,9 +49,10 @@ class EvaluatePipeline:
         if not pending:
             return records
 
-        for record in tqdm(pending, desc="Evaluating"):
-            result = self.dst.get(record.id, self.method, self.lang, self.model)
-            eval_result = self.scoring.evaluate(record, result)
-            self.dst.save_evaluation(record.id, self.method, self.lang, self.model, eval_result)
+        with ResultBuffer(self.dst, "eval", self.batch_size, self.flush_interval) as buffer:
+            for record in tqdm(pending, desc="Evaluating"):
+                result = self.dst.get(record.id, self.method, self.lang, self.model, stages=("exec",), validate=False)
+                eval_result = self.scoring.evaluate(record, result)
+                buffer.add(record.id, self.method, self.lang, self.model, eval_result)
 
         return records
@@ -1,9 +1,11 @@
-from typing import List, Literal
+import asyncio
+from typing import List, Literal, Set, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from tqdm import tqdm
 
-from ..data import Record, ExecutionResult
+from ..data import Record, Result, ExecutionResult
+from ..data.buffer import ResultBuffer
 from ..data.repository import ResultRepository
 from ..execution import Execution
 
@@ -22,6 +24,10 @@ class ExecutePipeline:
         model: str,
         workers: int = 1,
         if_exists: IfExists = "skip",
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        chunk_size: int = 1,
+        concurrency: int = 0,
     ):
         self.execution = execution
         self.dst = dst
@@ -30,18 +36,19 @@ class ExecutePipeline:
         self.model = model
         self.workers = workers
         self.if_exists = if_exists
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.chunk_size = max(chunk_size, 1)
+        self.concurrency = concurrency
 
     def run(self, records: List[Record]) -> List[Record]:
-        has_gen = [r for r in records if self.dst.exists(r.id, self.method, self.lang, self.model)]
+        status = self.dst.stage_status(self.method, self.lang, self.model, "exec")
+        has_gen = [r for r in records if r.id in status]
         if len(has_gen) < len(records):
             tqdm.write(f"Skipping {len(records) - len(has_gen)} records without generation")
 
         if self.if_exists == "skip":
-            pending = []
-            for r in has_gen:
-                result = self.dst.get(r.id, self.method, self.lang, self.model)
-                if result.exec is None:
-                    pending.append(r)
+            pending = [r for r in has_gen if not status[r.id]]
             if len(pending) < len(has_gen):
                 tqdm.write(f"Skipping {len(has_gen) - len(pending)} existing records")
         else:
@@ -50,25 +57,97 @@ class ExecutePipeline:
         if not pending:
             return records
 
-        if self.workers > 1:
-            self._run_parallel(pending)
-        else:
-            for record in tqdm(pending, desc="Executing"):
-                result = self.dst.get(record.id, self.method, self.lang, self.model)
-                exec_result = self.execution.execute(result)
-                self.dst.save_execution(record.id, self.method, self.lang, self.model, exec_result)
+        chunks = [pending[i:i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+        try:
+            with ResultBuffer(self.dst, "exec", self.batch_size, self.flush_interval) as buffer:
+                if self.concurrency > 0:
+                    asyncio.run(self._run_async(pending, buffer))
+                elif self.workers > 1:
+                    self._run_parallel(chunks, len(pending), buffer)
+                else:
+                    with tqdm(total=len(pending), desc="Executing") as progress:
+                        for chunk in chunks:
+                            self._write(buffer, self._execute_chunk(chunk))
+                            progress.update(len(chunk))
+        finally:
+            self.execution.flush()
 
         return records
 
-    def _run_parallel(self, records: List[Record]) -> None:
-        def _execute_one(record: Record) -> tuple[Record, ExecutionResult]:
-            result = self.dst.get(record.id, self.method, self.lang, self.model)
-            return record, self.execution.execute(result)
+    def _execute_chunk(self, records: List[Record]) -> List[Tuple[Record, ExecutionResult]]:
+        results = self._load(records)
+        if len(records) == 1:
+            return [(records[0], self.execution.execute(results[0]))]
+        return list(zip(records, self.execution.execute_many(results)))
 
+    def _run_parallel(self, chunks: List[List[Record]], total: int, buffer: ResultBuffer) -> None:
         with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            future_to_record = {
-                executor.submit(_execute_one, r): r for r in records
-            }
-            for future in tqdm(as_completed(future_to_record), total=len(records), desc="Executing"):
-                record, exec_result = future.result()
-                self.dst.save_execution(record.id, self.method, self.lang, self.model, exec_result)
+            futures = [executor.submit(self._execute_chunk, chunk) for chunk in chunks]
+            with tqdm(total=total, desc="Executing") as progress:
+                for future in as_completed(futures):
+                    outputs = future.result()
+                    self._write(buffer, outputs)
+                    progress.update(len(outputs))
+
+    def _load(self, records: List[Record]) -> List[Result]:
+        return [
+            self.dst.get(record.id, self.method, self.lang, self.model, stages=("gen",), validate=False)
+            for record in records
+        ]
+
+    def _write(self, buffer: ResultBuffer, outputs: List[Tuple[Record, ExecutionResult]]) -> None:
+        for record, exec_result in outputs:
+            buffer.add(record.id, self.method, self.lang, self.model, exec_result)
+
+    async def _run_async(self, records: List[Record], buffer: ResultBuffer) -> None:
+        # SQLite reads and writes go through worker threads in batches, so the
+        # event loop only ever waits on the queries themselves
+        semaphore = asyncio.Semaphore(self.concurrency)
+        write_lock = asyncio.Lock()
+        tasks: Set[asyncio.Task] = set()
+        errors: List[BaseException] = []
+        finished: List[Tuple[Record, ExecutionResult]] = []
+
+        async def _write(outputs: List[Tuple[Record, ExecutionResult]]) -> None:
+            async with write_lock:
+                await asyncio.to_thread(self._write, buffer, outputs)
+
+        async def _execute_one(record: Record, result: Result) -> None:
+            nonlocal finished
+            try:
+                exec_result = await self.execution.execute_async(result)
+                finished.append((record, exec_result))
+                progress.update(1)
+                if len(finished) >= self.batch_size:
+                    outputs, finished = finished, []
+                    await _write(outputs)
+            finally:
+                semaphore.release()
+
+        def _done(task: asyncio.Task) -> None:
+            tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                errors.append(task.exception())
+
+        await self.execution.aconnect()
+        try:
+            with tqdm(total=len(records), desc="Executing") as progress:
+                for start in range(0, len(records), self.concurrency):
+                    window = records[start:start + self.concurrency]
+                    results = await asyncio.to_thread(self._load, window)
+                    for record, result in zip(window, results):
+                        await semaphore.acquire()
+                        if errors:
+                            raise errors[0]
+                        task = asyncio.create_task(_execute_one(record, result))
+                        tasks.add(task)
+                        task.add_done_callback(_done)
+                await asyncio.gather(*tasks)
+                if errors:
+                    raise errors[0]
+                await _write(finished)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.execution.aclose()
@@ -4,6 +4,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
 from ..data import Record, GenerationOutput, GenerationResult
+from ..data.buffer import ResultBuffer
 from ..data.repository import ResultRepository
 from ..data.schema.base import BaseSchema
 
@@ -28,6 +29,8 @@ class GeneratePipeline:
         model: str,
         workers: int = 1,
         if_exists: IfExists = "skip",
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
     ):
         self.generator = generator
         self.dst = dst
@@ -36,10 +39,13 @@ class GeneratePipeline:
         self.model = model
         self.workers = workers
         self.if_exists = if_exists
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
 
     def run(self, records: List[Record], schema: Optional[BaseSchema] = None) -> List[Record]:
         if self.if_exists == "skip":
-            pending = [r for r in records if not self.dst.exists(r.id, self.method, self.lang, self.model)]
+            status = self.dst.stage_status(self.method, self.lang, self.model, "gen")
+            pending = [r for r in records if not status.get(r.id, False)]
             if len(pending) < len(records):
                 tqdm.write(f"Skipping {len(records) - len(pending)} existing records")
         else:
@@ -48,20 +54,21 @@ class GeneratePipeline:
         if not pending:
             return records
 
-        if self.workers > 1:
-            self._run_parallel(pending, schema)
-        else:
-            for record in tqdm(pending, desc="Generating"):
-                output = self.generator.generate(record.question, schema)
-                self._save(record, output)
+        with ResultBuffer(self.dst, "gen", self.batch_size, self.flush_interval) as buffer:
+            if self.workers > 1:
+                self._run_parallel(pending, schema, buffer)
+            else:
+                for record in tqdm(pending, desc="Generating"):
+                    output = self.generator.generate(record.question, schema)
+                    self._save(buffer, record, output)
 
         return records
 
-    def _save(self, record: Record, output: GenerationOutput) -> None:
+    def _save(self, buffer: ResultBuffer, record: Record, output: GenerationOutput) -> None:
         gen = GenerationResult(query=output.content, stats=output.stats)
-        self.dst.save_generation(record.id, self.method, self.lang, self.model, gen)
+        buffer.add(record.id, self.method, self.lang, self.model, gen)
 
-    def _run_parallel(self, records: List[Record], schema: Optional[BaseSchema]) -> None:
+    def _run_parallel(self, records: List[Record], schema: Optional[BaseSchema], buffer: ResultBuffer) -> None:
         def _generate_one(record: Record) -> tuple[Record, GenerationOutput]:
             return record, self.generator.generate(record.question, schema)
 
@@ -71,4 +78,4 @@ class GeneratePipeline:
             }
             for future in tqdm(as_completed(future_to_record), total=len(records), desc="Generating"):
                 record, output = future.result()
-                self._save(record, output)
+                self._save(buffer, record, output)
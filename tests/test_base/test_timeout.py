@@ -0,0 +1,122 @@
+import time
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from nl2graph.base.timeout import Watchdog, with_timeout, remaining, TimeoutError
+
+
+class Worker:
+
+    def __init__(self):
+        self.seen = None
+
+    @with_timeout("test.timeout")
+    def run(self, seconds: float, fail: bool = False) -> str:
+        self.seen = remaining()
+        time.sleep(seconds)
+        if fail:
+            raise RuntimeError("interrupted")
+        return "done"
+
+
+class Stuck:
+
+    @with_timeout("test.timeout", cooperative=False)
+    def run(self, seconds: float, fail: bool = False) -> str:
+        time.sleep(seconds)
+        if fail:
+            raise RuntimeError("failed")
+        return "done"
+
+
+class TestWatchdog:
+
+    def test_expires(self):
+        watchdog = Watchdog()
+        entry = watchdog.watch(0.05)
+        assert entry.expired.wait(1)
+
+    def test_disarm(self):
+        watchdog = Watchdog()
+        entry = watchdog.watch(0.05)
+        entry.disarm()
+        assert not entry.expired.wait(0.2)
+
+    def test_single_thread(self):
+        watchdog = Watchdog()
+        before = threading.active_count()
+        entries = [watchdog.watch(10) for _ in range(50)]
+        assert threading.active_count() <= before + 1
+        for entry in entries:
+            entry.disarm()
+
+
+class TestWithTimeout:
+
+    def test_no_timeout_configured(self):
+        with patch("nl2graph.base.timeout.get_timeout", return_value=None):
+            worker = Worker()
+            assert worker.run(0) == "done"
+        assert worker.seen is None
+
+    def test_deadline_visible(self):
+        with patch("nl2graph.base.timeout.get_timeout", return_value=5):
+            worker = Worker()
+            assert worker.run(0) == "done"
+        assert 4 < worker.seen <= 5
+        assert remaining() is None
+
+    def test_runs_in_calling_thread(self):
+        threads = []
+
+        class Probe:
+            @with_timeout("test.timeout")
+            def run(self):
+                threads.append(threading.current_thread())
+
+        with patch("nl2graph.base.timeout.get_timeout", return_value=5):
+            Probe().run()
+        assert threads == [threading.current_thread()]
+
+    def test_error_after_deadline_becomes_timeout(self):
+        with patch("nl2graph.base.timeout.get_timeout", return_value=0.05):
+            with pytest.raises(TimeoutError):
+                Worker().run(0.2, fail=True)
+
+    def test_error_before_deadline_propagates(self):
+        with patch("nl2graph.base.timeout.get_timeout", return_value=5):
+            with pytest.raises(RuntimeError):
+                Worker().run(0, fail=True)
+
+    def test_uncooperative_call_abandoned_at_deadline(self):
+        with patch("nl2graph.base.timeout.get_timeout", return_value=0.1):
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                Stuck().run(2)
+        assert time.monotonic() - start < 0.5
+
+    def test_uncooperative_call_completes(self):
+        with patch("nl2graph.base.timeout.get_timeout", return_value=5):
+            assert Stuck().run(0) == "done"
+            with pytest.raises(RuntimeError):
+                Stuck().run(0, fail=True)
+
+    def test_cooperative_per_instance(self):
+        class Probe:
+            def __init__(self, cooperates):
+                self.cooperates = cooperates
+                self.thread = None
+
+            @with_timeout("test.timeout", cooperative=lambda probe: probe.cooperates)
+            def run(self):
+                self.thread = threading.current_thread()
+                return remaining()
+
+        with patch("nl2graph.base.timeout.get_timeout", return_value=5):
+            inline, guarded = Probe(True), Probe(False)
+            assert 4 < inline.run() <= 5
+            assert 4 < guarded.run() <= 5
+        assert inline.thread is threading.current_thread()
+        assert guarded.thread is not threading.current_thread()
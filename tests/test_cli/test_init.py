@@ -274,6 +274,32 @@ class TestExport:
         assert result.exit_code == 0
         assert output_path.exists()
 
+    def test_export_with_filters(self, mock_config, temp_data_dir):
+        tmp_path, _ = temp_data_dir
+
+        from nl2graph.data.repository import ResultRepository
+        from nl2graph.data.entity import GenerationResult
+
+        with ResultRepository(str(tmp_path / "dst.db")) as dst:
+            dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+            dst.save_generation("q001", "llm", "sparql", "gpt-4o", GenerationResult(query="Q2"))
+
+        mock_ctx = Mock()
+        mock_ctx.resolve.return_value = mock_config
+
+        output_path = tmp_path / "output.jsonl"
+
+        with patch("nl2graph.cli.init.get_context", return_value=mock_ctx):
+            result = runner.invoke(app, [
+                "export", "test", "--output", str(output_path), "-l", "sparql", "-s", "gen",
+            ])
+
+        assert result.exit_code == 0
+        assert "Exported 1 results" in result.stdout
+        lines = [json.loads(line) for line in output_path.read_text().splitlines()]
+        assert lines[0]["gen"]["query"] == "Q2"
+        assert "exec" not in lines[0]
+
     def test_export_dst_not_configured(self):
         mock_config = Mock()
         mock_config.get.return_value = None
@@ -305,3 +331,108 @@ class TestExport:
 
         assert result.exit_code == 1
         assert "dst.db not found" in result.output
+
+
+class TestRecompress:
+
+    def test_recompress_success(self, mock_config, temp_data_dir):
+        tmp_path, _ = temp_data_dir
+
+        from nl2graph.data.repository import ResultRepository
+        from nl2graph.data.entity import GenerationResult
+
+        with ResultRepository(str(tmp_path / "dst.db")) as dst:
+            dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+
+        mock_ctx = Mock()
+        mock_ctx.resolve.return_value = mock_config
+
+        with patch("nl2graph.cli.recompress.get_context", return_value=mock_ctx):
+            result = runner.invoke(app, ["recompress", "test", "--codec", "zlib"])
+
+        assert result.exit_code == 0
+        assert "Re-encoded 1 results" in result.stdout
+
+        with ResultRepository(str(tmp_path / "dst.db")) as dst:
+            assert dst.codec.name == "zlib"
+            assert dst.get("q001", "llm", "cypher", "gpt-4o").gen.query == "Q1"
+
+    def test_recompress_unknown_codec(self, mock_config, temp_data_dir):
+        tmp_path, _ = temp_data_dir
+
+        from nl2graph.data.repository import ResultRepository
+
+        with ResultRepository(str(tmp_path / "dst.db")):
+            pass
+
+        mock_ctx = Mock()
+        mock_ctx.resolve.return_value = mock_config
+
+        with patch("nl2graph.cli.recompress.get_context", return_value=mock_ctx):
+            result = runner.invoke(app, ["recompress", "test", "--codec", "lzma"])
+
+        assert result.exit_code == 1
+        assert "Unknown codec" in result.output
+
+
+class TestCompare:
+
+    def _seed(self, tmp_path):
+        from nl2graph.data.repository import ResultRepository
+        from nl2graph.data.entity import GenerationResult, EvaluationResult
+
+        with ResultRepository(str(tmp_path / "dst.db")) as dst:
+            for model, scores in (("a", {"q001": 1.0, "q002": 0.0}), ("b", {"q001": 0.0, "q002": 0.0})):
+                for question_id, exact_match in scores.items():
+                    dst.save_generation(question_id, "llm", "cypher", model, GenerationResult(query="Q"))
+                    dst.save_evaluation(
+                        question_id, "llm", "cypher", model, EvaluationResult(exact_match=exact_match)
+                    )
+
+    def test_compare_json(self, mock_config, temp_data_dir):
+        tmp_path, _ = temp_data_dir
+        self._seed(tmp_path)
+
+        mock_ctx = Mock()
+        mock_ctx.resolve.return_value = mock_config
+
+        with patch("nl2graph.cli.compare.get_context", return_value=mock_ctx):
+            result = runner.invoke(app, [
+                "compare", "test", "-r", "llm/cypher/a", "-r", "llm/cypher/b", "--diff",
+            ])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert data["total"] == 2
+        assert data["solved"] == {"llm/cypher/a": 1, "llm/cypher/b": 0}
+        pair = data["pairs"][0]
+        assert (pair["both"], pair["only_a"], pair["only_b"], pair["neither"]) == (0, 1, 0, 1)
+        assert pair["only_a_ids"] == ["q001"]
+
+    def test_compare_markdown(self, mock_config, temp_data_dir):
+        tmp_path, _ = temp_data_dir
+        self._seed(tmp_path)
+
+        mock_ctx = Mock()
+        mock_ctx.resolve.return_value = mock_config
+
+        with patch("nl2graph.cli.compare.get_context", return_value=mock_ctx):
+            result = runner.invoke(app, [
+                "compare", "test", "-r", "llm/cypher/a", "-r", "llm/cypher/b", "-f", "markdown",
+            ])
+
+        assert result.exit_code == 0
+        assert "| llm/cypher/a | llm/cypher/b | 0 | 1 | 0 | 1 | 0.5000 |" in result.stdout
+
+    def test_compare_invalid_run(self, mock_config, temp_data_dir):
+        tmp_path, _ = temp_data_dir
+        self._seed(tmp_path)
+
+        mock_ctx = Mock()
+        mock_ctx.resolve.return_value = mock_config
+
+        with patch("nl2graph.cli.compare.get_context", return_value=mock_ctx):
+            result = runner.invoke(app, ["compare", "test", "-r", "llm/cypher", "-r", "llm/cypher/b"])
+
+        assert result.exit_code == 1
+        assert "expected method/lang/model" in result.output
@@ -1,9 +1,15 @@
 import pytest
 import tempfile
+import gzip
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 from nl2graph.data.repository import SourceRepository, ResultRepository
+from nl2graph.data.buffer import ResultBuffer
+from nl2graph.data.reader import iter_json_records
+from nl2graph.data.codec import CODECS, get_codec, decode
+from nl2graph.data.pool import ConnectionPool
 from nl2graph.data.entity import (
     Record,
     Result,
@@ -37,6 +43,31 @@ class TestSourceRepository:
         count = src.init_from_json(sample_json)
         assert count == 3
 
+    def test_init_from_jsonl(self, src, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_text(
+            '{"id": "q001", "question": "Q1", "answer": ["A1"], "hop": 1}\n'
+            '\n'
+            '{"id": "q002", "question": "Q2", "answer": ["A2"], "hop": 2}\n'
+        )
+        assert src.init_from_json(str(path)) == 2
+        assert src.get("q002").get_field("hop") == 2
+
+    def test_init_from_gzip(self, src, tmp_path):
+        path = tmp_path / "data.json.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump([{"id": f"q{i:03d}", "question": f"Q{i}", "answer": [i]} for i in range(25)], f)
+        assert src.init_from_json(str(path), batch_size=10) == 25
+        assert src.count() == 25
+        assert src.get("q024").answer == [24]
+
+    def test_init_from_json_invalid(self, src, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('[{"id": "q001", "question": "Q1", "answer": []}, {"id": ')
+        with pytest.raises(ValueError):
+            src.init_from_json(str(path))
+        assert src.count() == 0
+
     def test_get(self, src, sample_json):
         src.init_from_json(sample_json)
         record = src.get("q001")
@@ -73,6 +104,31 @@ class TestSourceRepository:
         assert len(hop1) == 2
         assert len(hop2) == 1
 
+    def test_iter_by_filter_multiple_fields(self, src, sample_json):
+        src.init_from_json(sample_json)
+        records = list(src.iter_by_filter(hop=1, id="q002"))
+        assert [r.id for r in records] == ["q002"]
+        assert len(list(src.iter_by_filter(hop=None))) == 3
+        assert list(src.iter_by_filter(split="test")) == []
+
+    def test_iter_by_filter_invalid_field(self, src, sample_json):
+        src.init_from_json(sample_json)
+        with pytest.raises(ValueError):
+            list(src.iter_by_filter(**{"hop') OR 1=1 --": 1}))
+
+    def test_init_from_json_creates_indexes(self, src, sample_json):
+        src.init_from_json(sample_json, index_fields=["topic"])
+        with src.pool.checkout() as conn:
+            rows = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'data'"
+            ).fetchall()
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM data WHERE json_extract(extra, '$.hop') = ?", (1,)
+            ).fetchall()
+        names = {row["name"] for row in rows}
+        assert {"idx_data_hop", "idx_data_split", "idx_data_topic"} <= names
+        assert any("idx_data_hop" in row["detail"] for row in plan)
+
     def test_context_manager(self, sample_json):
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = Path(tmpdir) / "src.db"
@@ -81,6 +137,97 @@ class TestSourceRepository:
                 assert src.count() == 3
 
 
+class TestConnectionPool:
+
+    @pytest.fixture
+    def pool(self, tmp_path):
+        pool = ConnectionPool(str(tmp_path / "test.db"), size=2, timeout=0.2)
+        yield pool
+        pool.close_all()
+
+    def test_reentrant_checkout(self, pool):
+        with pool.checkout() as outer:
+            with pool.checkout() as inner:
+                assert inner is outer
+            assert pool.idle_count == 0
+        assert pool.open_count == 1
+        assert pool.idle_count == 1
+
+    def test_bounded(self, pool):
+        import threading
+
+        held = threading.Event()
+        done = threading.Event()
+
+        def hold():
+            with pool.checkout():
+                held.set()
+                done.wait()
+
+        threads = [threading.Thread(target=hold) for _ in range(2)]
+        for t in threads:
+            t.start()
+            held.wait()
+            held.clear()
+
+        with pytest.raises(TimeoutError):
+            with pool.checkout():
+                pass
+
+        done.set()
+        for t in threads:
+            t.join()
+        assert pool.open_count == 2
+
+    def test_close_all_across_threads(self, pool):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def work(_):
+            with pool.checkout() as conn:
+                return conn.execute("SELECT 1").fetchone()[0]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(work, range(20))) == [1] * 20
+        assert pool.open_count <= 2
+
+        pool.close_all()
+        assert pool.open_count == 0
+
+    def test_pragma_profile(self, tmp_path):
+        pool = ConnectionPool(str(tmp_path / "test.db"), profile="bulk", pragmas={"cache_size": -1024})
+        with pool.checkout() as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -1024
+        pool.close_all()
+
+    def test_unknown_profile(self, tmp_path):
+        with pytest.raises(ValueError):
+            ConnectionPool(str(tmp_path / "test.db"), profile="unknown")
+
+
+class TestReader:
+
+    def test_iter_json_array_small_chunks(self, tmp_path):
+        records = [
+            {"id": "q001", "question": "What, is [1]?", "answer": [{"a": 1}]},
+            {"id": "q002", "question": "Q2", "answer": ["x" * 100]},
+        ]
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(records, indent=2))
+        assert list(iter_json_records(str(path), chunk_size=7)) == records
+
+    def test_iter_json_empty_array(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text("  [ ]  ")
+        assert list(iter_json_records(str(path))) == []
+
+    def test_iter_jsonl_invalid_line(self, tmp_path):
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"id": "q001"}\nnot json\n')
+        with pytest.raises(ValueError, match="data.jsonl:2"):
+            list(iter_json_records(str(path)))
+
+
 class TestResultRepository:
 
     @pytest.fixture
@@ -195,6 +342,38 @@ class TestResultRepository:
                 exported = json.load(rf)
         assert len(exported) == 2
 
+    def test_export_jsonl(self, dst, tmp_path):
+        dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        dst.save_generation("q002", "llm", "cypher", "gpt-4o", GenerationResult(query="Q2"))
+        dst.save_generation("q001", "llm", "sparql", "gpt-4o", GenerationResult(query="Q3"))
+        dst.save_execution("q001", "llm", "cypher", "gpt-4o", ExecutionResult(result=["A"], success=True))
+
+        path = tmp_path / "results.jsonl"
+        count = dst.export_jsonl(str(path), chunk_size=2)
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert count == 3
+        assert len(lines) == 3
+        assert {line["gen"]["query"] for line in lines} == {"Q1", "Q2", "Q3"}
+
+    def test_export_jsonl_filters(self, dst, tmp_path):
+        dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        dst.save_generation("q002", "llm", "cypher", "gpt-4o", GenerationResult(query="Q2"))
+        dst.save_generation("q001", "llm", "sparql", "gpt-4o", GenerationResult(query="Q3"))
+        dst.save_execution("q001", "llm", "cypher", "gpt-4o", ExecutionResult(result=["A"], success=True))
+
+        path = tmp_path / "results.jsonl.gz"
+        count = dst.export_jsonl(str(path), lang="cypher", stages=["exec"])
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        assert count == 1
+        assert lines == [{
+            "question_id": "q001",
+            "method": "llm",
+            "lang": "cypher",
+            "model": "gpt-4o",
+            "exec": {"result": ["A"], "success": True, "error": None, "cached": False, "truncated": False},
+        }]
+
     def test_multiple_configs_same_record(self, dst):
         dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="llm-cypher"))
         dst.save_generation("q001", "seq2seq", "cypher", "bart", GenerationResult(query="seq2seq-cypher"))
@@ -213,3 +392,281 @@ class TestResultRepository:
             with ResultRepository(str(db_path)) as dst:
                 dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult())
                 assert dst.count() == 1
+
+    def test_save_many(self, dst):
+        count = dst.save_generation_many([
+            (f"q{i:03d}", "llm", "cypher", "gpt-4o", GenerationResult(query=f"Q{i}"))
+            for i in range(100)
+        ])
+        assert count == 100
+        assert dst.count() == 100
+
+        dst.save_execution_many([
+            (f"q{i:03d}", "llm", "cypher", "gpt-4o", ExecutionResult(result=[i], success=True))
+            for i in range(100)
+        ])
+        dst.save_evaluation_many([
+            ("q007", "llm", "cypher", "gpt-4o", EvaluationResult(exact_match=1.0)),
+        ])
+        result = dst.get("q007", "llm", "cypher", "gpt-4o")
+        assert result.gen.query == "Q7"
+        assert result.exec.result == [7]
+        assert result.eval.exact_match == 1.0
+
+    def test_save_many_empty(self, dst):
+        assert dst.save_generation_many([]) == 0
+        assert dst.count() == 0
+
+    def test_save_many_rolls_back_on_error(self, dst):
+        rows = [
+            ("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1")),
+            ("q002", "llm", "cypher", "gpt-4o", None),
+        ]
+        with pytest.raises(AttributeError):
+            dst.save_generation_many(rows)
+        assert dst.count() == 0
+
+    def test_stage_status(self, dst):
+        dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        dst.save_generation("q002", "llm", "cypher", "gpt-4o", GenerationResult(query="Q2"))
+        dst.save_generation("q003", "llm", "sparql", "gpt-4o", GenerationResult(query="Q3"))
+        dst.save_execution("q001", "llm", "cypher", "gpt-4o", ExecutionResult(success=True))
+
+        assert dst.stage_status("llm", "cypher", "gpt-4o", "gen") == {"q001": True, "q002": True}
+        assert dst.stage_status("llm", "cypher", "gpt-4o", "exec") == {"q001": True, "q002": False}
+        assert dst.stage_status("llm", "cypher", "gpt-4o", "eval") == {"q001": False}
+
+    def test_pending_ids(self, dst):
+        dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        dst.save_generation("q002", "llm", "cypher", "gpt-4o", GenerationResult(query="Q2"))
+        dst.save_execution("q001", "llm", "cypher", "gpt-4o", ExecutionResult(success=True))
+        assert dst.pending_ids("llm", "cypher", "gpt-4o", "exec") == {"q002"}
+        assert dst.pending_ids("llm", "cypher", "gpt-4o", "eval") == {"q001"}
+        dst.clear_stage("llm", "cypher", "gpt-4o", "gen")
+        assert dst.pending_ids("llm", "cypher", "gpt-4o", "gen") == {"q001", "q002"}
+        assert dst.pending_ids("llm", "cypher", "gpt-4o", "exec") == set()
+
+    def test_stage_status_invalid_stage(self, dst):
+        with pytest.raises(ValueError):
+            dst.stage_status("llm", "cypher", "gpt-4o", "unknown")
+
+    def test_get_with_stages(self, dst):
+        dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        dst.save_execution("q001", "llm", "cypher", "gpt-4o", ExecutionResult(result=[1], success=True))
+        result = dst.get("q001", "llm", "cypher", "gpt-4o", stages=("exec",))
+        assert result.question_id == "q001"
+        assert result.gen is None
+        assert result.exec.result == [1]
+        assert result.eval is None
+
+    def test_get_with_invalid_stage(self, dst):
+        with pytest.raises(ValueError):
+            dst.get("q001", "llm", "cypher", "gpt-4o", stages=("unknown",))
+
+    def test_iter_by_config_without_validation(self, dst):
+        dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1", stats={"duration": 1.0}))
+        dst.save_execution("q001", "llm", "cypher", "gpt-4o", ExecutionResult(result=["A"], success=True))
+        dst.save_evaluation("q001", "llm", "cypher", "gpt-4o", EvaluationResult(exact_match=1.0))
+        validated = list(dst.iter_by_config("llm", "cypher", "gpt-4o"))
+        constructed = list(dst.iter_by_config("llm", "cypher", "gpt-4o", validate=False))
+        assert constructed[0].model_dump() == validated[0].model_dump()
+
+    def test_iter_by_config_with_stages(self, dst):
+        dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        dst.save_execution("q001", "llm", "cypher", "gpt-4o", ExecutionResult(result=["A"], success=True))
+        results = list(dst.iter_by_config("llm", "cypher", "gpt-4o", stages=("gen", "eval")))
+        assert results[0].gen.query == "Q1"
+        assert results[0].exec is None
+
+    def test_codec_persisted(self, tmp_path):
+        db_path = str(tmp_path / "dst.db")
+        with ResultRepository(db_path, codec="zlib") as dst:
+            dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+            with dst.pool.checkout() as conn:
+                raw = conn.execute("SELECT gen FROM data").fetchone()["gen"]
+            assert isinstance(raw, bytes)
+        with ResultRepository(db_path) as dst:
+            assert dst.codec.name == "zlib"
+            assert dst.get("q001", "llm", "cypher", "gpt-4o").gen.query == "Q1"
+
+    def test_mixed_codecs_readable(self, dst):
+        dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        dst.set_codec("zlib")
+        dst.save_execution("q001", "llm", "cypher", "gpt-4o", ExecutionResult(result=["A"], success=True))
+        result = dst.get("q001", "llm", "cypher", "gpt-4o")
+        assert result.gen.query == "Q1"
+        assert result.exec.result == ["A"]
+
+    def test_recompress(self, dst):
+        dst.save_generation_many([
+            (f"q{i:03d}", "llm", "cypher", "gpt-4o", GenerationResult(query=f"Q{i}"))
+            for i in range(10)
+        ])
+        dst.save_execution("q003", "llm", "cypher", "gpt-4o", ExecutionResult(result=["x"] * 50, success=True))
+        before = [r.model_dump() for r in dst.iter_all()]
+
+        assert dst.recompress("zlib", batch_size=3) == 10
+        with dst.pool.checkout() as conn:
+            rows = conn.execute("SELECT gen, exec FROM data").fetchall()
+        assert all(isinstance(row["gen"], bytes) for row in rows)
+        assert [r.model_dump() for r in dst.iter_all()] == before
+
+        assert dst.recompress("json") == 10
+        with dst.pool.checkout() as conn:
+            assert isinstance(conn.execute("SELECT gen FROM data").fetchone()["gen"], str)
+        assert [r.model_dump() for r in dst.iter_all()] == before
+
+    def test_unknown_codec(self, tmp_path):
+        with pytest.raises(ValueError):
+            ResultRepository(str(tmp_path / "dst.db"), codec="lzma")
+
+    def test_missing_codec_extras_only_fail_writes(self, tmp_path):
+        db_path = str(tmp_path / "dst.db")
+        with ResultRepository(db_path) as dst:
+            dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+            dst._set_meta("codec", "zstd")
+
+        with patch("nl2graph.data.codec.importlib.util.find_spec", return_value=None):
+            with ResultRepository(db_path) as dst:
+                assert dst.get("q001", "llm", "cypher", "gpt-4o").gen.query == "Q1"
+                with pytest.raises(ImportError):
+                    dst.save_generation("q002", "llm", "cypher", "gpt-4o", GenerationResult(query="Q2"))
+
+    def _evaluated(self, dst, model, solved):
+        for question_id, exact_match in solved.items():
+            dst.save_generation(question_id, "llm", "cypher", model, GenerationResult(query="Q"))
+            dst.save_evaluation(question_id, "llm", "cypher", model, EvaluationResult(exact_match=exact_match))
+
+    def test_score_columns(self, dst):
+        self._evaluated(dst, "gpt-4o", {"q001": 1.0})
+        with dst.pool.checkout() as conn:
+            assert conn.execute("SELECT exact_match FROM data").fetchone()["exact_match"] == 1.0
+        dst.save_execution("q001", "llm", "cypher", "gpt-4o", ExecutionResult(result=[], success=True))
+        with dst.pool.checkout() as conn:
+            assert conn.execute("SELECT exact_match FROM data").fetchone()["exact_match"] is None
+
+    def test_score_columns_backfilled(self, tmp_path):
+        db_path = tmp_path / "dst.db"
+        with ResultRepository(str(db_path)) as dst:
+            self._evaluated(dst, "gpt-4o", {"q001": 1.0, "q002": 0.0})
+            with dst.pool.checkout() as conn:
+                conn.execute("ALTER TABLE data DROP COLUMN exact_match")
+                conn.execute("ALTER TABLE data DROP COLUMN f1")
+
+        with ResultRepository(str(db_path)) as dst:
+            assert dst.solved_only_by(("llm", "cypher", "gpt-4o"), ("llm", "cypher", "other")) == ["q001"]
+
+    def test_compare_runs(self, dst):
+        self._evaluated(dst, "a", {"q001": 1.0, "q002": 1.0, "q003": 0.0})
+        self._evaluated(dst, "b", {"q001": 1.0, "q003": 1.0, "q004": 0.0})
+        dst.save_generation("q001", "llm", "sparql", "a", GenerationResult(query="Q"))
+
+        stats = dst.compare_runs([("llm", "cypher", "a"), ("llm", "cypher", "b")])
+        assert stats["total"] == 4
+        assert stats["solved"] == [2, 2]
+        assert stats["pairs"][(0, 1)] == {"both": 1, "only_a": 1, "only_b": 1, "neither": 1}
+
+    def test_compare_runs_empty(self, dst):
+        with pytest.raises(ValueError):
+            dst.compare_runs([])
+
+    def test_solved_only_by(self, dst):
+        self._evaluated(dst, "a", {"q001": 1.0, "q002": 1.0, "q003": 1.0})
+        self._evaluated(dst, "b", {"q002": 1.0, "q003": 0.0})
+        assert dst.solved_only_by(("llm", "cypher", "a"), ("llm", "cypher", "b")) == ["q001", "q003"]
+        assert dst.solved_only_by(("llm", "cypher", "b"), ("llm", "cypher", "a")) == []
+
+    def test_query_executions(self, dst):
+        assert dst.get_query_execution("metaqa", "cypher", "neo4j", "abc") is None
+        dst.save_query_execution("metaqa", "cypher", "neo4j", "abc", ExecutionResult(result=["A"], success=True))
+        dst.save_query_execution("metaqa", "sparql", "neo4j", "abc", ExecutionResult(result=["B"], success=True))
+        assert dst.get_query_execution("metaqa", "cypher", "neo4j", "abc").result == ["A"]
+        assert dst.get_query_execution("other", "cypher", "neo4j", "abc") is None
+        assert dst.get_query_execution("metaqa", "cypher", "kuzu", "abc") is None
+        assert dst.clear_query_executions("metaqa", "cypher") == 1
+        assert dst.get_query_execution("metaqa", "cypher", "neo4j", "abc") is None
+        assert dst.get_query_execution("metaqa", "sparql", "neo4j", "abc").result == ["B"]
+
+    def test_query_executions_dropped_on_hash_change(self, tmp_path):
+        path = str(tmp_path / "dst.db")
+        with ResultRepository(path) as dst:
+            dst.save_query_execution("metaqa", "cypher", "neo4j", "abc", ExecutionResult(result=["A"], success=True))
+        with ResultRepository(path) as dst:
+            assert dst.get_query_execution("metaqa", "cypher", "neo4j", "abc").result == ["A"]
+            dst._set_meta("query_hash_version", "1")
+        with ResultRepository(path) as dst:
+            assert dst.get_query_execution("metaqa", "cypher", "neo4j", "abc") is None
+            assert dst._get_meta("query_hash_version") == ResultRepository.QUERY_HASH_VERSION
+
+    def test_query_executions_without_connector_dropped(self, tmp_path):
+        path = str(tmp_path / "dst.db")
+        with ResultRepository(path) as dst:
+            with dst.pool.checkout() as conn:
+                conn.execute("DROP TABLE queries")
+                conn.execute(
+                    "CREATE TABLE queries (dataset TEXT, lang TEXT, query_hash TEXT, exec TEXT, "
+                    "PRIMARY KEY (dataset, lang, query_hash))"
+                )
+                conn.execute("INSERT INTO queries VALUES ('metaqa', 'cypher', 'abc', '{}')")
+        with ResultRepository(path) as dst:
+            with dst.pool.checkout() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM queries").fetchone()[0] == 0
+            dst.save_query_execution("metaqa", "cypher", "neo4j", "abc", ExecutionResult(result=["A"], success=True))
+            assert dst.get_query_execution("metaqa", "cypher", "neo4j", "abc").result == ["A"]
+
+    def test_config_index(self, dst):
+        with dst.pool.checkout() as conn:
+            names = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert "idx_data_config" in names
+
+
+class TestCodec:
+
+    @pytest.mark.parametrize("name", ["json", "zlib", "msgpack", "zstd"])
+    def test_roundtrip(self, name):
+        for module in CODECS[name].requires:
+            pytest.importorskip(module)
+        codec = get_codec(name)
+        data = {"result": ["Tom Hanks", 1, 2.5, None, {"a": [True]}], "success": True, "error": None}
+        assert decode(codec.encode(data)) == data
+
+    def test_unknown_tag(self):
+        with pytest.raises(ValueError):
+            decode(b"\xff data")
+
+
+class TestResultBuffer:
+
+    @pytest.fixture
+    def dst(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "dst.db"
+            repo = ResultRepository(str(db_path))
+            yield repo
+            repo.close()
+
+    def test_flush_on_batch_size(self, dst):
+        buffer = ResultBuffer(dst, "gen", batch_size=3, flush_interval=3600)
+        buffer.add("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        buffer.add("q002", "llm", "cypher", "gpt-4o", GenerationResult(query="Q2"))
+        assert dst.count() == 0
+        assert len(buffer) == 2
+        buffer.add("q003", "llm", "cypher", "gpt-4o", GenerationResult(query="Q3"))
+        assert dst.count() == 3
+        assert len(buffer) == 0
+
+    def test_flush_on_interval(self, dst):
+        buffer = ResultBuffer(dst, "gen", batch_size=1000, flush_interval=0)
+        buffer.add("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        assert dst.count() == 1
+
+    def test_flush_on_exit(self, dst):
+        dst.save_generation("q001", "llm", "cypher", "gpt-4o", GenerationResult(query="Q1"))
+        with ResultBuffer(dst, "exec", batch_size=1000, flush_interval=3600) as buffer:
+            buffer.add("q001", "llm", "cypher", "gpt-4o", ExecutionResult(result=["A"], success=True))
+            assert dst.get("q001", "llm", "cypher", "gpt-4o").exec is None
+        assert dst.get("q001", "llm", "cypher", "gpt-4o").exec.result == ["A"]
+
+    def test_invalid_stage(self, dst):
+        with pytest.raises(ValueError):
+            ResultBuffer(dst, "unknown")
@@ -0,0 +1,159 @@
+import time
+import pytest
+from unittest.mock import Mock
+
+from nl2graph.execution import Execution
+from nl2graph.execution.cache import QueryCache, connector_fingerprint
+from nl2graph.execution.connectors.neo4j import Neo4jConnector
+from nl2graph.execution.result.entity import QueryResult
+from nl2graph.data import Result, GenerationResult
+
+
+class TestQueryCache:
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = QueryCache(str(tmp_path / "cache" / "queries.db"))
+        yield cache
+        cache.close()
+
+    def test_get_put(self, cache):
+        key = cache.make_key("metaqa", "cypher", "MATCH (n) RETURN n", "fp")
+        assert cache.get(key) is None
+        cache.put(key, "metaqa", "cypher", QueryResult(columns=["n"], rows=[{"n": "A"}]))
+        result = cache.get(key)
+        assert result.columns == ["n"]
+        assert result.rows == [{"n": "A"}]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_key_normalizes_query(self, cache):
+        assert cache.make_key("d", "cypher", "MATCH (n)\n  RETURN n", "fp") == \
+            cache.make_key("d", "cypher", "MATCH (n) RETURN n;", "fp")
+        assert cache.make_key("d", "cypher", "MATCH (n) RETURN n", "fp") != \
+            cache.make_key("d", "cypher", "MATCH (n) RETURN n", "other")
+
+    def test_evict_by_age(self, tmp_path):
+        with QueryCache(str(tmp_path / "queries.db"), max_age_days=1) as cache:
+            cache.put("old", "d", "cypher", QueryResult())
+            with cache._pool.checkout() as conn:
+                conn.execute("UPDATE cache SET created_at = ?", (time.time() - 2 * 86400,))
+            assert cache.get("old") is None
+            cache.put("old", "d", "cypher", QueryResult())
+            with cache._pool.checkout() as conn:
+                conn.execute("UPDATE cache SET created_at = ?", (time.time() - 2 * 86400,))
+            assert cache.evict() == 1
+
+    def test_evict_least_recently_used(self, tmp_path):
+        rows = [{"n": f"value-{i}"} for i in range(200)]
+        with QueryCache(str(tmp_path / "queries.db"), max_size_mb=0) as cache:
+            cache.max_bytes = 2 * len(cache._codec.encode({"columns": ["n"], "rows": rows, "truncated": False}))
+            for key in ("a", "b", "c"):
+                cache.put(key, "d", "cypher", QueryResult(columns=["n"], rows=rows))
+                time.sleep(0.01)
+            cache.get("a")
+            assert cache.evict() == 1
+            assert cache.get("b") is None
+            assert cache.get("a") is not None
+            assert cache.stats()["evictions"] == 1
+
+    def test_access_times_written_in_batches(self, tmp_path):
+        with QueryCache(str(tmp_path / "queries.db"), evict_every=2) as cache:
+            cache.put("a", "d", "cypher", QueryResult())
+            cache.put("b", "d", "cypher", QueryResult())
+            with cache._pool.checkout() as conn:
+                conn.execute("UPDATE cache SET accessed_at = 0")
+            cache.get("a")
+            with cache._pool.checkout() as conn:
+                assert conn.execute("SELECT MAX(accessed_at) FROM cache").fetchone()[0] == 0
+            cache.get("b")
+            with cache._pool.checkout() as conn:
+                assert conn.execute("SELECT MIN(accessed_at) FROM cache").fetchone()[0] > 0
+
+    def test_clear(self, cache):
+        cache.put("a", "metaqa", "cypher", QueryResult())
+        cache.put("b", "kqapro", "sparql", QueryResult())
+        assert cache.clear("metaqa") == 1
+        assert cache.stats()["entries"] == 1
+
+
+class TestConnectorFingerprint:
+
+    def test_ignores_password(self):
+        a = Neo4jConnector(host="localhost", port=7687, password="x")
+        b = Neo4jConnector(host="localhost", port=7687, password="y")
+        c = Neo4jConnector(host="localhost", port=7688, password="x")
+        assert connector_fingerprint(a) == connector_fingerprint(b)
+        assert connector_fingerprint(a) != connector_fingerprint(c)
+
+    def test_only_listed_settings(self):
+        a = Neo4jConnector(host="localhost", port=7687, timeout=10, workers=1)
+        b = Neo4jConnector(host="localhost", port=7687, timeout=60, workers=8)
+        b.queries_run = 42
+        assert connector_fingerprint(a) == connector_fingerprint(b)
+        assert connector_fingerprint(a) != connector_fingerprint(Neo4jConnector(host="localhost", port=7687, max_rows=5))
+
+    def test_stable_across_loads(self, tmp_path):
+        from nl2graph.execution.connectors.rdflib import RDFLibConnector
+
+        data = tmp_path / "graph.ttl"
+        data.write_text('<http://ex.org/s> <http://ex.org/p> "v" .')
+        first = RDFLibConnector(data_path=str(data))
+        first.connect()
+        second = RDFLibConnector(data_path=str(data))
+        second.connect()
+        second.execute("SELECT ?o WHERE { ?s ?p ?o }")
+        assert first.load_source != second.load_source
+        assert connector_fingerprint(first) == connector_fingerprint(second)
+
+
+class TestExecutionCache:
+
+    def test_execute_uses_cache(self, tmp_path):
+        connector = Neo4jConnector(host="localhost", port=7687)
+        connector.execute = Mock(return_value=QueryResult(columns=["n"], rows=[{"n": "A"}]))
+        result = Result(
+            question_id="q001", method="llm", lang="cypher", model="gpt-4o",
+            gen=GenerationResult(query="MATCH (n) RETURN n"),
+        )
+
+        with QueryCache(str(tmp_path / "queries.db")) as cache:
+            execution = Execution(connector, dataset="metaqa", cache=cache)
+            first = execution.execute(result)
+            second = execution.execute(result)
+
+        assert connector.execute.call_count == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.result == ["A"]
+
+    def test_reordered_return_items_share_entries(self, tmp_path):
+        from nl2graph.data.repository import ResultRepository
+
+        connector = Neo4jConnector(host="localhost", port=7687)
+        connector.execute = Mock(return_value=QueryResult(columns=["p.name", "m.title"], values=[["Al"], ["Heat"]]))
+
+        def result(query, model):
+            return Result(
+                question_id="q001", method="llm", lang="cypher", model=model,
+                gen=GenerationResult(query=query),
+            )
+
+        with QueryCache(str(tmp_path / "queries.db")) as cache:
+            execution = Execution(connector, dataset="metaqa", cache=cache)
+            first = execution.execute(result("MATCH (m)<--(p) RETURN p.name, m.title", "a"))
+            second = execution.execute(result("match (x)<--(y)\nreturn x.title, y.name", "b"))
+
+        assert connector.execute.call_count == 1
+        assert first.result == [["Al", "Heat"]]
+        assert second.cached is True
+        assert second.result == [["Heat", "Al"]]
+
+        store = ResultRepository(str(tmp_path / "dst.db"))
+        execution = Execution(connector, store=store, dataset="metaqa")
+        execution.execute(result("MATCH (m)<--(p) RETURN p.name, m.title", "a"))
+        stored = execution.execute(result("MATCH (m)<--(p) RETURN m.title, p.name", "b"))
+        store.close()
+        assert connector.execute.call_count == 2
+        assert stored.cached is True
+        assert stored.result == [["Heat", "Al"]]
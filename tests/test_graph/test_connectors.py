@@ -0,0 +1,1133 @@
+import time
+import queue
+import asyncio
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+from datetime import date
+from concurrent.futures import Future
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
+
+from neo4j.exceptions import ClientError
+
+from nl2graph.execution import Execution, GraphService
+from nl2graph.execution.connectors.neo4j import Neo4jConnector
+from nl2graph.execution.connectors.kuzu import KuzuConnector
+from nl2graph.execution.connectors.rdflib import RDFLibConnector
+from nl2graph.execution.connectors.oxigraph import OxigraphConnector
+from nl2graph.execution.connectors.gremlin import GremlinConnector
+from nl2graph.execution.connectors.sparql_http import SparqlHttpConnector
+from nl2graph.execution.result.entity import QueryResult
+from nl2graph.execution.result.converter import convert_oxigraph_value, convert_sparql_tsv_value
+from nl2graph.data import Result, GenerationResult
+
+
+def _neo4j_result(rows):
+    result = MagicMock()
+    records = [MagicMock(**{"__getitem__.side_effect": row.__getitem__}) for row in rows]
+    result.__iter__.return_value = iter(records)
+    result.keys.return_value = list(rows[0].keys()) if rows else []
+    return result
+
+
+class TestNeo4jConnector:
+
+    @pytest.fixture
+    def connector(self):
+        connector = Neo4jConnector(host="localhost", port=7687, workers=2)
+        connector._driver = Mock()
+        connector._driver.session.side_effect = lambda **kwargs: Mock()
+        return connector
+
+    def test_pool_size_follows_workers(self):
+        assert Neo4jConnector(workers=64).max_connection_pool_size == 65
+        assert Neo4jConnector(workers=1).max_connection_pool_size == 10
+        assert Neo4jConnector(workers=64, max_connection_pool_size=200).max_connection_pool_size == 200
+
+    def test_session_reused(self, connector):
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.run.side_effect = lambda *args, **kwargs: _neo4j_result([{"name": "Alice"}])
+
+        assert connector.execute("MATCH (n) RETURN n.name").rows == [{"name": "Alice"}]
+        connector.execute("MATCH (n) RETURN n.name")
+        assert connector._driver.session.call_count == 1
+        session.close.assert_not_called()
+
+    def test_failed_session_discarded(self, connector):
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.run.side_effect = ConnectionError("broken")
+
+        with pytest.raises(ConnectionError):
+            connector.execute("MATCH (n) RETURN n")
+        session.close.assert_called_once()
+        assert connector._sessions == []
+
+    def test_execute_many(self, connector):
+        def run(query, params=None):
+            if "bad" in query:
+                raise ClientError("syntax error")
+            return _neo4j_result([{"n": query}])
+
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.begin_transaction.return_value.run.side_effect = run
+
+        outputs = connector.execute_many(["q1", "bad", "q3"])
+        assert outputs[0].rows == [{"n": "q1"}]
+        assert isinstance(outputs[1], ClientError)
+        assert outputs[2].rows == [{"n": "q3"}]
+        assert connector._driver.session.call_count == 1
+        # the failed query ends its transaction, the rest runs in a new one
+        assert session.begin_transaction.call_count == 2
+        assert connector._sessions == [session]
+
+    def test_execute_many_falls_back_in_new_transaction(self, connector):
+        from neo4j.exceptions import Neo4jError
+
+        error = Neo4jError._hydrate_neo4j(code="Neo.ClientError.Statement.SyntaxError", message="bad")
+        calls = []
+
+        def run(query, params=None):
+            calls.append((query, params))
+            if params:
+                raise error
+            return _neo4j_result([{"n": 1}])
+
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.begin_transaction.return_value.run.side_effect = run
+
+        outputs = connector.execute_many(["MATCH (n {id: 1}) RETURN n.id"])
+        assert outputs[0].rows == [{"n": 1}]
+        assert calls[-1] == ("MATCH (n {id: 1}) RETURN n.id", None)
+        assert session.begin_transaction.call_count == 2
+
+    def test_execute_many_bounded_by_deadline(self, connector):
+        from nl2graph.base.timeout import TimeoutError, deadline
+
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.begin_transaction.return_value.run.side_effect = lambda *args: _neo4j_result([{"n": 1}])
+
+        with deadline(4):
+            connector.execute_many(["q1", "q2"], timeout=100)
+        assert 3 < session.begin_transaction.call_args.kwargs["timeout"] <= 4
+
+        def slow(*args):
+            time.sleep(0.1)
+            return _neo4j_result([{"n": 1}])
+
+        session.begin_transaction.return_value.run.side_effect = slow
+        with deadline(0.05):
+            outputs = connector.execute_many(["q1", "q2", "q3"])
+        assert outputs[0].rows == [{"n": 1}]
+        assert all(isinstance(output, TimeoutError) for output in outputs[1:])
+
+    def test_execute_many_transaction_bounded_per_query(self, connector):
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.begin_transaction.return_value.run.side_effect = lambda *args: _neo4j_result([{"n": 1}])
+
+        connector.execute_many(["q1", "q2", "q3"], timeout=5)
+        assert session.begin_transaction.call_args.kwargs["timeout"] == 5
+
+    def test_execute_many_retries_query_timed_out_by_transaction(self, connector):
+        from neo4j.exceptions import Neo4jError
+
+        error = Neo4jError._hydrate_neo4j(
+            code="Neo.ClientError.Transaction.TransactionTimedOutClientConfiguration", message="timed out"
+        )
+        calls = []
+
+        def run(query, params=None):
+            calls.append(query)
+            if calls.count(query) == 1 and query != "q1":
+                raise error
+            return _neo4j_result([{"n": query}])
+
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.begin_transaction.return_value.run.side_effect = run
+
+        outputs = connector.execute_many(["q1", "q2", "q3"])
+        # q2 and q3 ran out the time their predecessors left, so each runs
+        # again at the start of a new transaction
+        assert [output.rows for output in outputs] == [[{"n": "q1"}], [{"n": "q2"}], [{"n": "q3"}]]
+        assert session.begin_transaction.call_count == 3
+
+        session.begin_transaction.return_value.run.side_effect = lambda *args: (_ for _ in ()).throw(error)
+        outputs = connector.execute_many(["q1"])
+        assert outputs == [error]
+
+    def test_max_rows(self, connector):
+        connector.max_rows = 2
+        result = _neo4j_result([{"n": i} for i in range(5)])
+        connector._driver.session.side_effect = None
+        connector._driver.session.return_value.run.return_value = result
+
+        output = connector.execute("MATCH (n) RETURN n")
+        assert output.rows == [{"n": 0}, {"n": 1}]
+        assert output.truncated is True
+        result.consume.assert_called_once()
+
+    def test_transaction_timeout(self, connector):
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.run.return_value = _neo4j_result([])
+
+        connector.execute("MATCH (n) RETURN n", timeout=5)
+        query = session.run.call_args.args[0]
+        assert query.text == "MATCH (n) RETURN n"
+        assert query.timeout == 5
+
+    def test_transaction_timeout_follows_deadline(self, connector):
+        from nl2graph.base.timeout import _deadline
+
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.run.return_value = _neo4j_result([])
+
+        token = _deadline.set(time.monotonic() + 2)
+        try:
+            connector.execute("MATCH (n) RETURN n")
+        finally:
+            _deadline.reset(token)
+        assert 1 < session.run.call_args.args[0].timeout <= 2
+
+    def test_literals_parameterized(self, connector):
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.run.return_value = _neo4j_result([])
+
+        connector.execute("MATCH (n {name: 'Tom Hanks'}) RETURN n.name LIMIT 5")
+        call = session.run.call_args
+        assert call.args[0].text == "MATCH (n {name: $__p0}) RETURN n.name LIMIT $__p1"
+        assert call.kwargs["parameters"] == {"__p0": "Tom Hanks", "__p1": 5}
+
+    def test_syntax_error_falls_back_to_raw(self, connector):
+        from neo4j.exceptions import Neo4jError
+
+        query = "MATCH (n {name: 'A'}) RETURN n.name"
+        error = Neo4jError._hydrate_neo4j(code="Neo.ClientError.Statement.SyntaxError", message="bad")
+
+        def run(q, parameters=None):
+            if parameters:
+                raise error
+            return _neo4j_result([{"n.name": "A"}])
+
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.run.side_effect = run
+
+        assert connector.execute(query).rows == [{"n.name": "A"}]
+        assert session.run.call_args.args[0].text == query
+        connector.execute(query)
+        assert session.run.call_count == 3
+
+    def test_parameterize_disabled(self, connector):
+        connector.parameterize = False
+        connector._driver.session.side_effect = None
+        session = connector._driver.session.return_value
+        session.run.return_value = _neo4j_result([])
+
+        connector.execute("MATCH (n {name: 'A'}) RETURN n")
+        assert session.run.call_args.args[0].text == "MATCH (n {name: 'A'}) RETURN n"
+        assert session.run.call_args.kwargs["parameters"] is None
+
+    def test_close(self, connector):
+        connector._sessions = [Mock(), Mock()]
+        driver = connector._driver
+        connector.close()
+        driver.close.assert_called_once()
+        assert connector._sessions == []
+
+
+def _kuzu_result(columns, rows):
+    result = Mock()
+    result.get_column_names.return_value = columns
+    pending = list(rows)
+    result.has_next.side_effect = lambda: bool(pending)
+    result.get_next.side_effect = lambda: pending.pop(0)
+    return result
+
+
+class TestKuzuConnector:
+
+    @pytest.fixture
+    def connector(self):
+        connector = KuzuConnector(workers=2, sanity=["lowercase_relationships"])
+        connector._database = Mock()
+        connector._connections = [Mock()]
+        return connector
+
+    def test_selected_by_engine(self):
+        service = GraphService(Mock(get=Mock(return_value=None)))
+        assert isinstance(service._create_connector("cypher", {"engine": "embedded"}), KuzuConnector)
+        assert isinstance(service._create_connector("cypher", {}), Neo4jConnector)
+
+    def test_execute(self, connector):
+        conn = connector._connections[0]
+        node = {"_id": {"table": 0, "offset": 3}, "_label": "Movie", "title": "Heat"}
+        conn.execute.return_value = _kuzu_result(["m", "m.year"], [[node, 1995]])
+
+        result = connector.execute("MATCH (m:Movie)-[:DIRECTED_BY]->(d {name: 'Mann'}) RETURN m, m.year", timeout=5)
+        assert result.rows == [{
+            "m": {"id": "0:3", "labels": ["Movie"], "properties": {"title": "Heat"}},
+            "m.year": 1995,
+        }]
+        query, params = conn.execute.call_args.args
+        assert query == "MATCH (m:Movie)-[:directed_by]->(d {name: $__p0}) RETURN m, m.year"
+        assert params == {"__p0": "Mann"}
+        conn.set_query_timeout.assert_called_with(5000)
+        assert connector._connections == [conn]
+
+    def test_timeout_runs_on_caller_thread(self, connector):
+        conn = connector._connections[0]
+        conn.execute.side_effect = lambda *args: (
+            _kuzu_result(["thread"], [[threading.current_thread().name]])
+        )
+        execution = Execution(connector)
+
+        with patch("nl2graph.base.timeout.get_timeout", return_value=5):
+            output = execution.execute(Result(
+                question_id="q001", method="llm", lang="cypher", model="gpt-4o",
+                gen=GenerationResult(query="MATCH (n) RETURN n"),
+            ))
+        assert output.result == [threading.current_thread().name]
+        assert 0 < conn.set_query_timeout.call_args.args[0] <= 5000
+        assert connector._connections == [conn]
+
+    def test_max_rows(self, connector):
+        connector.max_rows = 2
+        connector._connections[0].execute.return_value = _kuzu_result(["n"], [[1], [2], [3]])
+        result = connector.execute("MATCH (n) RETURN n.id")
+        assert result.rows == [{"n": 1}, {"n": 2}]
+        assert result.truncated is True
+
+    def test_binder_error_falls_back(self, connector):
+        conn = connector._connections[0]
+        conn.execute.side_effect = [RuntimeError("Binder exception: bad"), _kuzu_result(["n"], [[1]])]
+        assert connector.execute("MATCH (n {id: 1}) RETURN n.id").rows == [{"n": 1}]
+        assert conn.execute.call_args.args == ("MATCH (n {id: 1}) RETURN n.id",)
+
+    def _build(self, connector, limit=60):
+        # a build that never returns must fail the test, not hang the run
+        outcome = Future()
+
+        def build():
+            try:
+                outcome.set_result(connector.build())
+            except BaseException as e:
+                outcome.set_exception(e)
+
+        threading.Thread(target=build, daemon=True).start()
+        return outcome.result(timeout=limit)
+
+    def test_build_from_export(self, tmp_path):
+        pytest.importorskip("kuzu")
+
+        export = tmp_path / "export"
+        export.mkdir()
+        (export / "movie.csv").write_text("Heat,1995\nUp,2009\n")
+        (export / "schema.cypher").write_text(
+            "CREATE NODE TABLE Movie(title STRING, year INT64, PRIMARY KEY (title));\n"
+        )
+        (export / "copy.cypher").write_text('COPY Movie FROM "movie.csv";\n')
+        (export / "macro.cypher").write_text("")
+
+        connector = KuzuConnector(db_path=str(tmp_path / "db.kuzu"), import_path=str(export))
+        assert self._build(connector) is True
+        assert self._build(connector) is False
+        connector.connect()
+        try:
+            result = connector.execute("MATCH (m:Movie {title: 'Up'}) RETURN m.year")
+            assert result.rows == [{"m.year": 2009}]
+        finally:
+            connector.close()
+
+    def test_build_from_database_export(self, tmp_path):
+        kuzu = pytest.importorskip("kuzu")
+
+        source = kuzu.Database(str(tmp_path / "source.kuzu"))
+        conn = kuzu.Connection(source)
+        conn.execute("CREATE NODE TABLE Movie(title STRING, PRIMARY KEY (title))")
+        conn.execute("CREATE NODE TABLE Person(name STRING, PRIMARY KEY (name))")
+        conn.execute("CREATE REL TABLE DIRECTED(FROM Movie TO Person)")
+        conn.execute("CREATE (:Movie {title: 'Heat'})-[:DIRECTED]->(:Person {name: 'Mann'})")
+        conn.execute(f"EXPORT DATABASE '{(tmp_path / 'export').as_posix()}'")
+        conn.close()
+        source.close()
+
+        connector = KuzuConnector(db_path=str(tmp_path / "db.kuzu"), import_path=str(tmp_path / "export"))
+        assert self._build(connector) is True
+        connector.connect()
+        try:
+            result = connector.execute("MATCH (m:Movie)-[:DIRECTED]->(p:Person) RETURN p.name")
+            assert result.rows == [{"p.name": "Mann"}]
+        finally:
+            connector.close()
+
+    def test_build_statements(self, tmp_path):
+        from nl2graph.execution.connectors.kuzu import _statements, _copy_statement
+
+        script = "CREATE NODE TABLE A(s STRING DEFAULT 'a;b', PRIMARY KEY (s));\n\nCOPY A FROM \"a.csv\";\n"
+        assert _statements(script) == [
+            "CREATE NODE TABLE A(s STRING DEFAULT 'a;b', PRIMARY KEY (s));",
+            'COPY A FROM "a.csv";',
+        ]
+        assert _copy_statement('COPY A FROM "a.csv";', tmp_path) == f'COPY A FROM "{(tmp_path / "a.csv").as_posix()}";'
+        assert _copy_statement("COPY A FROM '/data/a.csv' (parallel=true);", tmp_path) == "COPY A FROM '/data/a.csv' (parallel=true);"
+        assert _copy_statement("COPY A FROM '/data/a.parquet' (parallel=true);", tmp_path) == "COPY A FROM '/data/a.parquet';"
+        assert (_copy_statement("COPY R FROM '/data/r.parquet' (to='B', from='A', parallel=true);", tmp_path)
+                == "COPY R FROM '/data/r.parquet' (to='B', from='A');")
+
+
+class TestRowLimits:
+
+    TURTLE = "\n".join(
+        f"<http://ex.org/s{i}> <http://ex.org/p> \"v{i}\" ." for i in range(5)
+    )
+
+    def test_rdflib_max_rows(self):
+        connector = RDFLibConnector(max_rows=2)
+        connector.load_data(self.TURTLE)
+        output = connector.execute("SELECT ?o WHERE { ?s <http://ex.org/p> ?o }")
+        assert len(output.rows) == 2
+        assert output.truncated is True
+
+    def test_rdflib_under_limit(self):
+        connector = RDFLibConnector(max_rows=5)
+        connector.load_data(self.TURTLE)
+        output = connector.execute("SELECT ?o WHERE { ?s <http://ex.org/p> ?o }")
+        assert len(output.rows) == 5
+        assert output.truncated is False
+
+    def test_raw_opt_in(self):
+        query = "SELECT ?o WHERE { ?s <http://ex.org/p> ?o }"
+        connector = RDFLibConnector()
+        connector.load_data(self.TURTLE)
+        assert connector.execute(query).raw is None
+
+        connector = RDFLibConnector(keep_raw=True)
+        connector.load_data(self.TURTLE)
+        assert connector.execute(query).raw is not None
+
+    def _result_set(self, batches):
+        result_set = Mock()
+        result_set.stream = queue.Queue()
+        for batch in batches:
+            result_set.stream.put(batch)
+        result_set.done = Future()
+        result_set.done.set_result(None)
+        return result_set
+
+    def test_gremlin_max_rows(self):
+        connector = GremlinConnector(max_rows=3)
+        connector._client = Mock()
+        connector._client.submit.return_value = self._result_set([[1, 2], [3, 4], [5]])
+        output = connector.execute("g.V()")
+        assert output.rows == [{"value": 1}, {"value": 2}, {"value": 3}]
+        assert output.truncated is True
+
+    def test_gremlin_limit_sent_to_server(self):
+        connector = GremlinConnector(max_rows=3, parameterize=False)
+        assert connector._limit("g.V().out('acted_in');") == "g.V().out('acted_in').limit(4)"
+        assert connector._limit("g.V().values('name').fold()") == "g.V().values('name').fold().limit(4)"
+        assert connector._limit("g.V().has('a;b')") == "g.V().has('a;b').limit(4)"
+        for script in ("g.V().toList()", "g.V().next(5)", "x = g.V(); x", "g.V() // all"):
+            assert connector._limit(script) == script
+        assert GremlinConnector()._limit("g.V()") == "g.V()"
+
+        connector._client = Mock()
+        connector._client.submit.return_value = self._result_set([[1, 2, 3, 4]])
+        assert connector.execute("g.V()").truncated is True
+        assert connector._client.submit.call_args.args[0] == "g.V().limit(4)"
+
+    def test_gremlin_evaluation_timeout(self):
+        connector = GremlinConnector(timeout=7)
+        connector._client = Mock()
+        connector._client.submit.return_value = self._result_set([[1]])
+        connector.execute("g.V()")
+        assert connector._client.submit.call_args.kwargs["request_options"] == {"evaluationTimeout": 7000}
+
+    def test_gremlin_stops_waiting_at_timeout(self):
+        from nl2graph.base.timeout import TimeoutError
+
+        connector = GremlinConnector(timeout=0.1)
+        connector._client = Mock()
+        result_set = self._result_set([])
+        result_set.done = Future()
+        connector._client.submit.return_value = result_set
+        with pytest.raises(TimeoutError):
+            connector.execute("g.V()")
+
+    def test_gremlin_bindings(self):
+        connector = GremlinConnector()
+        connector._client = Mock()
+        connector._client.submit.return_value = self._result_set([[1]])
+        connector.execute("g.V().has('name', 'Tom Hanks').limit(3)")
+        call = connector._client.submit.call_args
+        assert call.args[0] == "g.V().has(__p0, __p1).limit(__p2)"
+        assert call.kwargs["bindings"] == {"__p0": "name", "__p1": "Tom Hanks", "__p2": 3}
+
+    def test_gremlin_compile_error_falls_back(self):
+        connector = GremlinConnector()
+        connector._client = Mock()
+        failed = self._result_set([])
+        failed.done = Future()
+        failed.done.set_exception(RuntimeError("597: MultipleCompilationErrorsException"))
+        connector._client.submit.side_effect = [failed, self._result_set([[1]])]
+
+        assert connector.execute("g.V().has('name', 'A')").rows == [{"value": 1}]
+        assert connector._client.submit.call_args.args[0] == "g.V().has('name', 'A')"
+        assert connector._client.submit.call_args.kwargs["bindings"] is None
+
+    def test_gremlin_unlimited(self):
+        connector = GremlinConnector()
+        connector._client = Mock()
+        connector._client.submit.return_value = self._result_set([[1, 2], [3]])
+        output = connector.execute("g.V()")
+        assert len(output.rows) == 3
+        assert output.truncated is False
+
+    def test_gremlin_async_holds_no_thread(self):
+        from gremlin_python.driver.resultset import ResultSet
+
+        result_set = ResultSet(queue.Queue(), "r1")
+        result_set.done = Future()
+        submitted = Future()
+        submitted.set_result(result_set)
+        connector = GremlinConnector(max_rows=2)
+        connector._client = Mock()
+        connector._client.submit_async.return_value = submitted
+
+        async def run():
+            pending = asyncio.ensure_future(connector.execute_async("g.V()"))
+            await asyncio.sleep(0.01)
+            result_set.stream.put([1, 2, 3])
+            result_set.done.set_result(None)
+            return await pending
+
+        with patch("asyncio.to_thread", side_effect=AssertionError("executor thread used")):
+            output = asyncio.run(run())
+        assert output.values == [[1, 2]]
+        assert output.truncated is True
+
+    def test_gremlin_async_max_rows_without_server_limit(self):
+        from gremlin_python.driver.resultset import ResultSet
+
+        result_set = ResultSet(queue.Queue(), "r1")
+        result_set.done = Future()
+        submitted = Future()
+        submitted.set_result(result_set)
+        connector = GremlinConnector(max_rows=2)
+        connector._client = Mock()
+        connector._client.submit_async.return_value = submitted
+
+        async def run():
+            # a terminal step leaves the script unlimited, so the cap applies here
+            pending = asyncio.ensure_future(connector.execute_async("g.V().toList()"))
+            for batch in ([1, 2], [3, 4], [5]):
+                await asyncio.sleep(0.01)
+                result_set.stream.put(batch)
+            result_set.done.set_result(None)
+            return await pending
+
+        output = asyncio.run(run())
+        assert connector._client.submit_async.call_args.args[0] == "g.V().toList()"
+        assert output.values == [[1, 2]]
+        assert output.truncated is True
+        assert result_set.stream.empty()
+
+    def test_gremlin_async_stops_waiting_at_timeout(self):
+        from nl2graph.base.timeout import TimeoutError
+        from gremlin_python.driver.resultset import ResultSet
+
+        result_set = ResultSet(queue.Queue(), "r1")
+        result_set.done = Future()
+        submitted = Future()
+        submitted.set_result(result_set)
+        connector = GremlinConnector(timeout=0.1)
+        connector._client = Mock()
+        connector._client.submit_async.return_value = submitted
+        with pytest.raises(TimeoutError):
+            asyncio.run(connector.execute_async("g.V()"))
+
+    def test_gremlin_mixed_rows(self):
+        connector = GremlinConnector()
+        connector._client = Mock()
+        connector._client.submit.return_value = self._result_set([[{"name": "A"}, "B"]])
+        output = connector.execute("g.V()")
+        assert output.columns == ["value"]
+        assert output.values == [["A", "B"]]
+
+    def test_gremlin_value_maps_with_different_properties(self):
+        connector = GremlinConnector()
+        connector._client = Mock()
+        connector._client.submit.return_value = self._result_set([[
+            {"name": ["A"], "age": [30]},
+            {"name": ["B"]},
+        ]])
+        output = Execution(connector).execute(Result(
+            question_id="q001", method="llm", lang="gremlin", model="gpt-4o",
+            gen=GenerationResult(query="g.V().valueMap()"),
+        ))
+        assert output.result == [[["A"], [30]], ["B"]]
+
+    def test_execution_marks_truncated(self):
+        connector = Mock()
+        connector.execute.return_value = QueryResult(columns=["n"], rows=[{"n": 1}], truncated=True)
+        output = Execution(connector).execute(Result(
+            question_id="q001", method="llm", lang="cypher", model="gpt-4o",
+            gen=GenerationResult(query="MATCH (n) RETURN n"),
+        ))
+        assert output.truncated is True
+
+
+class TestRDFSnapshot:
+
+    TURTLE = TestRowLimits.TURTLE
+    QUERY = "SELECT ?o WHERE { ?s <http://ex.org/p> ?o }"
+
+    def test_snapshot_built_and_reused(self, tmp_path):
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+
+        first = RDFLibConnector(data_path=str(data))
+        first.connect()
+        assert first.load_source == "source"
+        assert first.load_time is not None
+        assert (tmp_path / "graph.ttl.snapshot").exists()
+
+        second = RDFLibConnector(data_path=str(data))
+        second.connect()
+        assert second.load_source == "snapshot"
+        assert len(second.execute(self.QUERY).rows) == 5
+
+    def test_snapshot_invalidated_on_change(self, tmp_path):
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        RDFLibConnector(data_path=str(data)).connect()
+
+        data.write_text(self.TURTLE + "\n<http://ex.org/s9> <http://ex.org/p> \"v9\" .")
+        connector = RDFLibConnector(data_path=str(data))
+        connector.connect()
+        assert connector.load_source == "source"
+        assert len(connector.execute(self.QUERY).rows) == 6
+
+    def test_snapshot_disabled(self, tmp_path):
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        connector = RDFLibConnector(data_path=str(data), snapshot=False)
+        connector.connect()
+        assert connector.load_source == "source"
+        assert not (tmp_path / "graph.ttl.snapshot").exists()
+
+    def test_corrupt_snapshot_ignored(self, tmp_path):
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        (tmp_path / "graph.ttl.snapshot").write_bytes(b"not a pickle")
+        connector = RDFLibConnector(data_path=str(data))
+        connector.connect()
+        assert connector.load_source == "source"
+        assert len(connector.execute(self.QUERY).rows) == 5
+
+
+class TestRDFPreparedQueries:
+
+    TURTLE = TestRowLimits.TURTLE
+
+    @pytest.fixture
+    def connector(self):
+        connector = RDFLibConnector(prepared_cache_size=2)
+        connector.load_data(self.TURTLE)
+        return connector
+
+    def _query(self, i):
+        return f'SELECT ?s WHERE {{ ?s <http://ex.org/p> "v{i}" }}'
+
+    def test_template_reused(self, connector):
+        for i in range(5):
+            assert connector.execute(self._query(i)).rows == [{"s": f"http://ex.org/s{i}"}]
+        assert connector.prepared_misses == 1
+        assert connector.prepared_hits == 4
+
+    def test_select_star_hides_parameters(self, connector):
+        result = connector.execute('SELECT * WHERE { ?s <http://ex.org/p> "v1" }')
+        assert result.columns == ["s"]
+
+    def test_ask(self, connector):
+        assert connector.execute('ASK { <http://ex.org/s1> <http://ex.org/p> "v1" }').rows == [{"result": True}]
+        assert connector.execute('ASK { <http://ex.org/s1> <http://ex.org/p> "v2" }').rows == [{"result": False}]
+
+    def test_unparsable_template_falls_back(self, connector):
+        result = connector.execute('SELECT ?s WHERE { ?s <http://ex.org/p>|<http://ex.org/q> "v1" }')
+        assert result.rows == [{"s": "http://ex.org/s1"}]
+
+    def test_parse_error_raised(self, connector):
+        with pytest.raises(Exception):
+            connector.execute("SELECT WHERE {")
+        with pytest.raises(Exception):
+            connector.execute("SELECT WHERE {")
+
+    def test_bounded(self, connector):
+        connector.execute("SELECT ?s WHERE { ?s ?p ?o }")
+        connector.execute("SELECT ?o WHERE { ?s ?p ?o }")
+        connector.execute(self._query(0))
+        assert len(connector._prepared) == 2
+
+
+class SlowLoadingConnector(RDFLibConnector):
+
+    def connect(self) -> None:
+        # only replacement workers load for themselves, with processes reset to 0
+        if not self.processes:
+            time.sleep(2)
+        super().connect()
+
+
+class TestRDFProcessPool:
+
+    TURTLE = TestRowLimits.TURTLE
+    QUERY = TestRDFSnapshot.QUERY
+    RUNAWAY = "SELECT * WHERE { " + " ".join(f"?s{i} ?p{i} ?o{i} ." for i in range(12)) + " }"
+
+    @pytest.fixture
+    def connector(self, tmp_path):
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        connector = RDFLibConnector(data_path=str(data), processes=2, timeout=1)
+        connector.connect()
+        yield connector
+        connector.close()
+
+    def test_execute_in_workers(self, connector):
+        result = connector.execute(self.QUERY)
+        assert sorted(row["o"] for row in result.rows) == [f"v{i}" for i in range(5)]
+        assert connector._pool.size == 2
+
+    def test_error_forwarded(self, connector):
+        with pytest.raises(RuntimeError):
+            connector.execute("SELECT WHERE {")
+        assert connector._pool.restarts == 0
+        assert len(connector.execute(self.QUERY).rows) == 5
+
+    def test_timeout_kills_worker(self, connector):
+        from nl2graph.base.timeout import TimeoutError
+
+        pids = {w.process.pid for w in connector._pool._workers}
+        start = time.perf_counter()
+        with pytest.raises(TimeoutError):
+            connector.execute(self.RUNAWAY, timeout=0.3)
+        assert time.perf_counter() - start < 2
+        connector._pool.join_replacements(30)
+        assert connector._pool.restarts == 1
+        assert {w.process.pid for w in connector._pool._workers} != pids
+        assert connector._pool._restart_ctx.get_start_method() in ("forkserver", "spawn")
+        assert len(connector.execute(self.QUERY).rows) == 5
+
+    def test_wait_for_busy_worker_bounded(self, tmp_path):
+        from nl2graph.base.timeout import TimeoutError
+
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        connector = RDFLibConnector(data_path=str(data), processes=1, timeout=1)
+        connector.connect()
+        try:
+            busy = threading.Thread(target=lambda: pytest.raises(TimeoutError, connector.execute, self.RUNAWAY, 2))
+            busy.start()
+            time.sleep(0.2)
+            start = time.perf_counter()
+            with pytest.raises(TimeoutError, match="waiting for a query worker"):
+                connector.execute(self.QUERY, timeout=0.3)
+            assert time.perf_counter() - start < 1
+            busy.join()
+        finally:
+            connector.close()
+
+    def test_failed_replacement_keeps_slot(self, tmp_path):
+        from nl2graph.base.timeout import TimeoutError
+        from nl2graph.execution.connectors import process_pool
+
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        connector = RDFLibConnector(data_path=str(data), processes=1, timeout=1)
+        connector.connect()
+        try:
+            with patch.object(process_pool, "_Worker", side_effect=OSError("no more processes")):
+                with pytest.raises(TimeoutError):
+                    connector.execute(self.RUNAWAY, timeout=0.3)
+                connector._pool.join_replacements(30)
+                assert connector._pool._workers == []
+                with pytest.raises(RuntimeError, match="could not start query worker"):
+                    connector.execute(self.QUERY)
+            assert len(connector.execute(self.QUERY, timeout=30).rows) == 5
+            assert len(connector._pool._workers) == 1
+        finally:
+            connector.close()
+
+    def test_replacement_idle_only_once_loaded(self, tmp_path):
+        from nl2graph.base.timeout import TimeoutError
+
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        connector = SlowLoadingConnector(data_path=str(data), processes=1, timeout=1)
+        connector.connect()
+        try:
+            start = time.perf_counter()
+            with pytest.raises(TimeoutError):
+                connector.execute(self.RUNAWAY, timeout=0.3)
+            assert time.perf_counter() - start < 1
+            # the replacement loads for longer than the query timeout, and a
+            # query waiting for it gives up at its own deadline
+            start = time.perf_counter()
+            with pytest.raises(TimeoutError, match="waiting for a query worker"):
+                connector.execute(self.QUERY, timeout=0.5)
+            assert time.perf_counter() - start < 1
+            connector._pool.join_replacements(30)
+            assert len(connector.execute(self.QUERY, timeout=1).rows) == 5
+            assert connector._pool.restarts == 1
+        finally:
+            connector.close()
+
+    def test_worker_load_timeout(self, tmp_path):
+        from nl2graph.base.timeout import TimeoutError
+
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        connector = SlowLoadingConnector(data_path=str(data), processes=1, timeout=1, load_timeout=0.5)
+        connector.connect()
+        try:
+            with pytest.raises(TimeoutError):
+                connector.execute(self.RUNAWAY, timeout=0.3)
+            connector._pool.join_replacements(30)
+            assert connector._pool._workers == []
+            with pytest.raises(TimeoutError, match="did not load"):
+                connector.execute(self.QUERY)
+        finally:
+            connector.close()
+
+    def test_close_stops_workers(self, connector):
+        workers = list(connector._pool._workers)
+        connector.close()
+        assert not any(w.process.is_alive() for w in workers)
+
+    def test_workers_reconnect_when_not_fork_safe(self, tmp_path):
+        class Reopening(RDFLibConnector):
+            fork_safe = False
+
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        connector = Reopening(data_path=str(data), processes=1, snapshot=False)
+        connector.connect()
+        connector._graph = None
+        try:
+            assert len(connector.execute(self.QUERY).rows) == 5
+        finally:
+            connector.close()
+
+
+class FakeTerm:
+
+    def __init__(self, value, datatype=None, language=None):
+        self.value = value
+        self.datatype = FakeTerm(datatype) if datatype else None
+        self.language = language
+
+
+class TestOxigraphConnector:
+
+    TURTLE = TestRowLimits.TURTLE
+    QUERY = TestRDFSnapshot.QUERY
+
+    def test_selected_by_engine(self):
+        service = GraphService(Mock(get=Mock(return_value=None)))
+        assert isinstance(service._create_connector("sparql", {"engine": "oxigraph"}), OxigraphConnector)
+        assert isinstance(service._create_connector("sparql", {}), RDFLibConnector)
+
+    def test_core_prefixes_added(self):
+        connector = OxigraphConnector()
+        query = connector._with_prefixes("SELECT ?x WHERE { ?x rdfs:label ?l }")
+        assert query.startswith("PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>\n")
+        declared = "PREFIX rdfs: <http://example.org/> SELECT ?x WHERE { ?x rdfs:label ?l }"
+        assert connector._with_prefixes(declared) == declared
+
+    def test_values_convert_like_rdflib(self):
+        NamedNode = type("NamedNode", (FakeTerm,), {})
+        Literal = type("Literal", (FakeTerm,), {})
+        BlankNode = type("BlankNode", (FakeTerm,), {})
+        xsd = "http://www.w3.org/2001/XMLSchema#"
+
+        assert convert_oxigraph_value(NamedNode("http://ex.org/a")) == "http://ex.org/a"
+        assert convert_oxigraph_value(BlankNode("b0")) == "_:b0"
+        assert convert_oxigraph_value(Literal("hi", language="en")) == "hi"
+        assert convert_oxigraph_value(Literal("hi", datatype=xsd + "string")) == "hi"
+        assert convert_oxigraph_value(Literal("42", datatype=xsd + "integer")) == 42
+        assert convert_oxigraph_value(Literal("1999-01-02", datatype=xsd + "date")) == date(1999, 1, 2)
+
+    def test_store_built_once(self, tmp_path):
+        pytest.importorskip("pyoxigraph")
+
+        data = tmp_path / "graph.ttl"
+        data.write_text(self.TURTLE)
+        store = tmp_path / "graph.oxigraph"
+
+        connector = OxigraphConnector(data_path=str(data), store_path=str(store), max_rows=3)
+        connector.connect()
+        assert connector.load_source == "source"
+        result = connector.execute(self.QUERY)
+        assert len(result.rows) == 3 and result.truncated is True
+        assert connector.execute('ASK { ?s ?p "v1" }').rows == [{"result": True}]
+        connector.close()
+
+        again = OxigraphConnector(data_path=str(data), store_path=str(store))
+        again.connect()
+        assert again.load_source == "store"
+        assert sorted(row["o"] for row in again.execute(self.QUERY).rows) == [f"v{i}" for i in range(5)]
+        again.close()
+
+
+class _SparqlHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    graph = None
+    connections = 0
+    forms = []
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers["Content-Length"])).decode("utf-8"))
+        self.forms.append(form)
+        try:
+            result = self.graph.query(form["query"][0])
+        except Exception as e:
+            return self._send(400, "text/plain", str(e).encode("utf-8"))
+
+        if result.type == "SELECT" and self.headers["Accept"].startswith("text/tab-separated-values"):
+            lines = ["\t".join(f"?{var}" for var in result.vars)]
+            for row in result:
+                terms = [row[var].n3().replace("\t", "\\t") if row[var] is not None else "" for var in result.vars]
+                lines.append("\t".join(terms))
+            return self._send(200, "text/tab-separated-values; charset=utf-8", ("\n".join(lines) + "\n").encode("utf-8"))
+        self._send(200, "application/sparql-results+json", result.serialize(format="json"))
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestSparqlHttpConnector:
+
+    TURTLE = TestRowLimits.TURTLE + """
+<http://ex.org/s0> <http://ex.org/n> 42 .
+<http://ex.org/s1> <http://ex.org/n> "tab\\there"@en ."""
+    QUERY = TestRDFSnapshot.QUERY
+
+    @pytest.fixture
+    def endpoint(self):
+        from rdflib import Graph
+
+        handler = type("Handler", (_SparqlHandler,), {
+            "graph": Graph().parse(data=self.TURTLE, format="turtle"), "connections": 0, "forms": [],
+        })
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_port}/sparql", handler
+        server.shutdown()
+        server.server_close()
+
+    def test_selected_by_engine(self):
+        service = GraphService(Mock(get=Mock(return_value=None)))
+        connector = service._create_connector("sparql", {"engine": "http", "endpoint": "http://localhost:7878/query"})
+        assert isinstance(connector, SparqlHttpConnector)
+
+    @pytest.mark.parametrize("result_format", ["json", "tsv"])
+    def test_select_and_ask(self, endpoint, result_format):
+        url, handler = endpoint
+        connector = SparqlHttpConnector(endpoint=url, result_format=result_format)
+        connector.connect()
+
+        assert sorted(row["o"] for row in connector.execute(self.QUERY).rows) == [f"v{i}" for i in range(5)]
+        rows = connector.execute("SELECT ?s ?n WHERE { ?s <http://ex.org/n> ?n } ORDER BY ?s").rows
+        assert rows == [{"s": "http://ex.org/s0", "n": 42}, {"s": "http://ex.org/s1", "n": "tab\there"}]
+        assert connector.execute('ASK { ?s ?p "v1" }').rows == [{"result": True}]
+        assert connector.execute('SELECT ?o WHERE { ?s <http://ex.org/p> "none" }').rows == []
+
+        assert handler.connections == 1
+        assert connector.connections_opened == 1
+        connector.close()
+
+    @pytest.mark.parametrize("result_format", ["json", "tsv"])
+    def test_max_rows_truncates_stream(self, endpoint, result_format):
+        url, _ = endpoint
+        connector = SparqlHttpConnector(endpoint=url, result_format=result_format, max_rows=2)
+        result = connector.execute(self.QUERY)
+        assert len(result.rows) == 2 and result.truncated is True
+        assert len(connector.execute(self.QUERY).rows) == 2
+
+    def test_head_after_results_keeps_unbound_columns(self, endpoint):
+        url, _ = endpoint
+        connector = SparqlHttpConnector(endpoint=url)
+        result = connector.execute("SELECT ?o ?missing WHERE { ?s <http://ex.org/p> ?o }")
+        assert result.columns == ["o", "missing"]
+        assert result.values[1] == [None] * 5
+
+    def test_server_side_timeout_param(self, endpoint):
+        url, handler = endpoint
+        SparqlHttpConnector(endpoint=url, timeout_param="timeout", timeout_unit="ms").execute(self.QUERY, timeout=2)
+        SparqlHttpConnector(endpoint=url).execute(self.QUERY)
+        assert handler.forms[0]["timeout"] == ["2000"]
+        assert "timeout" not in handler.forms[1]
+
+    def test_error_status_raises(self, endpoint):
+        url, _ = endpoint
+        connector = SparqlHttpConnector(endpoint=url)
+        with pytest.raises(RuntimeError, match="400"):
+            connector.execute("SELECT WHERE {")
+        assert len(connector.execute(self.QUERY).rows) == 5
+
+    def test_stale_connection_retried(self, endpoint):
+        url, handler = endpoint
+        connector = SparqlHttpConnector(endpoint=url)
+        connector.execute(self.QUERY)
+        connector._connections[0].sock.close()
+        connector._connections[0].sock = Mock(sendall=Mock(side_effect=BrokenPipeError), settimeout=Mock())
+        assert len(connector.execute(self.QUERY).rows) == 5
+        assert connector.connections_opened == 2
+
+    def test_tsv_terms(self):
+        xsd = "http://www.w3.org/2001/XMLSchema#"
+        assert convert_sparql_tsv_value("<http://ex.org/a>") == "http://ex.org/a"
+        assert convert_sparql_tsv_value('"a\\"b"@en') == 'a"b'
+        assert convert_sparql_tsv_value(f'"1999-01-02"^^<{xsd}date>') == date(1999, 1, 2)
+        assert convert_sparql_tsv_value("3") == 3
+        assert convert_sparql_tsv_value("true") is True
+        assert convert_sparql_tsv_value("") is None
+
+
+class TestExecutionBatch:
+
+    def _result(self, query):
+        return Result(
+            question_id="q001", method="llm", lang="cypher", model="gpt-4o",
+            gen=GenerationResult(query=query) if query else None,
+        )
+
+    def test_execute_many(self):
+        connector = Mock()
+        connector.supports_batch = True
+        connector.execute_many.return_value = [
+            QueryResult(columns=["n"], rows=[{"n": "A"}]),
+            Exception("syntax error"),
+        ]
+        execution = Execution(connector)
+
+        outputs = execution.execute_many([self._result("Q1"), self._result(None), self._result("Q2")])
+        connector.execute_many.assert_called_once_with(["Q1", "Q2"])
+        assert outputs[0].result == ["A"]
+        assert outputs[1].error == "no query to execute"
+        assert outputs[2].success is False
+        assert outputs[2].error == "syntax error"
+
+    def test_execute_many_deadline_per_query(self):
+        from nl2graph.base.timeout import remaining
+
+        seen = []
+        connector = Mock()
+        connector.supports_batch = True
+        connector.execute_many.side_effect = lambda queries: seen.append(remaining()) or [
+            QueryResult(columns=["n"], rows=[{"n": "A"}]) for _ in queries
+        ]
+        execution = Execution(connector)
+
+        with patch("nl2graph.execution.execution.get_timeout", return_value=5):
+            execution.execute_many([self._result("Q1"), self._result("Q2")])
+        assert 9 < seen[0] <= 10
+
+    def test_execute_many_falls_back(self):
+        connector = Mock()
+        connector.supports_batch = False
+        connector.execute.return_value = QueryResult(columns=["n"], rows=[{"n": "A"}])
+        execution = Execution(connector)
+
+        outputs = execution.execute_many([self._result("Q1"), self._result("Q2")])
+        assert connector.execute.call_count == 2
+        assert [o.result for o in outputs] == [["A"], ["A"]]
+
+
+class TestExecutionAsync:
+
+    def _result(self, query="MATCH (n) RETURN n"):
+        return Result(
+            question_id="q001", method="llm", lang="cypher", model="gpt-4o",
+            gen=GenerationResult(query=query),
+        )
+
+    def test_execute_async(self):
+        connector = Mock()
+        connector.execute_async = AsyncMock(return_value=QueryResult(columns=["n"], rows=[{"n": "A"}]))
+        execution = Execution(connector)
+
+        output = asyncio.run(execution.execute_async(self._result()))
+        assert output.success is True
+        assert output.result == ["A"]
+
+    def test_execute_async_timeout_cancels_query(self):
+        cancelled = asyncio.Event()
+
+        async def slow(query, timeout=None):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        connector = Mock()
+        connector.execute_async = slow
+        execution = Execution(connector)
+
+        with patch("nl2graph.execution.execution.get_timeout", return_value=0.05):
+            output = asyncio.run(execution.execute_async(self._result()))
+        assert output.success is False
+        assert "timeout" in output.error
+        assert cancelled.is_set()
+
+    def test_execute_async_passes_timeout_to_server(self):
+        from gremlin_python.driver.resultset import ResultSet
+
+        result_set = ResultSet(queue.Queue(), "r1")
+        result_set.done = Future()
+        result_set.done.set_result(None)
+        submitted = Future()
+        submitted.set_result(result_set)
+        connector = GremlinConnector()
+        connector._client = Mock()
+        connector._client.submit_async.return_value = submitted
+        execution = Execution(connector)
+
+        with patch("nl2graph.execution.execution.get_timeout", return_value=180):
+            output = asyncio.run(execution.execute_async(self._result("g.V()")))
+        assert output.success is True
+        options = connector._client.submit_async.call_args.kwargs["request_options"]
+        assert options == {"evaluationTimeout": 180000}
+
+    def test_default_execute_async_uses_thread(self):
+        connector = Neo4jConnector()
+        connector.execute = Mock(return_value=QueryResult(columns=["n"], rows=[{"n": "A"}]))
+        from nl2graph.execution.connectors.base import BaseConnector
+
+        result = asyncio.run(BaseConnector.execute_async(connector, "MATCH (n) RETURN n"))
+        assert result.rows == [{"n": "A"}]
+        connector.execute.assert_called_once_with("MATCH (n) RETURN n", None)
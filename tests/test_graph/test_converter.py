@@ -0,0 +1,185 @@
+import os
+import timeit
+from datetime import date, datetime, time
+
+import pytest
+
+from rdflib import BNode, Literal, URIRef, XSD
+
+from nl2graph.execution.result.converter import (
+    ValueConverter, neo4j_converter, rdf_converter, convert_neo4j_value, convert_rdf_value,
+)
+
+
+class Date:
+
+    def __init__(self, year, month, day):
+        self.year, self.month, self.day = year, month, day
+
+
+class Node(dict):
+
+    def __init__(self, element_id, labels, **properties):
+        super().__init__(properties)
+        self.element_id = element_id
+        self.labels = labels
+
+
+class TestValueConverter:
+
+    def test_neo4j_types_by_name(self):
+        assert convert_neo4j_value(Date(1999, 1, 2)) == date(1999, 1, 2)
+        assert convert_neo4j_value(Node("4:1", {"Movie"}, title="Heat")) == {
+            "id": "4:1", "labels": ["Movie"], "properties": {"title": "Heat"},
+        }
+        assert convert_neo4j_value([{"d": Date(2000, 5, 6)}, "x", None]) == [{"d": date(2000, 5, 6)}, "x", None]
+
+    def test_rdf_terms(self):
+        assert convert_rdf_value(URIRef("http://ex.org/a")) == "http://ex.org/a"
+        assert convert_rdf_value(BNode("b0")) == "_:b0"
+        assert convert_rdf_value(Literal("5", datatype=XSD.integer)) == 5
+        assert convert_rdf_value(Literal("x", datatype=URIRef("http://ex.org/dt"))) == "x"
+        assert convert_rdf_value(Literal("hi", lang="en")) == "hi"
+
+    def test_handler_resolved_once_per_type(self):
+        converter = ValueConverter({"Date": lambda value: "date"})
+        assert converter.convert(Date(1, 1, 1)) == "date"
+        converter._by_name.clear()
+        assert converter.convert(Date(2, 2, 2)) == "date"
+        assert converter.convert(object) is object
+
+    def test_scalar_column_passes_through(self):
+        column = ["a", 1, 2.5, True, None] * 10
+        assert neo4j_converter.column(column) is column
+
+    def test_late_non_scalar_still_converted(self):
+        column = ["a"] * 100 + [Date(1999, 1, 2)]
+        converted = neo4j_converter.column(column)
+        assert converted[-1] == date(1999, 1, 2)
+        assert converted[:100] == ["a"] * 100
+
+    def test_driver_column_converted(self):
+        column = [URIRef("http://ex.org/a"), Literal(3), None]
+        assert rdf_converter.column(column) == ["http://ex.org/a", 3, None]
+
+
+# the if/elif converters the dispatch tables replaced, verbatim, as the
+# reference for equivalence and the benchmark
+def baseline_neo4j(value):
+    if value is None:
+        return None
+
+    type_name = type(value).__name__
+
+    if type_name == "Date":
+        return date(value.year, value.month, value.day)
+    elif type_name == "DateTime":
+        return datetime(
+            value.year, value.month, value.day,
+            value.hour, value.minute, value.second, value.nanosecond // 1000
+        )
+    elif type_name == "Time":
+        return time(value.hour, value.minute, value.second, value.nanosecond // 1000)
+    elif type_name == "Duration":
+        return {
+            "months": value.months,
+            "days": value.days,
+            "seconds": value.seconds,
+            "nanoseconds": value.nanoseconds,
+        }
+    elif type_name == "Node":
+        return {
+            "id": value.element_id,
+            "labels": list(value.labels),
+            "properties": dict(value),
+        }
+    elif type_name == "Relationship":
+        return {
+            "id": value.element_id,
+            "type": value.type,
+            "start": value.start_node.element_id,
+            "end": value.end_node.element_id,
+            "properties": dict(value),
+        }
+    elif type_name == "Path":
+        return {
+            "nodes": [baseline_neo4j(n) for n in value.nodes],
+            "relationships": [baseline_neo4j(r) for r in value.relationships],
+        }
+    elif isinstance(value, list):
+        return [baseline_neo4j(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: baseline_neo4j(v) for k, v in value.items()}
+
+    return value
+
+
+def baseline_rdf(value):
+    if value is None:
+        return None
+
+    type_name = type(value).__name__
+
+    if type_name == "URIRef":
+        return str(value)
+    elif type_name == "Literal":
+        py_value = value.toPython()
+        if isinstance(py_value, type(value)):
+            return str(value)
+        return py_value
+    elif type_name == "BNode":
+        return f"_:{value}"
+    elif isinstance(value, list):
+        return [baseline_rdf(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: baseline_rdf(v) for k, v in value.items()}
+
+    return value
+
+
+def neo4j_column(name, size):
+    if name == "strings":
+        return [f"name{i}" for i in range(size)]
+    return [{"d": Date(2000, 1, 1 + i % 28), "n": [Node(f"4:{i}", {"Movie"}, title="Heat"), i]} for i in range(size)]
+
+
+def rdf_column(size):
+    return [
+        term for i in range(size // 4)
+        for term in (URIRef(f"http://ex.org/{i}"), Literal(i), Literal(f"v{i}", lang="en"), BNode(f"b{i}"))
+    ]
+
+
+NEO4J_COLUMNS = ("nested", "strings")
+
+
+class TestMatchesBaseline:
+
+    @pytest.mark.parametrize("name", NEO4J_COLUMNS)
+    def test_neo4j(self, name):
+        column = neo4j_column(name, 1000)
+        assert neo4j_converter.column(column) == [baseline_neo4j(v) for v in column]
+
+    def test_rdf(self):
+        column = rdf_column(1000)
+        assert rdf_converter.column(column) == [baseline_rdf(v) for v in column]
+
+
+@pytest.mark.skipif(not os.environ.get("NL2GRAPH_BENCHMARK"), reason="set NL2GRAPH_BENCHMARK=1 to run benchmarks")
+class TestConverterBenchmark:
+
+    def _best(self, func):
+        return min(timeit.repeat(func, number=1, repeat=5))
+
+    def test_neo4j_scalar_column(self):
+        # the fast path hands a column of plain values back untouched
+        column = neo4j_column("strings", 100_000)
+        before = self._best(lambda: [baseline_neo4j(v) for v in column])
+        after = self._best(lambda: neo4j_converter.column(column))
+        assert after * 2 < before, f"neo4j strings: {before * 1000:.1f} ms before, {after * 1000:.1f} ms now"
+
+    def test_rdf_column(self):
+        column = rdf_column(80_000)
+        before = self._best(lambda: [baseline_rdf(v) for v in column])
+        after = self._best(lambda: rdf_converter.column(column))
+        assert after < before, f"rdf terms: {before * 1000:.1f} ms before, {after * 1000:.1f} ms now"
@@ -0,0 +1,76 @@
+from nl2graph.execution.normalize import canonical_query, canonicalize, query_hash
+
+
+class TestCanonicalizeCypher:
+
+    def test_formatting_case_and_variable_names(self):
+        first = "MATCH (m:Movie {title: 'Heat'})<-[:ACTED_IN]-(p) WHERE p.born > 1960 RETURN p.name"
+        second = 'match (x:Movie {title: "Heat"})\n  <-[:ACTED_IN]-(actor)\nwhere actor.born > 1960\nreturn actor.name;'
+        assert canonicalize(first, "cypher") == canonicalize(second, "cypher")
+
+    def test_labels_properties_and_literals_kept(self):
+        base = canonicalize("MATCH (m:Movie) WHERE m.title = 'Heat' RETURN m", "cypher")
+        for other in (
+            "MATCH (m:Person) WHERE m.title = 'Heat' RETURN m",
+            "MATCH (m:Movie) WHERE m.name = 'Heat' RETURN m",
+            "MATCH (m:Movie) WHERE m.title = 'heat' RETURN m",
+            "MATCH (m:Movie) WHERE m:Person RETURN m",
+            "MATCH (m:Movie {title: 'Heat'}) RETURN m",
+        ):
+            assert canonicalize(other, "cypher") != base
+
+    def test_label_expressions_and_map_keys(self):
+        assert canonicalize("MATCH (m:A|B {k: 1}) RETURN m", "cypher") == "MATCH ( v0 : A | B { k : 1 } ) RETURN v0"
+
+    def test_procedures_and_functions(self):
+        text = canonicalize("CALL db.labels() YIELD label AS l RETURN toLower(l)", "cypher")
+        assert text == "CALL db . labels ( ) YIELD label AS v0 RETURN tolower ( v0 )"
+
+    def test_return_items_sorted(self):
+        first = canonical_query("MATCH (m)<--(p) RETURN p.name, m.title ORDER BY p.name", "cypher")
+        second = canonical_query("MATCH (m)<--(p) RETURN m.title, p.name ORDER BY p.name", "cypher")
+        assert first.text == second.text
+        assert first.order == (1, 0) and second.order == ()
+
+    def test_return_items_kept_with_union(self):
+        query = "MATCH (a) RETURN a.y, a.x UNION MATCH (b) RETURN b.y, b.x"
+        assert canonical_query(query, "cypher").order == ()
+
+    def test_unterminated_string_falls_back(self):
+        assert canonicalize("MATCH (n {name: 'oops})\n RETURN n", "cypher") == "MATCH (n {name: 'oops}) RETURN n"
+
+
+class TestCanonicalizeSparql:
+
+    def test_prefixes_variables_and_keywords(self):
+        first = "PREFIX ex: <http://ex.org/> SELECT ?x WHERE { ?x ex:name 'Tom'@EN } LIMIT 5"
+        second = 'select $who where {\n  $who <http://ex.org/name> "Tom"@en # comment\n} limit 5'
+        assert canonicalize(first, "sparql") == canonicalize(second, "sparql")
+        assert canonicalize(first, "sparql") == 'SELECT ?v0 WHERE { ?v0 <http://ex.org/name> "Tom"@en } LIMIT 5'
+
+    def test_rdf_type_shorthand_kept(self):
+        assert canonicalize("SELECT ?x WHERE { ?x a ?t }", "sparql") != canonicalize("SELECT ?x WHERE { ?x A ?t }", "sparql")
+
+    def test_comparison_not_mistaken_for_iri(self):
+        assert canonicalize("SELECT ?n WHERE { ?s ?p ?n FILTER(?n < 5 && ?n > 3) }", "sparql") == \
+            "SELECT ?v0 WHERE { ?v1 ?v2 ?v0 FILTER ( ?v0 < 5 && ?v0 > 3 ) }"
+
+
+class TestCanonicalizeGremlin:
+
+    def test_quotes_whitespace_and_step_labels(self):
+        first = "g.V().has('person', 'name', 'Tom').as('a').out('knows').as('b').select('a', 'b')"
+        second = 'g.V().has("person","name","Tom").as("x").out("knows").as("y").select("x","y")'
+        assert canonicalize(first, "gremlin") == canonicalize(second, "gremlin")
+
+    def test_property_keys_kept(self):
+        first = canonicalize("g.V().as('a').values('name')", "gremlin")
+        second = canonicalize("g.V().as('a').values('age')", "gremlin")
+        assert first != second
+
+
+class TestQueryHash:
+
+    def test_lang_aware(self):
+        assert query_hash("MATCH (a) RETURN a", "cypher") == query_hash("match (b)\nreturn b", "cypher")
+        assert query_hash("MATCH (a) RETURN a") != query_hash("match (b) return b")
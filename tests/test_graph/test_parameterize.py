@@ -0,0 +1,90 @@
+from rdflib import Literal, URIRef
+
+from nl2graph.execution.parameterize import parameterize_sparql, parameterize_cypher, parameterize_gremlin
+
+
+class TestParameterizeSparql:
+
+    def test_lifts_iris_and_literals(self):
+        template, bindings = parameterize_sparql(
+            'SELECT ?x WHERE { ?x <http://ex.org/name> "Tom \\"H\\"" . ?x <http://ex.org/t> "hi"@en }'
+        )
+        assert "<http" not in template and '"' not in template
+        assert set(bindings.values()) == {
+            URIRef("http://ex.org/name"), Literal('Tom "H"'),
+            URIRef("http://ex.org/t"), Literal("hi", lang="en"),
+        }
+
+    def test_same_shape_same_template(self):
+        first, a = parameterize_sparql('SELECT ?x WHERE { ?x <http://ex.org/p> "Tom Hanks" }')
+        second, b = parameterize_sparql('SELECT ?x WHERE { ?x <http://ex.org/p> "Meg Ryan" }')
+        assert first == second
+        assert a != b
+
+    def test_repeated_value_shares_variable(self):
+        _, bindings = parameterize_sparql('SELECT ?x WHERE { ?x <http://ex.org/p> "a" . ?y <http://ex.org/p> "a" }')
+        assert len(bindings) == 2
+
+    def test_prologue_and_typed_literals_kept(self):
+        query = 'PREFIX e: <http://ex.org/> SELECT ?x WHERE { ?x e:age "5"^^<http://www.w3.org/2001/XMLSchema#integer> }'
+        assert parameterize_sparql(query) == (query, {})
+
+    def test_unsafe_forms_unchanged(self):
+        for query in (
+            'SELECT ?x WHERE { ?x <http://ex.org/p> ?y } VALUES ?y { "a" }',
+            'CONSTRUCT { ?x <http://ex.org/p> "a" } WHERE { ?x ?p ?o }',
+            'SELECT ?x WHERE { { SELECT ?x WHERE { ?x <http://ex.org/p> "a" } } }',
+        ):
+            assert parameterize_sparql(query) == (query, {})
+
+    def test_comparison_not_mistaken_for_iri(self):
+        query = 'SELECT ?x WHERE { ?x ?p ?n FILTER(?n < 5 && ?n > 3) }'
+        assert parameterize_sparql(query) == (query, {})
+
+
+class TestParameterizeCypher:
+
+    def test_lifts_strings_and_numbers(self):
+        template, params = parameterize_cypher(
+            "MATCH (m:Movie {title: 'Tom\\'s'})<-[:ACTED_IN]-(p) WHERE p.born > 1960 AND p.score < 1.5 RETURN p.name LIMIT 10"
+        )
+        assert template == (
+            "MATCH (m:Movie {title: $__p0})<-[:ACTED_IN]-(p) "
+            "WHERE p.born > $__p1 AND p.score < $__p2 RETURN p.name LIMIT $__p3"
+        )
+        assert params == {"__p0": "Tom's", "__p1": 1960, "__p2": 1.5, "__p3": 10}
+
+    def test_same_shape_same_template(self):
+        first, _ = parameterize_cypher("MATCH (m {title: 'Heat'}) RETURN m")
+        second, _ = parameterize_cypher('MATCH (m {title: "Up"}) RETURN m')
+        assert first == second
+
+    def test_path_lengths_kept(self):
+        template, params = parameterize_cypher("MATCH (a {name: 'x'})-[:R*1..3]->(b)-[*2]-(c) RETURN c")
+        assert "*1..3" in template and "*2" in template
+        assert params == {"__p0": "x"}
+
+    def test_return_items_kept(self):
+        template, params = parameterize_cypher("MATCH (m) WHERE m.year = 1999 RETURN m.year > 2000, 'x' ORDER BY m.year")
+        assert template == "MATCH (m) WHERE m.year = $__p0 RETURN m.year > 2000, 'x' ORDER BY m.year"
+
+    def test_unterminated_string_unchanged(self):
+        query = "MATCH (n {name: 'oops}) RETURN n"
+        assert parameterize_cypher(query) == (query, {})
+
+
+class TestParameterizeGremlin:
+
+    def test_lifts_strings_and_ints(self):
+        template, bindings = parameterize_gremlin("g.V().has('person', 'name', \"Tom Hanks\").out('acted').limit(5)")
+        assert template == "g.V().has(__p0, __p1, __p2).out(__p3).limit(__p4)"
+        assert bindings == {"__p0": "person", "__p1": "name", "__p2": "Tom Hanks", "__p3": "acted", "__p4": 5}
+
+    def test_typed_numbers_and_gstrings_kept(self):
+        template, bindings = parameterize_gremlin('g.V().has(\'n\', 10L).values("x$y")')
+        assert template == 'g.V().has(__p0, 10L).values("x$y")'
+        assert bindings == {"__p0": "n"}
+
+    def test_triple_quoted_unchanged(self):
+        query = "g.V().has(\'\'\'a\'\'\')"
+        assert parameterize_gremlin(query) == (query, {})
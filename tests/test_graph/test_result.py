@@ -64,6 +64,22 @@ class TestQueryResult:
         )
         assert result.raw == raw_data
 
+    def test_columnar(self):
+        result = QueryResult(columns=["name", "age"], values=[["Alice", "Bob"], [30, 25]])
+        assert result.row_count == 2
+        assert result.rows == [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
+        assert result.to_values() == [["Alice", 30], ["Bob", 25]]
+
+    def test_rows_without_columns(self):
+        result = QueryResult(rows=[{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+        assert result.columns == ["a", "b"]
+        assert result.values == [[1, 3], [2, 4]]
+
+    def test_rows_with_different_keys(self):
+        result = QueryResult(rows=[{"a": 1}, {"b": 2}, {"a": 3, "b": 4}, {"b": 5, "a": 6}, {}])
+        assert result.columns == ["value"]
+        assert result.values == [[1, 2, [3, 4], [5, 6], []]]
+
 
 class TestQueryLanguage:
 
@@ -1,5 +1,8 @@
 import pytest
 from pathlib import Path
+from unittest.mock import Mock, patch
+
+from openai import InternalServerError
 
 from nl2graph.base.llm.entity import ClientConfig, LLMMessage, LLMUsage, LLMResponse
 from nl2graph.base.llm.clients.openai import OpenAIClient
@@ -74,6 +77,66 @@ class TestLLMResponse:
         assert response.duration == 0.5
 
 
+class TestClientRetries:
+
+    @pytest.fixture
+    def client(self):
+        config = ClientConfig(provider="openai", model="gpt-4o", api_key="sk-xxx", timeout=180)
+        client = OpenAIClient(config)
+        client.client = Mock()
+        client.adapter = Mock()
+        client.adapter.extract_chat_message.return_value = LLMMessage.assistant("hello")
+        client.adapter.extract_usage.return_value = LLMUsage()
+        return client
+
+    def _error(self):
+        return InternalServerError("bad gateway", response=Mock(status_code=502), body=None)
+
+    def test_sdk_retries_replaced(self):
+        # a retry inside the SDK would get a fresh timeout past the generation deadline
+        config = ClientConfig(provider="openai", model="gpt-4o", api_key="sk-xxx", timeout=180)
+        assert OpenAIClient(config).client.max_retries == 0
+        config = ClientConfig(provider="deepseek", model="deepseek-chat", api_key="sk-xxx",
+                              endpoint="https://api.deepseek.com", timeout=180)
+        assert DeepSeekClient(config).client.max_retries == 0
+        assert DeepSeekClient(config).retry_on == OpenAIClient.retry_on
+
+    def test_retries_transient_error(self, client):
+        client.client.responses.create.side_effect = [self._error(), Mock()]
+        with patch("time.sleep"):
+            client.chat([LLMMessage.user("hi")])
+        assert client.client.responses.create.call_count == 2
+
+    def test_retries_within_deadline(self, client):
+        from nl2graph.base.timeout import deadline
+
+        client.client.responses.create.side_effect = [self._error(), Mock()]
+        with patch("time.sleep"), deadline(60):
+            client.chat([LLMMessage.user("hi")])
+        timeouts = [call.kwargs["timeout"] for call in client.client.responses.create.call_args_list]
+        assert all(timeout <= 60 for timeout in timeouts)
+
+    def test_no_retry_past_deadline(self, client):
+        from nl2graph.base.timeout import deadline
+
+        client.client.responses.create.side_effect = self._error()
+        with deadline(0.5), pytest.raises(InternalServerError):
+            client.chat([LLMMessage.user("hi")])
+        assert client.client.responses.create.call_count == 1
+
+    def test_gives_up_after_max_retries(self, client):
+        client.client.responses.create.side_effect = self._error()
+        with patch("time.sleep"), pytest.raises(InternalServerError):
+            client.chat([LLMMessage.user("hi")])
+        assert client.client.responses.create.call_count == 3
+
+    def test_no_retry_on_client_error(self, client):
+        client.client.responses.create.side_effect = ValueError("bad request")
+        with pytest.raises(ValueError):
+            client.chat([LLMMessage.user("hi")])
+        assert client.client.responses.create.call_count == 1
+
+
 @pytest.fixture
 def config_service():
     config_file = Path(__file__).parent.parent.parent / "configs" / "configs.yaml"
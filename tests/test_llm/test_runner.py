@@ -6,6 +6,7 @@ from unittest.mock import Mock
 from nl2graph.pipeline import GeneratePipeline, ExecutePipeline, EvaluatePipeline
 from nl2graph.generation.llm.generation import Generation
 from nl2graph.execution import Execution
+from nl2graph.execution.result.entity import QueryResult
 from nl2graph.base.llm.service import LLMService
 from nl2graph.base.templates.service import TemplateService
 from nl2graph.base.configs import ConfigService
@@ -216,10 +217,11 @@ class TestExecution:
 
     @pytest.fixture
     def mock_connector(self):
-        connector = Mock()
-        result = Mock()
-        result.rows = [{"name": "Alice"}, {"name": "Bob"}]
-        connector.execute.return_value = result
+        connector = Mock(fingerprint_settings=())
+        connector.execute.return_value = QueryResult(
+            columns=["name"],
+            rows=[{"name": "Alice"}, {"name": "Bob"}],
+        )
         return connector
 
     def test_execute_success(self, mock_connector):
@@ -273,20 +275,81 @@ class TestExecution:
     def test_extract_answer_single_column(self, mock_connector):
         execution = Execution(mock_connector)
         rows = [{"name": "Alice"}, {"name": "Bob"}]
-        result = execution._extract_answer(rows)
+        result = execution._extract_answer(QueryResult(columns=["name"], rows=rows))
         assert result == ["Alice", "Bob"]
 
     def test_extract_answer_multiple_columns(self, mock_connector):
         execution = Execution(mock_connector)
         rows = [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
-        result = execution._extract_answer(rows)
+        result = execution._extract_answer(QueryResult(columns=["name", "age"], rows=rows))
         assert result == [["Alice", 30], ["Bob", 25]]
 
     def test_extract_answer_empty(self, mock_connector):
         execution = Execution(mock_connector)
-        result = execution._extract_answer([])
+        result = execution._extract_answer(QueryResult())
         assert result == []
 
+    def _result(self, model, query):
+        return Result(
+            question_id="q001",
+            method="llm",
+            lang="cypher",
+            model=model,
+            gen=GenerationResult(query=query),
+        )
+
+    def test_execute_dedup(self, mock_connector, tmp_path):
+        with ResultRepository(str(tmp_path / "dst.db")) as dst:
+            execution = Execution(mock_connector, store=dst, dataset="test")
+
+            first = execution.execute(self._result("gpt-4o", "MATCH (n)\n  RETURN n.name"))
+            second = execution.execute(self._result("deepseek-chat", "MATCH (n) RETURN n.name;"))
+
+        assert mock_connector.execute.call_count == 1
+        assert first.cached is False
+        assert second.cached is True
+        assert second.result == ["Alice", "Bob"]
+
+    def test_execute_dedup_per_connector(self, mock_connector, tmp_path):
+        from nl2graph.execution.connectors.neo4j import Neo4jConnector
+        from nl2graph.execution.connectors.kuzu import KuzuConnector
+
+        neo4j, kuzu = Neo4jConnector(), KuzuConnector()
+        neo4j.execute = Mock(return_value=QueryResult(columns=["id"], rows=[{"id": "4:abc:0"}]))
+        kuzu.execute = Mock(return_value=QueryResult(columns=["id"], rows=[{"id": "0:0"}]))
+        with ResultRepository(str(tmp_path / "dst.db")) as dst:
+            first = Execution(neo4j, store=dst, dataset="test")
+            first.execute(self._result("gpt-4o", "MATCH (n) RETURN id(n)"))
+            first.flush()
+            second = Execution(kuzu, store=dst, dataset="test")
+            output = second.execute(self._result("gpt-4o", "MATCH (n) RETURN id(n)"))
+
+        assert kuzu.execute.call_count == 1
+        assert output.cached is False
+        assert output.result == ["0:0"]
+
+    def test_execute_dedup_skips_errors(self, mock_connector, tmp_path):
+        mock_connector.execute.side_effect = Exception("Connection failed")
+        with ResultRepository(str(tmp_path / "dst.db")) as dst:
+            execution = Execution(mock_connector, store=dst, dataset="test")
+            execution.execute(self._result("gpt-4o", "MATCH (n) RETURN n"))
+            execution.execute(self._result("deepseek-chat", "MATCH (n) RETURN n"))
+
+        assert mock_connector.execute.call_count == 2
+
+    def test_execute_dedup_writes_batched(self, mock_connector, tmp_path):
+        with ResultRepository(str(tmp_path / "dst.db")) as dst:
+            execution = Execution(mock_connector, store=dst, dataset="test", batch_size=2)
+            execution.execute(self._result("gpt-4o", "MATCH (n) RETURN n.name"))
+            with dst.pool.checkout() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM queries").fetchone()[0] == 0
+            assert execution.execute(self._result("deepseek-chat", "MATCH (n) RETURN n.name")).cached is True
+
+            execution.execute(self._result("gpt-4o", "MATCH (m) RETURN m.age"))
+            with dst.pool.checkout() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM queries").fetchone()[0] == 2
+            assert execution.flush() == 0
+
 
 class TestPipelineUnit:
 
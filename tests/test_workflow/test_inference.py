@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import tempfile
 from pathlib import Path
@@ -180,6 +181,129 @@ class TestExecutePipeline:
 
         mock_execution.execute.assert_not_called()
 
+    def test_run_skips_existing(self, mock_execution, dst):
+        for qid in ("q001", "q002"):
+            dst.save_generation(
+                qid, "seq2seq", "cypher", "bart-base",
+                GenerationResult(query="MATCH (n) RETURN n")
+            )
+        dst.save_execution(
+            "q001", "seq2seq", "cypher", "bart-base",
+            ExecutionResult(result=["existing"], success=True)
+        )
+
+        pipeline = ExecutePipeline(
+            execution=mock_execution,
+            dst=dst,
+            method="seq2seq",
+            lang="cypher",
+            model="bart-base",
+            if_exists="skip",
+        )
+
+        records = [
+            Record(id="q001", question="Q1", answer=["A1"]),
+            Record(id="q002", question="Q2", answer=["A2"]),
+        ]
+        pipeline.run(records)
+
+        mock_execution.execute.assert_called_once()
+        assert dst.get("q001", "seq2seq", "cypher", "bart-base").exec.result == ["existing"]
+        assert dst.get("q002", "seq2seq", "cypher", "bart-base").exec.result == ["result"]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_run_in_chunks(self, mock_execution, dst, workers):
+        mock_execution.execute_many.side_effect = lambda results: [
+            ExecutionResult(result=[r.question_id], success=True) for r in results
+        ]
+        for i in range(5):
+            dst.save_generation(
+                f"q{i:03d}", "seq2seq", "cypher", "bart-base",
+                GenerationResult(query="MATCH (n) RETURN n")
+            )
+
+        pipeline = ExecutePipeline(
+            execution=mock_execution,
+            dst=dst,
+            method="seq2seq",
+            lang="cypher",
+            model="bart-base",
+            workers=workers,
+            chunk_size=2,
+        )
+
+        records = [Record(id=f"q{i:03d}", question="Q", answer=["A"]) for i in range(5)]
+        pipeline.run(records)
+
+        assert mock_execution.execute_many.call_count == 2
+        mock_execution.execute.assert_called_once()
+        assert dst.get("q003", "seq2seq", "cypher", "bart-base").exec.result == ["q003"]
+        assert dst.get("q004", "seq2seq", "cypher", "bart-base").exec.result == ["result"]
+
+    def test_run_async(self, mock_execution, dst):
+        in_flight = 0
+        peak = 0
+
+        async def execute_async(result):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ExecutionResult(result=[result.question_id], success=True)
+
+        mock_execution.execute_async.side_effect = execute_async
+        for i in range(10):
+            dst.save_generation(
+                f"q{i:03d}", "seq2seq", "cypher", "bart-base",
+                GenerationResult(query="MATCH (n) RETURN n")
+            )
+
+        pipeline = ExecutePipeline(
+            execution=mock_execution,
+            dst=dst,
+            method="seq2seq",
+            lang="cypher",
+            model="bart-base",
+            concurrency=3,
+        )
+
+        records = [Record(id=f"q{i:03d}", question="Q", answer=["A"]) for i in range(10)]
+        pipeline.run(records)
+
+        assert peak == 3
+        mock_execution.execute.assert_not_called()
+        mock_execution.aconnect.assert_awaited_once()
+        mock_execution.aclose.assert_awaited_once()
+        assert dst.get("q009", "seq2seq", "cypher", "bart-base").exec.result == ["q009"]
+
+    def test_run_async_raises_task_errors(self, mock_execution, dst):
+        async def execute_async(result):
+            if result.question_id == "q002":
+                raise RuntimeError("lost connection")
+            return ExecutionResult(result=[result.question_id], success=True)
+
+        mock_execution.execute_async.side_effect = execute_async
+        for i in range(5):
+            dst.save_generation(
+                f"q{i:03d}", "seq2seq", "cypher", "bart-base",
+                GenerationResult(query="MATCH (n) RETURN n")
+            )
+
+        pipeline = ExecutePipeline(
+            execution=mock_execution,
+            dst=dst,
+            method="seq2seq",
+            lang="cypher",
+            model="bart-base",
+            concurrency=2,
+        )
+
+        records = [Record(id=f"q{i:03d}", question="Q", answer=["A"]) for i in range(5)]
+        with pytest.raises(RuntimeError, match="lost connection"):
+            pipeline.run(records)
+        mock_execution.aclose.assert_awaited_once()
+
 
 class TestEvaluatePipeline:
 